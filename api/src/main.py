@@ -2,6 +2,7 @@
 
 import asyncio
 import importlib.util
+import logging
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -38,6 +39,12 @@ executor_module = _load_module_directly(
 )
 MT5Executor = executor_module.MT5Executor
 
+# The bot modules report through `logging`; echo their records to the console
+# the same way their prints used to appear
+_bot_logger = logging.getLogger("tania_signal_copier")
+_bot_logger.setLevel(logging.INFO)
+_bot_logger.addHandler(logging.StreamHandler(sys.stdout))
+
 from .config import config
 from .dependencies import clear_mt5_executor, set_mt5_executor
 from .routers import account, analysis, bot, config as config_router, health, orders, positions, prompts, symbols, telegram
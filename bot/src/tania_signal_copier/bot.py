@@ -18,18 +18,26 @@ Requirements:
 
 import asyncio
 import atexit
+import contextlib
+import logging
 import os
+import queue
 import signal
 import sys
+import time
 from pathlib import Path
 
 # Fix Windows console encoding for emoji/unicode characters
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")  # type: ignore[union-attr]
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")  # type: ignore[union-attr]
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, ClassVar
 
 # Lock file for single instance
 LOCK_FILE = Path(__file__).parent.parent.parent / ".bot.lock"
@@ -83,16 +91,15 @@ def ensure_single_instance() -> None:
         try:
             old_pid = int(LOCK_FILE.read_text().strip())
             if old_pid != current_pid and _is_process_running(old_pid):
-                print(f"Found existing bot instance (PID {old_pid}). Killing it...")
+                logger.info("Found existing bot instance (PID %s). Killing it...", old_pid)
                 if _kill_process(old_pid):
-                    print(f"Killed previous instance (PID {old_pid})")
+                    logger.info("Killed previous instance (PID %s)", old_pid)
                     # Wait for the process to fully terminate and release SQLite locks
-                    import time
                     time.sleep(3)  # Increased from 1s to allow SQLite to release session db
                 else:
-                    print(f"Warning: Could not kill previous instance (PID {old_pid})")
+                    logger.warning("Warning: Could not kill previous instance (PID %s)", old_pid)
         except (ValueError, OSError) as e:
-            print(f"Warning: Could not read lock file: {e}")
+            logger.warning("Warning: Could not read lock file: %s", e)
 
     # Write our PID to lock file
     LOCK_FILE.write_text(str(current_pid))
@@ -114,11 +121,16 @@ from telethon import TelegramClient, events
 from tania_signal_copier.config import BotConfig, config
 from tania_signal_copier.executor import MT5Executor
 from tania_signal_copier.models import (
+    BUY_ORDER_TYPES,
+    ORDER_TYPE_BY_VALUE,
+    PENDING_ORDER_TYPES,
     DualPosition,
     MessageType,
+    ModifyRequest,
     OrderType,
     PositionStatus,
     TrackedPosition,
+    TradeAction,
     TradeActionType,
     TradeRole,
     TradeSignal,
@@ -127,6 +139,11 @@ from tania_signal_copier.parser import SignalParser
 from tania_signal_copier.state import BotState
 from tania_signal_copier.strategy import TradingStrategy, get_strategy
 
+logger = logging.getLogger(__name__)
+
+# Visual separator between messages in the log output
+_SEPARATOR = "=" * 50
+
 
 class TelegramMT5Bot:
     """Main bot that connects Telegram signals to MT5.
@@ -145,6 +162,54 @@ class TelegramMT5Bot:
         strategy: The trading strategy (dual_tp or single)
     """
 
+    # Dispatch tables are built once at class level rather than per message.
+    # Legacy handlers are called as handler(self, msg_id, target_msg_id, signal).
+    _DISPATCH: ClassVar[dict[MessageType, Callable[..., Awaitable[None]]]] = {
+        MessageType.NEW_SIGNAL_COMPLETE: lambda self, m, t, s: self._handle_new_signal(
+            m, s, is_complete=True
+        ),
+        MessageType.NEW_SIGNAL_INCOMPLETE: lambda self, m, t, s: self._handle_new_signal(
+            m, s, is_complete=False
+        ),
+        MessageType.MODIFICATION: lambda self, m, t, s: self._handle_modification(t, s),
+        MessageType.RE_ENTRY: lambda self, m, t, s: self._handle_re_entry(m, t, s),
+        MessageType.PROFIT_NOTIFICATION: lambda self, m, t, s: self._handle_profit_notification(
+            t, s
+        ),
+        MessageType.CLOSE_SIGNAL: lambda self, m, t, s: self._handle_close_signal(t, s),
+        MessageType.PARTIAL_CLOSE: lambda self, m, t, s: self._handle_partial_close(t, s),
+        MessageType.COMPOUND_ACTION: lambda self, m, t, s: self._handle_compound_action(m, t, s),
+    }
+
+    # Action handlers are called as handler(self, action, msg_id, target_msg_id, signal).
+    _ACTION_DISPATCH: ClassVar[dict[str, Callable[..., Awaitable[None]]]] = {
+        "new_signal": lambda self, a, m, t, s: self._handle_new_signal_action(m, a, s),
+        "modification": lambda self, a, m, t, s: self._handle_modification_action(t, a),
+        "move_sl_to_entry": lambda self, a, m, t, s: self._handle_move_sl_to_entry_action(t),
+        "partial_close": lambda self, a, m, t, s: self._handle_partial_close_action(t, a),
+        "full_close": lambda self, a, m, t, s: self._handle_full_close_action(t),
+        "tp_hit": lambda self, a, m, t, s: self._handle_tp_hit_action(t, a, s),
+        "re_entry": lambda self, a, m, t, s: self._handle_re_entry_action(m, t, a, s),
+    }
+
+    # Strategy TP-hit actions are called as
+    # handler(self, action, pos, mt5_pos, target_msg_id, tp_hit_number, indent).
+    _TP_ACTION_DISPATCH: ClassVar[dict[TradeActionType, Callable[..., Awaitable[None]]]] = {
+        TradeActionType.VERIFY_CLOSED: lambda self, a, p, m5, t, n, i: self._tp_verify_closed(
+            p, m5, t, n, i
+        ),
+        TradeActionType.MOVE_SL_TO_BREAKEVEN: lambda self, a, p, m5, t, n, i: (
+            self._tp_move_to_breakeven(p, m5, a.value, n, i)
+        ),
+        TradeActionType.CLOSE: lambda self, a, p, m5, t, n, i: self._tp_close(p, i),
+    }
+
+    # Seconds a fetched price may be reused while handling one message
+    _PRICE_CACHE_TTL = 0.5
+
+    # Seconds to wait after a state change before writing, to batch bursts
+    _STATE_FLUSH_DELAY = 0.25
+
     def __init__(self, bot_config: BotConfig | None = None) -> None:
         """Initialize the bot with configuration.
 
@@ -161,7 +226,7 @@ class TelegramMT5Bot:
         )
         self.state = BotState(state_file=self._config.state_file)
         self.strategy: TradingStrategy = get_strategy(self._config.trading.strategy_type)
-        print(f"Using trading strategy: {self._config.trading.strategy_type}")
+        logger.info("Using trading strategy: %s", self._config.trading.strategy_type)
 
         self._telegram = TelegramClient(
             self._config.telegram.session_name,
@@ -175,11 +240,17 @@ class TelegramMT5Bot:
         )
 
         # Timeout management
-        self._pending_timeouts: dict[int, asyncio.Task] = {}
+        self._pending_timeouts: dict[int, asyncio.TimerHandle | asyncio.Task] = {}
         # TP verification uses (msg_id, ticket) tuples as keys
-        self._tp_verification_timeouts: dict[tuple[int, int], asyncio.Task] = {}
+        self._tp_verification_timeouts: dict[
+            tuple[int, int], asyncio.TimerHandle | asyncio.Task
+        ] = {}
         # Pending edits cache for race condition handling (edit arrives while parsing original)
         self._pending_edits: dict[int, str] = {}  # msg_id -> edited text
+        # (broker_symbol, for_buy) -> (price, monotonic time fetched), see _cached_price
+        self._price_cache: dict[tuple[str, bool], tuple[float, float]] = {}
+        # Point size per broker symbol, used as the tolerance for edit comparisons
+        self._symbol_points: dict[str, float] = {}
 
         # Trade log for history
         self.trade_log: list[dict] = []
@@ -189,11 +260,24 @@ class TelegramMT5Bot:
         self._reconnect_delay = 10  # seconds between attempts
         self._max_reconnect_delay = 300  # max 5 minutes
         self._shutdown_requested = False
+        # Set on shutdown so backoff and keep-alive waits return immediately
+        self._shutdown_event = asyncio.Event()
         self._handle_telegram_event: Callable[..., Any] | None = None
         self._handle_edit_event: Callable[..., Any] | None = None
         self._keep_alive_task: asyncio.Task | None = None
         self._keep_alive_interval = 60  # Send ping every 60 seconds
 
+        # Debounced state persistence: handlers mark state dirty, a background
+        # task coalesces bursts into a single write off the event loop thread
+        self._state_dirty = asyncio.Event()
+        self._state_flusher_task: asyncio.Task | None = None
+        # Writes share one worker thread, so they never overlap on the temp file
+        # and stop() can wait for an in-flight write before the final save
+        self._state_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state")
+
+        # Single worker thread for blocking MT5 calls (the MT5 binding is not thread-safe)
+        self._mt5_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5")
+
     async def start(self) -> None:
         """Start the bot and begin monitoring the Telegram channel.
 
@@ -202,19 +286,30 @@ class TelegramMT5Bot:
         # Ensure only one instance is running
         ensure_single_instance()
 
-        print("Starting Telegram MT5 Signal Bot...")
+        logger.info("Starting Telegram MT5 Signal Bot...")
 
         # Load saved state
         self.state.load()
-        print(f"Loaded {len(self.state)} tracked positions from state")
+        logger.info("Loaded %s tracked positions from state", len(self.state))
+        self._state_flusher_task = asyncio.create_task(self._state_flusher())
 
         # Connect to MT5
-        if not self.executor.connect():
-            print("Failed to connect to MT5. Exiting.")
+        if not await self._run_mt5(self.executor.connect):
+            logger.info("Failed to connect to MT5. Exiting.")
             return
 
+        # Let SIGINT/SIGTERM interrupt backoff waits instead of killing the loop.
+        # add_signal_handler is not available on Windows event loops.
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, self._request_shutdown)
+
         # Run with reconnection loop
-        await self._run_with_reconnection()
+        try:
+            await self._run_with_reconnection()
+        finally:
+            await self._cancel_timeouts()
 
     async def _run_with_reconnection(self) -> None:
         """Main loop with automatic reconnection on network failures."""
@@ -229,7 +324,7 @@ class TelegramMT5Bot:
                 if not await self._telegram.is_user_authorized():
                     await self._telegram.start()  # type: ignore[misc]
 
-                print("Connected to Telegram")
+                logger.info("Connected to Telegram")
 
                 # Reset reconnection state on successful connection
                 attempt = 0
@@ -238,7 +333,7 @@ class TelegramMT5Bot:
                 # Get channel entities (supports multiple channels)
                 channels_config = self._config.telegram.channels
                 if not channels_config:
-                    print("No channels configured. Please set TELEGRAM_CHANNEL in .env")
+                    logger.info("No channels configured. Please set TELEGRAM_CHANNEL in .env")
                     return
 
                 channel_entities = []
@@ -249,13 +344,15 @@ class TelegramMT5Bot:
                         channel_entities.append(entity)
                         channel_names.append(getattr(entity, "title", str(ch)))
                     except Exception as e:
-                        print(f"Warning: Could not find channel '{ch}': {e}")
+                        logger.warning("Warning: Could not find channel '%s': %s", ch, e)
 
                 if not channel_entities:
-                    print("No valid channels found. Please check your channel configuration.")
+                    logger.info("No valid channels found. Please check your channel configuration.")
                     return
 
-                print(f"Monitoring {len(channel_entities)} channel(s): {', '.join(channel_names)}")
+                logger.info(
+                    "Monitoring %s channel(s): %s", len(channel_entities), ", ".join(channel_names)
+                )
 
                 # Register message handlers (remove old handlers first to avoid duplicates)
                 if self._handle_telegram_event is not None:
@@ -275,33 +372,36 @@ class TelegramMT5Bot:
                 self._handle_telegram_event = handle_new_message
                 self._handle_edit_event = handle_edited_message
 
-                # Start keep-alive task to prevent connection timeout
-                self._keep_alive_task = asyncio.create_task(self._keep_alive_loop())
+                logger.info("Bot is running! Waiting for signals...")
 
-                print("Bot is running! Waiting for signals...")
-                await self._telegram.run_until_disconnected()  # type: ignore[misc]
+                # Keep-alive pings are scoped to this connection: the task group
+                # cancels the task when the client disconnects or raises
+                async with asyncio.TaskGroup() as tg:
+                    self._keep_alive_task = tg.create_task(self._keep_alive_loop())
+                    await self._telegram.run_until_disconnected()  # type: ignore[misc]
+                    self._keep_alive_task.cancel()
+                self._keep_alive_task = None
 
                 # If we get here, connection was lost
-                self._stop_keep_alive()
                 if self._shutdown_requested:
                     break
 
-                print("\nTelegram connection lost!")
+                logger.info("\nTelegram connection lost!")
 
-            except (OSError, ConnectionError) as e:
-                print(f"\nConnection error: {e}")
-                self._stop_keep_alive()
+            # except* also unwraps errors re-raised by the keep-alive task group
+            except* (OSError, ConnectionError) as eg:
+                logger.info("\nConnection error: %s", eg.exceptions[0])
 
-            except Exception as e:
-                print(f"\nUnexpected error: {type(e).__name__}: {e}")
-                self._stop_keep_alive()
+            except* Exception as eg:
+                e = eg.exceptions[0]
+                logger.info("\nUnexpected error: %s: %s", type(e).__name__, e)
 
             # CRITICAL: Properly disconnect to release SQLite session database lock
             try:
                 if self._telegram.is_connected():
                     await self._telegram.disconnect()
             except Exception as disc_err:
-                print(f"Disconnect error (ignored): {disc_err}")
+                logger.info("Disconnect error (ignored): %s", disc_err)
 
             # Check if we should retry
             if self._shutdown_requested:
@@ -309,23 +409,67 @@ class TelegramMT5Bot:
 
             attempt += 1
             if self._max_reconnect_attempts > 0 and attempt >= self._max_reconnect_attempts:
-                print(f"\nMax reconnection attempts ({self._max_reconnect_attempts}) reached. Exiting.")
+                logger.info(
+                    "\nMax reconnection attempts (%s) reached. Exiting.",
+                    self._max_reconnect_attempts,
+                )
                 break
 
-            # Wait before reconnecting with exponential backoff
-            print(f"Reconnecting in {current_delay} seconds... (attempt {attempt})")
-            await asyncio.sleep(current_delay)
+            # Wait before reconnecting with exponential backoff (a shutdown cuts it short)
+            logger.info("Reconnecting in %s seconds... (attempt %s)", current_delay, attempt)
+            if await self._wait_for_shutdown(current_delay):
+                break
 
             # Exponential backoff with cap
             current_delay = min(current_delay * 2, self._max_reconnect_delay)
 
             # Ensure MT5 is still connected
-            if not self.executor.is_alive():
-                print("MT5 connection lost, reconnecting...")
-                if not self.executor._reconnect():
-                    print("Failed to reconnect to MT5")
+            if not await self._run_mt5(self.executor.is_alive):
+                logger.info("MT5 connection lost, reconnecting...")
+                if not await self._run_mt5(self.executor._reconnect):
+                    logger.info("Failed to reconnect to MT5")
+
+        logger.info("Reconnection loop ended.")
+
+    def _save_state(self) -> None:
+        """Mark state dirty so the flusher persists it shortly.
+
+        Falls back to a synchronous save when the flusher is not running.
+        """
+        if self._state_flusher_task is None:
+            self.state.save()
+            return
+        self._state_dirty.set()
 
-        print("Reconnection loop ended.")
+    async def _state_flusher(self) -> None:
+        """Persist state in the background, coalescing bursts of changes.
+
+        The snapshot is taken on the event loop thread so handlers can't mutate
+        positions mid-serialization; only the file write runs in a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._state_dirty.wait()
+            await asyncio.sleep(self._STATE_FLUSH_DELAY)
+            self._state_dirty.clear()
+            try:
+                await loop.run_in_executor(
+                    self._state_pool, self.state.write, self.state.snapshot()
+                )
+            except OSError as e:
+                logger.warning("Warning: Failed to save state: %s", e)
+
+    async def _wait_for_shutdown(self, seconds: float) -> bool:
+        """Sleep for up to the given number of seconds, returning early on shutdown.
+
+        Returns:
+            True if shutdown was requested during the wait
+        """
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), seconds)
+        except TimeoutError:
+            return False
+        return True
 
     async def _keep_alive_loop(self) -> None:
         """Periodically ping Telegram to prevent connection timeout.
@@ -335,7 +479,8 @@ class TelegramMT5Bot:
         """
         while not self._shutdown_requested:
             try:
-                await asyncio.sleep(self._keep_alive_interval)
+                if await self._wait_for_shutdown(self._keep_alive_interval):
+                    break
                 if self._telegram.is_connected():
                     # Send a lightweight request to keep connection alive
                     # GetState is the standard Telegram keep-alive ping
@@ -344,13 +489,16 @@ class TelegramMT5Bot:
                 break
             except Exception as e:
                 # Log but don't crash - reconnection loop will handle real disconnects
-                print(f"Keep-alive ping failed: {e}")
+                logger.info("Keep-alive ping failed: %s", e)
 
-    def _stop_keep_alive(self) -> None:
-        """Stop the keep-alive task."""
-        if self._keep_alive_task is not None:
-            self._keep_alive_task.cancel()
-            self._keep_alive_task = None
+    def _request_shutdown(self) -> None:
+        """Signal handler: stop the reconnection loop and drop the Telegram connection."""
+        logger.info("\nShutdown requested...")
+        self._shutdown_requested = True
+        self._shutdown_event.set()
+        if self._telegram.is_connected():
+            # Schedules the disconnect, which makes run_until_disconnected() return
+            self._telegram.disconnect()
 
     async def _process_message(self, event: events.NewMessage.Event) -> None:
         """Process an incoming Telegram message.
@@ -367,14 +515,14 @@ class TelegramMT5Bot:
         # Parse and classify
         signal = await self.parser.parse_signal(text)
         if signal is None:
-            print("Not a trading message, skipping.")
+            logger.info("Not a trading message, skipping.")
             return
 
         self._log_signal_parsed(signal)
 
         # Check confidence threshold
         if signal.confidence < self._config.trading.min_confidence:
-            print(f"Low confidence ({signal.confidence:.0%}), skipping.")
+            logger.info("Low confidence (%.0f%%), skipping.", signal.confidence * 100)
             return
 
         # Route to appropriate handler
@@ -395,39 +543,40 @@ class TelegramMT5Bot:
         msg_id = msg.id
         text = msg.text or ""
 
-        print(f"\n{'=' * 50}")
-        print(f"EDIT DETECTED - Message ID: {msg_id}")
-        print(f"New text: {text[:100]}...")
+        logger.info(
+            "\n%s\nEDIT DETECTED - Message ID: %d\nNew text: %.100s...", _SEPARATOR, msg_id, text
+        )
 
         # Safety check 1: Do we have a position for this message?
         dual = self.state.get_dual_position_by_msg_id(msg_id)
         if dual is None:
             # Store edit for later - might be mid-processing the original message
             self._pending_edits[msg_id] = text
-            print(f"No position yet for msg {msg_id}, storing edit for later processing")
+            logger.info("No position yet for msg %d, storing edit for later processing", msg_id)
             return
 
         # Safety check 2: Is position still open?
         if dual.is_closed:
-            print("Position already closed, ignoring edit.")
+            logger.info("Position already closed, ignoring edit.")
             return
 
-        # Safety check 3: Time window check
+        # Safety check 3: Time window check (is_closed guarantees at least one position)
         edit_window = self._config.trading.edit_window_seconds
-        oldest_position = min(p.opened_at for p in dual.all_positions)
-        time_since_open = (datetime.now() - oldest_position).total_seconds()
+        now = datetime.now()
+        time_since_open = (now - (dual.earliest_opened_at or now)).total_seconds()
 
         if time_since_open > edit_window:
-            print(
-                f"Edit received {time_since_open/60:.1f} min after open, "
-                f"exceeds {edit_window/60:.1f} min window. Ignoring."
+            logger.info(
+                "Edit received %.1f min after open, exceeds %.1f min window. Ignoring.",
+                time_since_open / 60,
+                edit_window / 60,
             )
             return
 
         # Re-parse the edited message
         new_signal = await self.parser.parse_signal(text)
         if new_signal is None:
-            print("Edited message is no longer a trading signal, ignoring.")
+            logger.info("Edited message is no longer a trading signal, ignoring.")
             return
 
         # Compare and apply changes
@@ -456,13 +605,18 @@ class TelegramMT5Bot:
         original_sl = ref_pos.original_stop_loss or ref_pos.stop_loss
         original_tps = ref_pos.original_take_profits or ref_pos.take_profits
 
-        # Detect what changed
+        # Detect what changed, ignoring differences within two ticks of the symbol
         changes = []
         new_sl = new_signal.stop_loss
         new_tps = new_signal.take_profits
 
-        sl_changed = new_sl and original_sl and abs(new_sl - original_sl) > 0.01
-        tps_changed = new_tps != original_tps
+        point = await self._get_symbol_point(ref_pos.symbol)
+        tolerance = point * 2 if point else 0.01
+
+        sl_changed = new_sl and original_sl and abs(new_sl - original_sl) > tolerance
+        tps_changed = len(new_tps) != len(original_tps) or any(
+            abs(new - old) > tolerance for new, old in zip(new_tps, original_tps, strict=True)
+        )
 
         if sl_changed:
             changes.append(f"SL: {original_sl} -> {new_sl}")
@@ -470,52 +624,107 @@ class TelegramMT5Bot:
             changes.append(f"TPs: {original_tps} -> {new_tps}")
 
         if not changes:
-            print("No significant changes detected in edit.")
+            logger.info("No significant changes detected in edit.")
             return
 
-        print(f"Changes detected: {', '.join(changes)}")
+        logger.info("Changes detected: %s", ", ".join(changes))
 
-        # Apply modifications to all open positions
-        for pos in dual.all_positions:
-            if pos.status == PositionStatus.CLOSED:
-                continue
+        # Apply modifications to all open positions concurrently; the MT5 calls are
+        # serialized on the MT5 worker thread while the event loop stays responsive.
+        await asyncio.gather(
+            *(
+                self._apply_edit_to_position(pos, new_sl, new_tps, edited_text)
+                for pos in dual.all_positions
+                if pos.status != PositionStatus.CLOSED
+            )
+        )
 
-            # Determine appropriate TP for this position's role
-            if pos.role == TradeRole.RUNNER and new_tps:
-                new_tp = new_tps[-1]  # Runner targets last TP
-            elif new_tps:
-                new_tp = new_tps[0]  # Scalp targets TP1
-            else:
-                new_tp = None
+        self._save_state()
+        logger.info("Edit changes applied and state saved.")
+
+    async def _get_symbol_point(self, symbol: str) -> float | None:
+        """Get the point (tick) size for a broker symbol, cached per symbol.
+
+        Args:
+            symbol: The broker-specific symbol
+
+        Returns:
+            Point size, or None if the symbol info is unavailable
+        """
+        point = self._symbol_points.get(symbol)
+        if point is None:
+            symbol_info = await self._run_mt5(self.executor.get_symbol_info, symbol)
+            if symbol_info is None:
+                return None
+            point = symbol_info["info"].point
+            self._symbol_points[symbol] = point
+        return point
+
+    async def _apply_edit_to_position(
+        self,
+        pos: TrackedPosition,
+        new_sl: float | None,
+        new_tps: list[float],
+        edited_text: str,
+    ) -> None:
+        """Apply edited SL/TP values to a single open position.
 
-            result = self.executor.modify_position(
+        Args:
+            pos: The tracked position to modify
+            new_sl: The new stop loss from the edited message
+            new_tps: The new take profits from the edited message
+            edited_text: The edited message text (for storing as original)
+        """
+        # Determine appropriate TP for this position's role
+        if pos.role == TradeRole.RUNNER and new_tps:
+            new_tp = new_tps[-1]  # Runner targets last TP
+        elif new_tps:
+            new_tp = new_tps[0]  # Scalp targets TP1
+        else:
+            new_tp = None
+
+        result = await self._run_mt5(
+            self.executor.modify_position,
+            pos.mt5_ticket,
+            sl=new_sl,
+            tp=new_tp,
+        )
+
+        if result["success"]:
+            # Update tracked position with new values
+            if new_sl:
+                pos.stop_loss = new_sl
+            if new_tps:
+                pos.take_profits = new_tps.copy()
+            # Mark as complete if it was pending
+            if pos.status == PositionStatus.PENDING_COMPLETION:
+                pos.status = PositionStatus.OPEN
+                pos.is_complete = True
+                logger.info("  %s %s: Completed via edit!", pos.role.value.upper(), pos.mt5_ticket)
+            else:
+                logger.info(
+                    "  %s %s: Modified successfully", pos.role.value.upper(), pos.mt5_ticket
+                )
+            # Update original values to the corrected ones
+            pos.original_message_text = edited_text
+            pos.original_stop_loss = new_sl
+            pos.original_take_profits = tuple(new_tps)
+        else:
+            logger.info(
+                "  %s %s: Failed - %s",
+                pos.role.value.upper(),
                 pos.mt5_ticket,
-                sl=new_sl,
-                tp=new_tp,
+                result.get("error", "Unknown error"),
             )
 
-            if result["success"]:
-                # Update tracked position with new values
-                if new_sl:
-                    pos.stop_loss = new_sl
-                if new_tps:
-                    pos.take_profits = new_tps.copy()
-                # Mark as complete if it was pending
-                if pos.status == PositionStatus.PENDING_COMPLETION:
-                    pos.status = PositionStatus.OPEN
-                    pos.is_complete = True
-                    print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Completed via edit!")
-                else:
-                    print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Modified successfully")
-                # Update original values to the corrected ones
-                pos.original_message_text = edited_text
-                pos.original_stop_loss = new_sl
-                pos.original_take_profits = new_tps.copy() if new_tps else []
-            else:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Failed - {result.get('error', 'Unknown error')}")
+    async def _run_mt5[T](self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking MT5 executor call on the dedicated MT5 worker thread.
 
-        self.state.save()
-        print("Edit changes applied and state saved.")
+        The MetaTrader5 binding is not thread-safe, so all offloaded calls share a
+        single worker thread and are executed one at a time.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._mt5_pool, partial(func, *args, **kwargs))
 
     def _resolve_target_msg_id(self, reply_to_msg_id: int | None) -> int | None:
         """Resolve the target message ID for position lookup.
@@ -533,7 +742,7 @@ class TelegramMT5Bot:
                 return reply_to_msg_id
             # reply_to_msg_id exists but not tracked - likely a nested reply
             # Fall back to last signal
-            print(f"  reply_to {reply_to_msg_id} not tracked, using last_signal_msg_id")
+            logger.info("  reply_to %s not tracked, using last_signal_msg_id", reply_to_msg_id)
         return self.state.last_signal_msg_id
 
     async def _route_signal(
@@ -553,6 +762,9 @@ class TelegramMT5Bot:
         6. New signals (open new positions last)
         7. Re-entry (close + reopen)
         """
+        # Quotes cached while handling a previous message are stale
+        self._price_cache.clear()
+
         # Resolve target for position-related actions
         target_msg_id = self._resolve_target_msg_id(reply_to_msg_id)
 
@@ -579,7 +791,7 @@ class TelegramMT5Bot:
             key=lambda a: action_priority.get(a.get("action_type", ""), 99)
         )
 
-        print(f"Processing {len(sorted_actions)} action(s)...")
+        logger.info("Processing %s action(s)...", len(sorted_actions))
 
         for action in sorted_actions:
             await self._execute_action(action, msg_id, target_msg_id, signal)
@@ -591,20 +803,9 @@ class TelegramMT5Bot:
         signal: TradeSignal,
     ) -> None:
         """Legacy routing based on message_type (fallback for old format)."""
-        handlers = {
-            MessageType.NEW_SIGNAL_COMPLETE: lambda: self._handle_new_signal(msg_id, signal, is_complete=True),
-            MessageType.NEW_SIGNAL_INCOMPLETE: lambda: self._handle_new_signal(msg_id, signal, is_complete=False),
-            MessageType.MODIFICATION: lambda: self._handle_modification(target_msg_id, signal),
-            MessageType.RE_ENTRY: lambda: self._handle_re_entry(msg_id, target_msg_id, signal),
-            MessageType.PROFIT_NOTIFICATION: lambda: self._handle_profit_notification(target_msg_id, signal),
-            MessageType.CLOSE_SIGNAL: lambda: self._handle_close_signal(target_msg_id, signal),
-            MessageType.PARTIAL_CLOSE: lambda: self._handle_partial_close(target_msg_id, signal),
-            MessageType.COMPOUND_ACTION: lambda: self._handle_compound_action(msg_id, target_msg_id, signal),
-        }
-
-        handler = handlers.get(signal.message_type)
+        handler = self._DISPATCH.get(signal.message_type)
         if handler:
-            await handler()
+            await handler(self, msg_id, target_msg_id, signal)
 
     async def _execute_action(
         self,
@@ -616,22 +817,12 @@ class TelegramMT5Bot:
         """Execute a single action from the actions array."""
         action_type = action.get("action_type")
 
-        handlers = {
-            "new_signal": lambda: self._handle_new_signal_action(msg_id, action, signal),
-            "modification": lambda: self._handle_modification_action(target_msg_id, action),
-            "move_sl_to_entry": lambda: self._handle_move_sl_to_entry_action(target_msg_id),
-            "partial_close": lambda: self._handle_partial_close_action(target_msg_id, action),
-            "full_close": lambda: self._handle_full_close_action(target_msg_id),
-            "tp_hit": lambda: self._handle_tp_hit_action(target_msg_id, action, signal),
-            "re_entry": lambda: self._handle_re_entry_action(msg_id, target_msg_id, action, signal),
-        }
-
-        handler = handlers.get(action_type) if action_type else None
+        handler = self._ACTION_DISPATCH.get(action_type) if action_type else None
         if handler:
-            print(f"  Executing action: {action_type}")
-            await handler()
+            logger.info("  Executing action: %s", action_type)
+            await handler(self, action, msg_id, target_msg_id, signal)
         else:
-            print(f"  Unknown action type: {action_type}")
+            logger.info("  Unknown action type: %s", action_type)
 
     async def _handle_new_signal_action(
         self,
@@ -642,10 +833,10 @@ class TelegramMT5Bot:
         """Handle new_signal action from the actions array."""
         # Build a TradeSignal from the action data
         order_type_str = action.get("order_type")
-        try:
-            order_type = OrderType(order_type_str) if order_type_str else signal.order_type
-        except ValueError:
-            order_type = OrderType.BUY
+        if order_type_str:
+            order_type = ORDER_TYPE_BY_VALUE.get(order_type_str, OrderType.BUY)
+        else:
+            order_type = signal.order_type
 
         take_profits = action.get("take_profits", []) or signal.take_profits
         stop_loss = action.get("stop_loss") or signal.stop_loss
@@ -654,7 +845,7 @@ class TelegramMT5Bot:
         has_sl = stop_loss is not None
         has_tp = len(take_profits) > 0
         has_entry = action.get("entry_price") is not None
-        is_pending = order_type.value in ["buy_limit", "sell_limit", "buy_stop", "sell_stop"]
+        is_pending = order_type in PENDING_ORDER_TYPES
 
         if is_pending:
             is_complete = has_sl and has_tp and has_entry
@@ -683,25 +874,27 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle modification action (specific SL/TP price change)."""
         if target_msg_id is None:
-            print("    No target position found for modification")
+            logger.info("    No target position found for modification")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"    Dual position for msg {target_msg_id} not found")
+            logger.info("    Dual position for msg %s not found", target_msg_id)
             return
 
         new_sl = action.get("new_stop_loss")
         new_tp = action.get("new_take_profit")
 
         if new_sl is None and new_tp is None:
-            print("    No SL or TP to modify")
+            logger.info("    No SL or TP to modify")
             return
 
         # Cancel timeout if position was pending
         self._cancel_timeout(target_msg_id)
 
-        # Modify all positions in the dual
+        # Modify all positions in the dual with a single batch
+        targets: list[TrackedPosition] = []
+        requests: list[ModifyRequest] = []
         for pos in dual.all_positions:
             if pos.status == PositionStatus.CLOSED:
                 continue
@@ -711,19 +904,31 @@ class TelegramMT5Bot:
             if effective_tp is None and pos.take_profits:
                 effective_tp = pos.take_profits[0]
 
-            effective_sl = new_sl or pos.stop_loss
-            result = self.executor.modify_position(pos.mt5_ticket, sl=effective_sl, tp=effective_tp)
+            targets.append(pos)
+            requests.append(
+                ModifyRequest(pos.mt5_ticket, sl=new_sl or pos.stop_loss, tp=effective_tp)
+            )
 
+        results = await self._run_mt5(self.executor.modify_positions_batch, requests)
+        for pos, request, result in zip(targets, requests, results, strict=True):
             if result["success"]:
                 if new_sl:
                     pos.stop_loss = new_sl
                 pos.is_complete = True
                 pos.status = PositionStatus.OPEN
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket} modified: SL={effective_sl}, TP={effective_tp}")
+                logger.info(
+                    "    %s %s modified: SL=%s, TP=%s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    request.sl,
+                    request.tp,
+                )
             else:
-                print(f"    {pos.role.value.upper()} modification failed: {result['error']}")
+                logger.info(
+                    "    %s modification failed: %s", pos.role.value.upper(), result["error"]
+                )
 
-        self.state.save()
+        self._save_state()
 
     async def _handle_move_sl_to_entry_action(
         self,
@@ -731,36 +936,55 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle move_sl_to_entry action (move SL to breakeven)."""
         if target_msg_id is None:
-            print("    No target position found for move SL to entry")
+            logger.info("    No target position found for move SL to entry")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"    Dual position for msg {target_msg_id} not found")
+            logger.info("    Dual position for msg %s not found", target_msg_id)
             return
 
+        # Snapshot actual entry prices from MT5 for all positions at once
+        mt5_positions = await self._run_mt5(
+            self.executor.get_positions_batch, [pos.mt5_ticket for pos in dual.all_positions]
+        )
+
         # Move SL to entry for all open positions
         for pos in dual.all_positions:
             if pos.status == PositionStatus.CLOSED:
                 continue
 
             # Get actual entry price from MT5
-            mt5_pos = self.executor.get_position(pos.mt5_ticket)
+            mt5_pos = mt5_positions.get(pos.mt5_ticket)
             if mt5_pos is None:
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Already closed, skipping")
+                logger.info(
+                    "    %s %s: Already closed, skipping", pos.role.value.upper(), pos.mt5_ticket
+                )
                 pos.status = PositionStatus.CLOSED
                 continue
 
             entry_price = mt5_pos.get("price_open", pos.entry_price)
-            result = self.executor.move_to_breakeven(pos.mt5_ticket, entry_price)
+            result = await self._run_mt5(
+                self.executor.move_to_breakeven, pos.mt5_ticket, entry_price
+            )
 
             if result["success"]:
                 pos.stop_loss = entry_price
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: SL moved to entry {entry_price}")
+                logger.info(
+                    "    %s %s: SL moved to entry %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    entry_price,
+                )
             else:
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Failed - {result['error']}")
+                logger.info(
+                    "    %s %s: Failed - %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["error"],
+                )
 
-        self.state.save()
+        self._save_state()
 
     async def _handle_partial_close_action(
         self,
@@ -773,19 +997,19 @@ class TelegramMT5Bot:
             # Default to 50% for "close half" if not specified
             close_percentage = 50
 
-        print(f"    Partial close: {close_percentage}%")
+        logger.info("    Partial close: %s%%", close_percentage)
 
         if target_msg_id is None:
-            print("    No target position found for partial close")
+            logger.info("    No target position found for partial close")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"    Dual position for msg {target_msg_id} not found")
+            logger.info("    Dual position for msg %s not found", target_msg_id)
             return
 
         if dual.is_closed:
-            print("    All positions already closed")
+            logger.info("    All positions already closed")
             return
 
         # Apply partial close to all positions
@@ -793,20 +1017,34 @@ class TelegramMT5Bot:
             if pos.status == PositionStatus.CLOSED:
                 continue
 
-            result = self.executor.partial_close(pos.mt5_ticket, close_percentage)
+            result = await self._run_mt5(
+                self.executor.partial_close, pos.mt5_ticket, close_percentage
+            )
             if result["success"]:
                 if result.get("skipped"):
-                    print(
-                        f"    {pos.role.value.upper()} {pos.mt5_ticket}: "
-                        f"Skipped - {result.get('reason', 'Partial close not applied')}"
+                    logger.info(
+                        "    %s %s: Skipped - %s",
+                        pos.role.value.upper(),
+                        pos.mt5_ticket,
+                        result.get("reason", "Partial close not applied"),
                     )
                     continue
                 pos.lot_size = result["remaining_volume"]
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Closed {result['closed_volume']} lots")
+                logger.info(
+                    "    %s %s: Closed %s lots",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["closed_volume"],
+                )
             else:
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Failed - {result['error']}")
+                logger.info(
+                    "    %s %s: Failed - %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["error"],
+                )
 
-        self.state.save()
+        self._save_state()
 
     async def _handle_full_close_action(
         self,
@@ -814,35 +1052,48 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle full_close action."""
         if target_msg_id is None:
-            print("    No target position found to close")
+            logger.info("    No target position found to close")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"    Dual position for msg {target_msg_id} not found")
+            logger.info("    Dual position for msg %s not found", target_msg_id)
             return
 
         if dual.is_closed:
-            print("    All positions already closed")
+            logger.info("    All positions already closed")
             return
 
-        # Close all positions
+        # Close all positions with a single batch
         any_closed = False
-        for pos in dual.all_positions:
-            if pos.status == PositionStatus.CLOSED:
-                continue
-
-            result = self.executor.close_position(pos.mt5_ticket)
+        open_positions = [
+            pos for pos in dual.all_positions
+            if pos.status != PositionStatus.CLOSED
+        ]
+        results = await self._run_mt5(
+            self.executor.close_positions_batch, [pos.mt5_ticket for pos in open_positions]
+        )
+        for pos, result in zip(open_positions, results, strict=True):
             if result["success"]:
                 pos.status = PositionStatus.CLOSED
                 any_closed = True
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Closed at {result['closed_at']}")
+                logger.info(
+                    "    %s %s: Closed at %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["closed_at"],
+                )
             else:
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Failed - {result['error']}")
+                logger.info(
+                    "    %s %s: Failed - %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["error"],
+                )
 
         if any_closed:
             self._cancel_timeout(target_msg_id)
-            self.state.save()
+            self._save_state()
 
     async def _handle_tp_hit_action(
         self,
@@ -852,7 +1103,7 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle tp_hit action using the strategy."""
         tp_hit_number = action.get("tp_hit_number")
-        print(f"    TP hit notification (TP={tp_hit_number})")
+        logger.info("    TP hit notification (TP=%s)", tp_hit_number)
 
         # Create a signal with tp_hit_number for strategy
         tp_signal = TradeSignal(
@@ -870,71 +1121,132 @@ class TelegramMT5Bot:
 
         # Check if strategy says to ignore this message
         if self.strategy.should_ignore_profit_message(tp_signal):
-            print("    Informational profit message (no TP hit) - ignoring")
+            logger.info("    Informational profit message (no TP hit) - ignoring")
             return
 
         if target_msg_id is None:
-            print("    No target position found")
+            logger.info("    No target position found")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print("    Target dual position not found in state")
+            logger.info("    Target dual position not found in state")
             return
 
         if dual.is_closed:
-            print("    All positions already closed")
+            logger.info("    All positions already closed")
             return
 
         # Get actions from strategy
         strategy_actions = self.strategy.on_tp_hit(tp_hit_number, dual, tp_signal)
 
         if not strategy_actions:
-            print("    Strategy returned no actions")
+            logger.info("    Strategy returned no actions")
             return
 
         # Execute each strategy action
-        for strategy_action in strategy_actions:
-            pos = dual.get_by_role(strategy_action.role)
+        await self._execute_tp_actions(target_msg_id, dual, strategy_actions, tp_hit_number, "    ")
+        self._save_state()
+
+    async def _execute_tp_actions(
+        self,
+        target_msg_id: int,
+        dual: DualPosition,
+        actions: list[TradeAction],
+        tp_hit_number: int | None,
+        indent: str,
+    ) -> None:
+        """Execute the strategy's TP-hit actions on a dual position.
+
+        Shared by the tp_hit action and the legacy profit notification handler.
+        The MT5 side is snapshotted once for every position the actions touch.
+
+        Args:
+            target_msg_id: Message ID of the dual (for verification timeouts)
+            dual: The dual position the actions apply to
+            actions: Actions returned by strategy.on_tp_hit
+            tp_hit_number: The TP level reported as hit, if any
+            indent: Log line prefix of the calling handler
+        """
+        positions = [dual.get_by_role(action.role) for action in actions]
+        mt5_positions = await self._run_mt5(
+            self.executor.get_positions_batch,
+            [pos.mt5_ticket for pos in positions if pos is not None],
+        )
+
+        for action, pos in zip(actions, positions, strict=True):
             if pos is None or pos.status == PositionStatus.CLOSED:
                 continue
 
-            if strategy_action.action_type == TradeActionType.VERIFY_CLOSED:
-                mt5_pos = self.executor.get_position(pos.mt5_ticket)
-                if mt5_pos is None:
-                    print(f"    {strategy_action.role.value.upper()} {pos.mt5_ticket}: Confirmed closed on MT5")
-                    pos.status = PositionStatus.CLOSED
-                    if tp_hit_number:
-                        pos.tps_hit.append(tp_hit_number)
-                else:
-                    print(f"    {strategy_action.role.value.upper()} {pos.mt5_ticket}: Still open, scheduling verification")
-                    await self._start_tp_verification_timeout(target_msg_id, pos.mt5_ticket)
+            handler = self._TP_ACTION_DISPATCH.get(action.action_type)
+            if handler:
+                mt5_pos = mt5_positions.get(pos.mt5_ticket)
+                await handler(self, action, pos, mt5_pos, target_msg_id, tp_hit_number, indent)
 
-            elif strategy_action.action_type == TradeActionType.MOVE_SL_TO_BREAKEVEN:
-                mt5_pos = self.executor.get_position(pos.mt5_ticket)
-                if mt5_pos is None:
-                    print(f"    {strategy_action.role.value.upper()} {pos.mt5_ticket}: Already closed")
-                    pos.status = PositionStatus.CLOSED
-                else:
-                    entry_price = strategy_action.value if strategy_action.value else pos.entry_price
-                    result = self.executor.move_to_breakeven(pos.mt5_ticket, entry_price)
-                    if result["success"]:
-                        pos.stop_loss = entry_price
-                        if tp_hit_number:
-                            pos.tps_hit.append(tp_hit_number)
-                        print(f"    {strategy_action.role.value.upper()}: SL moved to breakeven {entry_price}")
-                    else:
-                        print(f"    {strategy_action.role.value.upper()}: Failed - {result['error']}")
+    async def _tp_verify_closed(
+        self,
+        pos: TrackedPosition,
+        mt5_pos: dict | None,
+        target_msg_id: int,
+        tp_hit_number: int | None,
+        indent: str,
+    ) -> None:
+        """Mark the position closed if MT5 confirms it, else schedule a verification."""
+        if mt5_pos is None:
+            logger.info(
+                "%s%s %s: Confirmed closed on MT5", indent, pos.role.value.upper(), pos.mt5_ticket
+            )
+            pos.status = PositionStatus.CLOSED
+            if tp_hit_number:
+                pos.mark_tp_hit(tp_hit_number)
+        else:
+            logger.info(
+                "%s%s %s: Still open, scheduling verification",
+                indent,
+                pos.role.value.upper(),
+                pos.mt5_ticket,
+            )
+            await self._start_tp_verification_timeout(target_msg_id, pos.mt5_ticket)
 
-            elif strategy_action.action_type == TradeActionType.CLOSE:
-                result = self.executor.close_position(pos.mt5_ticket)
-                if result["success"]:
-                    pos.status = PositionStatus.CLOSED
-                    print(f"    {strategy_action.role.value.upper()} {pos.mt5_ticket}: Closed")
-                else:
-                    print(f"    {strategy_action.role.value.upper()}: Failed - {result['error']}")
+    async def _tp_move_to_breakeven(
+        self,
+        pos: TrackedPosition,
+        mt5_pos: dict | None,
+        entry_price: float | None,
+        tp_hit_number: int | None,
+        indent: str,
+    ) -> None:
+        """Move the position's SL to the entry price (breakeven)."""
+        if mt5_pos is None:
+            logger.info(
+                "%s%s %s: Already closed, skipping breakeven",
+                indent,
+                pos.role.value.upper(),
+                pos.mt5_ticket,
+            )
+            pos.status = PositionStatus.CLOSED
+            return
 
-        self.state.save()
+        entry_price = entry_price or pos.entry_price
+        result = await self._run_mt5(self.executor.move_to_breakeven, pos.mt5_ticket, entry_price)
+        if result["success"]:
+            pos.stop_loss = entry_price
+            if tp_hit_number:
+                pos.mark_tp_hit(tp_hit_number)
+            logger.info("%s%s: SL moved to breakeven %s", indent, pos.role.value.upper(), entry_price)
+        else:
+            logger.info(
+                "%s%s: Failed to move SL: %s", indent, pos.role.value.upper(), result["error"]
+            )
+
+    async def _tp_close(self, pos: TrackedPosition, indent: str) -> None:
+        """Close the position at market."""
+        result = await self._run_mt5(self.executor.close_position, pos.mt5_ticket)
+        if result["success"]:
+            pos.status = PositionStatus.CLOSED
+            logger.info("%s%s %s: Closed", indent, pos.role.value.upper(), pos.mt5_ticket)
+        else:
+            logger.info("%s%s: Failed to close: %s", indent, pos.role.value.upper(), result["error"])
 
     async def _handle_re_entry_action(
         self,
@@ -945,12 +1257,12 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle re_entry action (close losing position and re-enter)."""
         if target_msg_id is None:
-            print("    No target position found for re-entry")
+            logger.info("    No target position found for re-entry")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"    Dual position for msg {target_msg_id} not found")
+            logger.info("    Dual position for msg %s not found", target_msg_id)
             return
 
         # Get all open positions
@@ -960,48 +1272,76 @@ class TelegramMT5Bot:
         ]
 
         if not open_positions:
-            print("    All positions are already closed")
+            logger.info("    All positions are already closed")
             return
 
-        # Check if ANY position is in loss - only then do we re-enter
+        # Check if ANY position is in loss - only then do we re-enter.
+        # One snapshot covers every ticket; a position that is missing on MT5, or
+        # could not be checked, counts as in loss.
+        tickets = [pos.mt5_ticket for pos in open_positions]
+        snapshot = await self._run_mt5(self.executor.get_positions_batch, tickets)
         any_in_loss = any(
-            not self.executor.is_position_profitable(pos.mt5_ticket)
-            for pos in open_positions
+            snapshot.get(ticket) is None or snapshot[ticket]["profit"] < 0 for ticket in tickets
         )
 
         if not any_in_loss:
-            tickets = [pos.mt5_ticket for pos in open_positions]
-            print(f"    All positions {tickets} are in profit, ignoring re-entry")
+            logger.info("    All positions %s are in profit, ignoring re-entry", tickets)
             return
 
-        print(f"    Found {len(open_positions)} open position(s), processing re-entry...")
+        logger.info("    Found %s open position(s), processing re-entry...", len(open_positions))
+
+        # Positions the snapshot confirms are gone are already closed on MT5 and get
+        # no close. Tickets it could not check (reconnect failed) are still sent one.
+        to_close: list[TrackedPosition] = []
+        for pos in open_positions:
+            if pos.mt5_ticket in snapshot and snapshot[pos.mt5_ticket] is None:
+                pos.status = PositionStatus.CLOSED
+                logger.info(
+                    "    %s %s: Already closed on MT5", pos.role.value.upper(), pos.mt5_ticket
+                )
+            else:
+                to_close.append(pos)
 
-        # Close ALL open positions
+        # Close ALL remaining open positions with a single batch
         any_closed = False
         ref_pos = None
-        for pos in open_positions:
-            close_result = self.executor.close_position(pos.mt5_ticket)
+        close_results = await self._run_mt5(
+            self.executor.close_positions_batch, [pos.mt5_ticket for pos in to_close]
+        )
+        for pos, close_result in zip(to_close, close_results, strict=True):
             if close_result["success"]:
                 pos.status = PositionStatus.CLOSED
                 any_closed = True
                 if ref_pos is None:
                     ref_pos = pos
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Closed at {close_result['closed_at']}")
+                logger.info(
+                    "    %s %s: Closed at %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    close_result["closed_at"],
+                )
             else:
-                print(f"    {pos.role.value.upper()} {pos.mt5_ticket}: Failed - {close_result['error']}")
+                logger.info(
+                    "    %s %s: Failed - %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    close_result["error"],
+                )
 
         if not any_closed or ref_pos is None:
-            print("    Failed to close any positions, aborting re-entry")
+            logger.info("    Failed to close any positions, aborting re-entry")
+            if len(to_close) < len(open_positions):
+                self._save_state()
             return
 
         self._cancel_timeout(target_msg_id)
-        self.state.save()
+        self._save_state()
 
         # Build re-entry signal from action data
         re_entry_sl = action.get("stop_loss") or signal.stop_loss or ref_pos.stop_loss
 
         if re_entry_sl is None or re_entry_sl == 0.0:
-            print("    CRITICAL: No stop loss available for re-entry, aborting")
+            logger.error("    CRITICAL: No stop loss available for re-entry, aborting")
             return
 
         re_entry_signal = TradeSignal(
@@ -1031,39 +1371,42 @@ class TelegramMT5Bot:
         For dual_tp strategy: opens scalp (TP1) and runner (last TP) trades.
         For single strategy: opens one trade with TP1.
         """
+        symbols = self._config.symbols
+        trading = self._config.trading
+
         # Validate symbol
-        if not self._config.symbols.is_allowed(signal.symbol):
-            print(f"Symbol {signal.symbol} not in allowed list, skipping.")
+        if not symbols.is_allowed(signal.symbol):
+            logger.info("Symbol %s not in allowed list, skipping.", signal.symbol)
             return
 
-        broker_symbol = self._config.symbols.get_broker_symbol(signal.symbol)
-        print(f"  Broker symbol: {broker_symbol}")
+        broker_symbol = symbols.get_broker_symbol(signal.symbol)
+        logger.info("  Broker symbol: %s", broker_symbol)
 
         # Check if there's a pending dual position for this symbol that needs completion
         pending_dual = self.state.get_pending_position_by_symbol(broker_symbol)
         if pending_dual and is_complete:
-            print(f"  Found pending dual position for {broker_symbol}")
-            print("  Completing pending positions instead of opening new trades...")
+            logger.info("  Found pending dual position for %s", broker_symbol)
+            logger.info("  Completing pending positions instead of opening new trades...")
             await self._complete_pending_position(msg_id, pending_dual, signal)
             return
 
         # Calculate default SL and TP if incomplete
         if not is_complete:
             if signal.stop_loss is None:
-                signal.stop_loss = self._calculate_default_sl(broker_symbol, signal)
+                signal.stop_loss = await self._calculate_default_sl(broker_symbol, signal)
             # Set 1:3 RR TP until actual TPs are sent
             if not signal.take_profits and signal.stop_loss is not None:
-                signal.take_profits = self._calculate_default_tp(broker_symbol, signal)
+                signal.take_profits = await self._calculate_default_tp(broker_symbol, signal)
 
         # Get trade configs from strategy
         trade_configs = self.strategy.get_trades_to_open(signal)
         if not trade_configs:
-            print("  Strategy returned no trades to open")
+            logger.info("  Strategy returned no trades to open")
             return
 
         # Apply per-trade lot size overrides (dual_tp)
-        scalp_lot_size = self._config.trading.scalp_lot_size
-        runner_lot_size = self._config.trading.runner_lot_size
+        scalp_lot_size = trading.scalp_lot_size
+        runner_lot_size = trading.runner_lot_size
         if scalp_lot_size or runner_lot_size:
             for trade_cfg in trade_configs:
                 if trade_cfg.role == TradeRole.SCALP and scalp_lot_size:
@@ -1071,20 +1414,23 @@ class TelegramMT5Bot:
                 elif trade_cfg.role == TradeRole.RUNNER and runner_lot_size:
                     trade_cfg.lot_size = runner_lot_size
 
-        print(f"  Strategy: opening {len(trade_configs)} trade(s)")
+        logger.info("  Strategy: opening %s trade(s)", len(trade_configs))
 
         # Execute trades using dual signal method
-        results = self.executor.execute_dual_signal(
+        results = await self._run_mt5(
+            self.executor.execute_dual_signal,
             signal,
             trade_configs,
             broker_symbol=broker_symbol,
-            default_lot_size=self._config.trading.default_lot_size,
+            default_lot_size=trading.default_lot_size,
         )
 
         # Track each successful trade
         status = PositionStatus.OPEN if is_complete else PositionStatus.PENDING_COMPLETION
         now = datetime.now()
         any_success = False
+        # Scalp/single positions track TP1 only; runners share the full list
+        scalp_tps = signal.take_profits[:1]
 
         for trade_cfg in trade_configs:
             role_key = trade_cfg.role.value
@@ -1095,11 +1441,8 @@ class TelegramMT5Bot:
             any_success = True
             self._log_trade_executed(result)
 
-            # Determine TPs for this position
-            if trade_cfg.role == TradeRole.SCALP or trade_cfg.role == TradeRole.SINGLE:
-                pos_tps = [signal.take_profits[0]] if signal.take_profits else []
-            else:  # RUNNER
-                pos_tps = signal.take_profits  # Store all TPs for reference
+            # Determine TPs for this position (runners store all TPs for reference)
+            pos_tps = signal.take_profits if trade_cfg.role == TradeRole.RUNNER else scalp_tps
 
             tracked = TrackedPosition(
                 telegram_msg_id=msg_id,
@@ -1113,29 +1456,30 @@ class TelegramMT5Bot:
                 opened_at=now,
                 is_complete=is_complete,
                 status=status,
-                tps_hit=[],
                 role=trade_cfg.role,
                 # Store original signal data for edit detection
                 original_message_text=signal.comment,
                 original_stop_loss=signal.stop_loss,
-                original_take_profits=signal.take_profits.copy() if signal.take_profits else [],
+                original_take_profits=tuple(signal.take_profits),
             )
             self.state.add_position(tracked, trade_cfg.role)
 
         if any_success:
-            self.state.save()
+            self._save_state()
 
             # Start timeout if incomplete (for all positions) - only if timeout is enabled
             if not is_complete:
-                timeout_seconds = self._config.trading.incomplete_signal_timeout
+                timeout_seconds = trading.incomplete_signal_timeout
                 if timeout_seconds > 0:
                     # Use scalp ticket for timeout (any ticket works since they're linked)
                     scalp_result = results.get("scalp") or results.get("single")
                     if scalp_result and scalp_result.get("success"):
                         await self._start_timeout(msg_id, scalp_result["ticket"])
-                        print(f"Started {timeout_seconds // 60}-minute timeout for incomplete signal")
+                        logger.info(
+                            "Started %s-minute timeout for incomplete signal", timeout_seconds // 60
+                        )
                 else:
-                    print("Timeout disabled - signal will stay open until completed via follow-up message")
+                    logger.info("Timeout disabled - signal will stay open until completed via follow-up message")
 
             self._record_trade(signal, results)
 
@@ -1144,7 +1488,7 @@ class TelegramMT5Bot:
             # WHILE we were still parsing the original incomplete signal
             if msg_id in self._pending_edits:
                 edited_text = self._pending_edits.pop(msg_id)
-                print(f"Found pending edit for msg {msg_id}, applying now...")
+                logger.info("Found pending edit for msg %s, applying now...", msg_id)
                 dual = self.state.get_dual_position_by_msg_id(msg_id)
                 if dual and not dual.is_closed:
                     new_signal = await self.parser.parse_signal(edited_text)
@@ -1170,14 +1514,22 @@ class TelegramMT5Bot:
         # A BUY signal should NOT complete SELL positions and vice versa
         ref_pos = pending_dual.scalp or pending_dual.runner
         if ref_pos is not None:
-            pending_is_buy = ref_pos.order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
-            signal_is_buy = signal.order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
+            pending_is_buy = ref_pos.order_type in BUY_ORDER_TYPES
+            signal_is_buy = signal.order_type in BUY_ORDER_TYPES
 
             if pending_is_buy != signal_is_buy:
                 pending_dir = "BUY" if pending_is_buy else "SELL"
                 signal_dir = "BUY" if signal_is_buy else "SELL"
-                print(f"  DIRECTION MISMATCH: Pending position is {pending_dir}, signal is {signal_dir}")
-                print(f"  Cannot complete {pending_dir} position with {signal_dir} signal - treating as new signal")
+                logger.info(
+                    "  DIRECTION MISMATCH: Pending position is %s, signal is %s",
+                    pending_dir,
+                    signal_dir,
+                )
+                logger.info(
+                    "  Cannot complete %s position with %s signal - treating as new signal",
+                    pending_dir,
+                    signal_dir,
+                )
                 # Don't complete - let caller handle this as a new signal
                 await self._handle_new_signal(new_msg_id, signal, is_complete=True)
                 return
@@ -1196,35 +1548,44 @@ class TelegramMT5Bot:
         for pos in pending_dual.all_positions:
             pos.original_message_text = signal.comment
             pos.original_stop_loss = signal.stop_loss
-            pos.original_take_profits = signal.take_profits.copy() if signal.take_profits else []
+            pos.original_take_profits = tuple(signal.take_profits)
 
-        print(f"  Position reassigned: msg {old_msg_id} -> msg {new_msg_id}")
+        logger.info("  Position reassigned: msg %s -> msg %s", old_msg_id, new_msg_id)
 
-        # Update each position in the dual
+        # Validate each position in the dual, then send all modifications as one batch
         any_success = False
-        for pos in pending_dual.all_positions:
-            if pos.status == PositionStatus.CLOSED:
-                continue
-
-            # Determine TP based on role
-            if pos.role == TradeRole.RUNNER:
-                new_tp = signal.take_profits[-1] if signal.take_profits else None
-            else:  # SCALP or SINGLE
-                new_tp = signal.take_profits[0] if signal.take_profits else None
+        targets: list[TrackedPosition] = []
+        requests: list[ModifyRequest] = []
+        # Scalp/single positions track TP1 only; runners share the full list
+        scalp_tps = signal.take_profits[:1]
+        # Look up every leg on MT5 with one terminal query instead of one per leg
+        open_positions = [
+            pos for pos in pending_dual.all_positions if pos.status != PositionStatus.CLOSED
+        ]
+        snapshot = await self._run_mt5(
+            self.executor.get_positions_batch, [pos.mt5_ticket for pos in open_positions]
+        )
+        for pos in open_positions:
+            # Determine TP based on role (runner: last TP, scalp/single: TP1)
+            role_tps = signal.take_profits if pos.role == TradeRole.RUNNER else scalp_tps
+            new_tp = role_tps[-1] if role_tps else None
 
-            print(f"  Modifying {pos.role.value} position {pos.mt5_ticket}...")
-            print(f"  New SL: {new_sl}, New TP: {new_tp}")
+            logger.info("  Modifying %s position %s...", pos.role.value, pos.mt5_ticket)
+            logger.info("  New SL: %s, New TP: %s", new_sl, new_tp)
 
             # Verify position still exists on MT5
-            mt5_pos = self.executor.get_position(pos.mt5_ticket)
+            mt5_pos = snapshot.get(pos.mt5_ticket)
             if mt5_pos is None:
-                print(f"  WARNING: Position {pos.mt5_ticket} no longer exists on MT5!")
+                logger.warning("  WARNING: Position %s no longer exists on MT5!", pos.mt5_ticket)
                 pos.status = PositionStatus.CLOSED
                 continue
 
-            print(f"  Position verified on MT5: {mt5_pos['symbol']} @ {mt5_pos['price_open']}")
+            logger.info(
+                "  Position verified on MT5: %s @ %s", mt5_pos["symbol"], mt5_pos["price_open"]
+            )
 
-            # Validate SL/TP using shared validation function
+            # Validate SL/TP using shared validation function; it is pure price
+            # arithmetic, so it runs inline rather than queueing behind MT5 calls
             actual_entry = mt5_pos['price_open']
             is_buy = mt5_pos['type'] == 0  # MT5 type 0 = BUY
             validated_sl, validated_tp, warnings = self.executor.validate_sl_tp(
@@ -1233,31 +1594,34 @@ class TelegramMT5Bot:
 
             # Log any validation warnings
             for w in warnings:
-                print(f"  WARNING: {w}")
+                logger.warning("  WARNING: %s", w)
 
             if validated_sl is None and validated_tp is None:
-                print(f"  ERROR: Both SL and TP invalid for {pos.role.value}")
-                print("  Position will remain pending - edit the message to fix values")
+                logger.error("  ERROR: Both SL and TP invalid for %s", pos.role.value)
+                logger.info("  Position will remain pending - edit the message to fix values")
                 continue
 
-            result = self.executor.modify_position(pos.mt5_ticket, sl=validated_sl, tp=validated_tp)
+            targets.append(pos)
+            requests.append(ModifyRequest(pos.mt5_ticket, sl=validated_sl, tp=validated_tp))
 
+        results = await self._run_mt5(self.executor.modify_positions_batch, requests)
+        for pos, request, result in zip(targets, requests, results, strict=True):
             if result["success"]:
-                pos.stop_loss = validated_sl
-                pos.take_profits = signal.take_profits if pos.role == TradeRole.RUNNER else [signal.take_profits[0]] if signal.take_profits else []
+                pos.stop_loss = request.sl
+                pos.take_profits = signal.take_profits if pos.role == TradeRole.RUNNER else scalp_tps
                 pos.is_complete = True
                 pos.status = PositionStatus.OPEN
                 any_success = True
-                print(f"  {pos.role.value.upper()} position {pos.mt5_ticket} completed!")
+                logger.info("  %s position %s completed!", pos.role.value.upper(), pos.mt5_ticket)
             else:
-                print(f"  Failed to complete {pos.role.value}: {result['error']}")
-                print("  Position will remain pending - edit the message to fix values")
+                logger.info("  Failed to complete %s: %s", pos.role.value, result["error"])
+                logger.info("  Position will remain pending - edit the message to fix values")
 
-        self.state.save()
+        self._save_state()
         if any_success:
-            print(f"\nCompletion successful for {old_msg_id} -> {new_msg_id}")
+            logger.info("\nCompletion successful for %s -> %s", old_msg_id, new_msg_id)
         else:
-            print("\nCompletion failed but position reassigned - edit message to fix values")
+            logger.info("\nCompletion failed but position reassigned - edit message to fix values")
 
     def _get_best_tp(self, take_profits: list[float], order_type: OrderType) -> float | None:
         """Get TP1 (first take profit level) from the list.
@@ -1279,26 +1643,48 @@ class TelegramMT5Bot:
         # Always use TP1 (first element in the list)
         return take_profits[0]
 
-    def _calculate_default_sl(self, broker_symbol: str, signal: TradeSignal) -> float | None:
+    async def _cached_price(self, broker_symbol: str, for_buy: bool) -> float | None:
+        """Get the current price, reusing a quote fetched within the cache TTL.
+
+        A single message can need the same quote several times (default SL, then
+        default TP); the cache is cleared for every new message in _route_signal.
+
+        Args:
+            broker_symbol: The broker-specific symbol
+            for_buy: True for the ask price, False for the bid price
+
+        Returns:
+            Current price or None if unavailable
+        """
+        key = (broker_symbol, for_buy)
+        now = time.monotonic()
+        cached = self._price_cache.get(key)
+        if cached is not None and now - cached[1] < self._PRICE_CACHE_TTL:
+            return cached[0]
+
+        price = await self._run_mt5(self.executor.get_current_price, broker_symbol, for_buy=for_buy)
+        if price is not None:
+            self._price_cache[key] = (price, now)
+        return price
+
+    async def _calculate_default_sl(self, broker_symbol: str, signal: TradeSignal) -> float | None:
         """Calculate default SL based on risk settings."""
-        price = self.executor.get_current_price(
-            broker_symbol,
-            for_buy=signal.order_type == OrderType.BUY,
-        )
+        price = await self._cached_price(broker_symbol, for_buy=signal.order_type in BUY_ORDER_TYPES)
         if price is None:
             return None
 
-        sl = self.executor.calculate_default_sl(
+        sl = await self._run_mt5(
+            self.executor.calculate_default_sl,
             broker_symbol,
             signal.order_type,
             price,
             self._config.trading.default_lot_size,
             self._config.trading.max_risk_percent,
         )
-        print(f"  Calculated risk-based SL: {sl:.5f}")
+        logger.info("  Calculated risk-based SL: %.5f", sl)
         return sl
 
-    def _calculate_default_tp(
+    async def _calculate_default_tp(
         self, broker_symbol: str, signal: TradeSignal, rr_ratio: float = 3.0
     ) -> list[float]:
         """Calculate default TP based on 1:RR risk-reward ratio.
@@ -1315,18 +1701,20 @@ class TelegramMT5Bot:
             return []
 
         # Get current price as entry reference
-        is_buy = signal.order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
-        price = self.executor.get_current_price(broker_symbol, for_buy=is_buy)
+        is_buy = signal.order_type in BUY_ORDER_TYPES
+        price = await self._cached_price(broker_symbol, for_buy=is_buy)
         if price is None:
             return []
 
         # Calculate risk (distance from entry to SL)
         risk = abs(price - signal.stop_loss)
 
-        # Calculate TP at RR ratio (e.g., 1:3 means TP is 3x the risk distance)
-        tp = price + (risk * rr_ratio) if is_buy else price - (risk * rr_ratio)
+        # Calculate TP at RR ratio (e.g., 1:3 means TP is 3x the risk distance),
+        # above the entry for buys and below it for sells
+        direction = 1.0 if is_buy else -1.0
+        tp = price + direction * risk * rr_ratio
 
-        print(f"  Calculated 1:{rr_ratio:.0f} RR TP: {tp:.5f} (risk: {risk:.5f})")
+        logger.info("  Calculated 1:%.0f RR TP: %.5f (risk: %.5f)", rr_ratio, tp, risk)
         return [tp]
 
     async def _handle_modification(
@@ -1336,12 +1724,12 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle modification message (update SL/TP) for all positions."""
         if target_msg_id is None:
-            print("No target position found for modification")
+            logger.info("No target position found for modification")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"Dual position for msg {target_msg_id} not found in state")
+            logger.info("Dual position for msg %s not found in state", target_msg_id)
             return
 
         # Cancel timeout if position was pending
@@ -1350,32 +1738,42 @@ class TelegramMT5Bot:
         # Determine new SL value
         new_sl = signal.new_stop_loss or signal.stop_loss
 
-        # Modify all positions in the dual
+        # Modify all positions in the dual with a single batch
+        targets: list[TrackedPosition] = []
+        requests: list[ModifyRequest] = []
+        # Scalp/single positions track TP1 only; runners share the full list
+        scalp_tps = signal.take_profits[:1]
         for pos in dual.all_positions:
             if pos.status == PositionStatus.CLOSED:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket} is already closed")
+                logger.info("  %s %s is already closed", pos.role.value.upper(), pos.mt5_ticket)
                 continue
 
-            # Determine TP based on role
-            if pos.role == TradeRole.RUNNER:
-                new_tp = signal.take_profits[-1] if signal.take_profits else self._get_new_tp(signal, pos)
-            else:
-                new_tp = signal.take_profits[0] if signal.take_profits else self._get_new_tp(signal, pos)
+            # Determine TP based on role (runner: last TP, scalp/single: TP1)
+            role_tps = signal.take_profits if pos.role == TradeRole.RUNNER else scalp_tps
+            new_tp = role_tps[-1] if role_tps else self._get_new_tp(signal, pos)
 
-            effective_sl = new_sl or pos.stop_loss
-            result = self.executor.modify_position(pos.mt5_ticket, sl=effective_sl, tp=new_tp)
+            targets.append(pos)
+            requests.append(ModifyRequest(pos.mt5_ticket, sl=new_sl or pos.stop_loss, tp=new_tp))
 
+        results = await self._run_mt5(self.executor.modify_positions_batch, requests)
+        for pos, request, result in zip(targets, requests, results, strict=True):
             if result["success"]:
-                pos.stop_loss = effective_sl
+                pos.stop_loss = request.sl
                 if signal.take_profits:
-                    pos.take_profits = signal.take_profits if pos.role == TradeRole.RUNNER else [signal.take_profits[0]]
+                    pos.take_profits = signal.take_profits if pos.role == TradeRole.RUNNER else scalp_tps
                 pos.is_complete = True
                 pos.status = PositionStatus.OPEN
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket} modified: SL={effective_sl}, TP={new_tp}")
+                logger.info(
+                    "  %s %s modified: SL=%s, TP=%s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    request.sl,
+                    request.tp,
+                )
             else:
-                print(f"  {pos.role.value.upper()} modification failed: {result['error']}")
+                logger.info("  %s modification failed: %s", pos.role.value.upper(), result["error"])
 
-        self.state.save()
+        self._save_state()
 
     def _get_new_tp(self, signal: TradeSignal, pos: TrackedPosition) -> float | None:
         """Get new TP value from signal or position."""
@@ -1395,12 +1793,12 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle re-entry signal (close all positions if any in loss, open new)."""
         if target_msg_id is None:
-            print("No target position found for re-entry")
+            logger.info("No target position found for re-entry")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"Dual position for msg {target_msg_id} not found in state")
+            logger.info("Dual position for msg %s not found in state", target_msg_id)
             return
 
         # Get all open positions
@@ -1410,42 +1808,70 @@ class TelegramMT5Bot:
         ]
 
         if not open_positions:
-            print("All positions are already closed")
+            logger.info("All positions are already closed")
             return
 
-        # Check if ANY position is in loss - only then do we re-enter
+        # Check if ANY position is in loss - only then do we re-enter.
+        # One snapshot covers every ticket; a position that is missing on MT5, or
+        # could not be checked, counts as in loss.
+        tickets = [pos.mt5_ticket for pos in open_positions]
+        snapshot = await self._run_mt5(self.executor.get_positions_batch, tickets)
         any_in_loss = any(
-            not self.executor.is_position_profitable(pos.mt5_ticket)
-            for pos in open_positions
+            snapshot.get(ticket) is None or snapshot[ticket]["profit"] < 0 for ticket in tickets
         )
 
         if not any_in_loss:
-            tickets = [pos.mt5_ticket for pos in open_positions]
-            print(f"All positions {tickets} are in profit, ignoring re-entry")
+            logger.info("All positions %s are in profit, ignoring re-entry", tickets)
             return
 
-        print(f"Found {len(open_positions)} open position(s), processing re-entry...")
+        logger.info("Found %s open position(s), processing re-entry...", len(open_positions))
+
+        # Positions the snapshot confirms are gone are already closed on MT5 and get
+        # no close. Tickets it could not check (reconnect failed) are still sent one.
+        to_close: list[TrackedPosition] = []
+        for pos in open_positions:
+            if pos.mt5_ticket in snapshot and snapshot[pos.mt5_ticket] is None:
+                pos.status = PositionStatus.CLOSED
+                logger.info(
+                    "  %s %s: Already closed on MT5", pos.role.value.upper(), pos.mt5_ticket
+                )
+            else:
+                to_close.append(pos)
 
-        # Close ALL open positions
+        # Close ALL remaining open positions with a single batch
         any_closed = False
         ref_pos = None  # Reference position for symbol/order_type/take_profits
-        for pos in open_positions:
-            close_result = self.executor.close_position(pos.mt5_ticket)
+        close_results = await self._run_mt5(
+            self.executor.close_positions_batch, [pos.mt5_ticket for pos in to_close]
+        )
+        for pos, close_result in zip(to_close, close_results, strict=True):
             if close_result["success"]:
                 pos.status = PositionStatus.CLOSED
                 any_closed = True
                 if ref_pos is None:
                     ref_pos = pos
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Closed at {close_result['closed_at']}")
+                logger.info(
+                    "  %s %s: Closed at %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    close_result["closed_at"],
+                )
             else:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Failed to close - {close_result['error']}")
+                logger.info(
+                    "  %s %s: Failed to close - %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    close_result["error"],
+                )
 
         if not any_closed or ref_pos is None:
-            print("Failed to close any positions, aborting re-entry")
+            logger.info("Failed to close any positions, aborting re-entry")
+            if len(to_close) < len(open_positions):
+                self._save_state()
             return
 
         self._cancel_timeout(target_msg_id)
-        self.state.save()
+        self._save_state()
 
         # Open new position with re-entry parameters
         # Use ref_pos for symbol/order_type/take_profits
@@ -1453,7 +1879,7 @@ class TelegramMT5Bot:
         re_entry_sl = signal.new_stop_loss or signal.stop_loss or ref_pos.stop_loss
 
         if re_entry_sl is None or re_entry_sl == 0.0:
-            print("  CRITICAL: No stop loss available for re-entry, aborting")
+            logger.error("  CRITICAL: No stop loss available for re-entry, aborting")
             return
 
         re_entry_signal = TradeSignal(
@@ -1482,77 +1908,36 @@ class TelegramMT5Bot:
         1. Whether to ignore the message (e.g., "book profits" without TP hit)
         2. What actions to take on TP hit (close scalp, move runner to breakeven)
         """
-        print(f"Profit notification received (TP={signal.tp_hit_number})")
-
-        # Check if strategy says to ignore this message
+        # Check if strategy says to ignore this message before doing any other work
         if self.strategy.should_ignore_profit_message(signal):
-            print("  Informational profit message (no TP hit) - ignoring per strategy")
+            logger.info("Informational profit message (no TP hit) - ignoring per strategy")
             return
 
+        logger.info("Profit notification received (TP=%s)", signal.tp_hit_number)
+
         if target_msg_id is None:
-            print("No target position found")
+            logger.info("No target position found")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print("Target dual position not found in state")
+            logger.info("Target dual position not found in state")
             return
 
         if dual.is_closed:
-            print("All positions already closed")
+            logger.info("All positions already closed")
             return
 
         # Get actions from strategy
         actions = self.strategy.on_tp_hit(signal.tp_hit_number, dual, signal)
 
         if not actions:
-            print("  Strategy returned no actions")
+            logger.info("  Strategy returned no actions")
             return
 
         # Execute each action
-        for action in actions:
-            pos = dual.get_by_role(action.role)
-            if pos is None or pos.status == PositionStatus.CLOSED:
-                continue
-
-            if action.action_type == TradeActionType.VERIFY_CLOSED:
-                # Check if position is closed on MT5
-                mt5_pos = self.executor.get_position(pos.mt5_ticket)
-                if mt5_pos is None:
-                    print(f"  {action.role.value.upper()} {pos.mt5_ticket}: Confirmed closed on MT5")
-                    pos.status = PositionStatus.CLOSED
-                    if signal.tp_hit_number:
-                        pos.tps_hit.append(signal.tp_hit_number)
-                else:
-                    print(f"  {action.role.value.upper()} {pos.mt5_ticket}: Still open, scheduling verification")
-                    await self._start_tp_verification_timeout(target_msg_id, pos.mt5_ticket)
-
-            elif action.action_type == TradeActionType.MOVE_SL_TO_BREAKEVEN:
-                # Move SL to entry price (breakeven)
-                mt5_pos = self.executor.get_position(pos.mt5_ticket)
-                if mt5_pos is None:
-                    print(f"  {action.role.value.upper()} {pos.mt5_ticket}: Already closed, skipping breakeven")
-                    pos.status = PositionStatus.CLOSED
-                else:
-                    entry_price = action.value if action.value else pos.entry_price
-                    result = self.executor.move_to_breakeven(pos.mt5_ticket, entry_price)
-                    if result["success"]:
-                        pos.stop_loss = entry_price
-                        if signal.tp_hit_number:
-                            pos.tps_hit.append(signal.tp_hit_number)
-                        print(f"  {action.role.value.upper()}: SL moved to breakeven {entry_price}")
-                    else:
-                        print(f"  {action.role.value.upper()}: Failed to move SL: {result['error']}")
-
-            elif action.action_type == TradeActionType.CLOSE:
-                result = self.executor.close_position(pos.mt5_ticket)
-                if result["success"]:
-                    pos.status = PositionStatus.CLOSED
-                    print(f"  {action.role.value.upper()} {pos.mt5_ticket}: Closed")
-                else:
-                    print(f"  {action.role.value.upper()}: Failed to close: {result['error']}")
-
-        self.state.save()
+        await self._execute_tp_actions(target_msg_id, dual, actions, signal.tp_hit_number, "  ")
+        self._save_state()
 
     async def _handle_close_signal(
         self,
@@ -1561,36 +1946,51 @@ class TelegramMT5Bot:
     ) -> None:
         """Handle close signal - closes ALL positions in the dual."""
         if target_msg_id is None:
-            print("No target position found to close")
+            logger.info("No target position found to close")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"Dual position for msg {target_msg_id} not found")
+            logger.info("Dual position for msg %s not found", target_msg_id)
             return
 
         if dual.is_closed:
-            print("All positions already closed")
+            logger.info("All positions already closed")
             return
 
-        # Close all positions in the dual
+        # Close all positions in the dual with a single batch
         any_closed = False
+        open_positions: list[TrackedPosition] = []
         for pos in dual.all_positions:
             if pos.status == PositionStatus.CLOSED:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Already closed")
+                logger.info("  %s %s: Already closed", pos.role.value.upper(), pos.mt5_ticket)
                 continue
+            open_positions.append(pos)
 
-            result = self.executor.close_position(pos.mt5_ticket)
+        results = await self._run_mt5(
+            self.executor.close_positions_batch, [pos.mt5_ticket for pos in open_positions]
+        )
+        for pos, result in zip(open_positions, results, strict=True):
             if result["success"]:
                 pos.status = PositionStatus.CLOSED
                 any_closed = True
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Closed at {result['closed_at']}")
+                logger.info(
+                    "  %s %s: Closed at %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["closed_at"],
+                )
             else:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Failed to close: {result['error']}")
+                logger.info(
+                    "  %s %s: Failed to close: %s",
+                    pos.role.value.upper(),
+                    pos.mt5_ticket,
+                    result["error"],
+                )
 
         if any_closed:
             self._cancel_timeout(target_msg_id)
-            self.state.save()
+            self._save_state()
 
     async def _handle_partial_close(
         self,
@@ -1598,50 +1998,60 @@ class TelegramMT5Bot:
         signal: TradeSignal,
     ) -> None:
         """Handle partial close signal - applies to ALL positions in the dual."""
-        print(f"Partial close signal received: {signal.close_percentage}%")
+        logger.info("Partial close signal received: %s%%", signal.close_percentage)
 
         if target_msg_id is None:
-            print("No target position found for partial close")
+            logger.info("No target position found for partial close")
             return
 
         if signal.close_percentage is None:
-            print("No close percentage specified")
+            logger.info("No close percentage specified")
             return
 
         dual = self.state.get_dual_position_by_msg_id(target_msg_id)
         if dual is None:
-            print(f"Dual position for msg {target_msg_id} not found")
+            logger.info("Dual position for msg %s not found", target_msg_id)
             return
 
         if dual.is_closed:
-            print("All positions already closed")
+            logger.info("All positions already closed")
             return
 
         # Apply partial close to all positions in the dual
         any_success = False
         for pos in dual.all_positions:
             if pos.status == PositionStatus.CLOSED:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Already closed")
+                logger.info("  %s %s: Already closed", pos.role.value.upper(), pos.mt5_ticket)
                 continue
 
-            result = self.executor.partial_close(pos.mt5_ticket, signal.close_percentage)
+            result = await self._run_mt5(
+                self.executor.partial_close, pos.mt5_ticket, signal.close_percentage
+            )
             if result["success"]:
                 if result.get("skipped"):
-                    print(
-                        f"  {pos.role.value.upper()} {pos.mt5_ticket}: "
-                        f"Skipped: {result.get('reason', 'Partial close not applied')}"
+                    logger.info(
+                        "  %s %s: Skipped: %s",
+                        pos.role.value.upper(),
+                        pos.mt5_ticket,
+                        result.get("reason", "Partial close not applied"),
                     )
                     continue
                 pos.lot_size = result["remaining_volume"]
                 any_success = True
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Partial close successful")
-                print(f"    Closed: {result['closed_volume']} lots @ {result['closed_at']}")
-                print(f"    Remaining: {result['remaining_volume']} lots")
+                logger.info(
+                    "  %s %s: Partial close successful", pos.role.value.upper(), pos.mt5_ticket
+                )
+                logger.info(
+                    "    Closed: %s lots @ %s", result["closed_volume"], result["closed_at"]
+                )
+                logger.info("    Remaining: %s lots", result["remaining_volume"])
             else:
-                print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Failed: {result['error']}")
+                logger.info(
+                    "  %s %s: Failed: %s", pos.role.value.upper(), pos.mt5_ticket, result["error"]
+                )
 
         if any_success:
-            self.state.save()
+            self._save_state()
 
     async def _handle_compound_action(
         self,
@@ -1659,90 +2069,113 @@ class TelegramMT5Bot:
         then places new pending orders.
         """
         if not signal.actions:
-            print("Compound action has no actions to process")
+            logger.info("Compound action has no actions to process")
             return
 
-        print(f"\nProcessing compound action with {len(signal.actions)} actions...")
+        logger.info("\nProcessing compound action with %s actions...", len(signal.actions))
 
         # Get the original position if this is a reply
         original_pos = None
         if target_msg_id:
             original_pos = self.state.get_position_by_msg_id(target_msg_id)
             if original_pos:
-                print(f"  Target position: {original_pos.mt5_ticket} ({original_pos.symbol})")
+                logger.info(
+                    "  Target position: %s (%s)", original_pos.mt5_ticket, original_pos.symbol
+                )
 
-        # Separate actions by type
-        modification_actions = [a for a in signal.actions if a.get("action_type") == "modification"]
-        new_signal_actions = [a for a in signal.actions if a.get("action_type") == "new_signal"]
+        # Separate actions by type in a single pass
+        actions_by_type: defaultdict[str | None, list[dict]] = defaultdict(list)
+        for a in signal.actions:
+            actions_by_type[a.get("action_type")].append(a)
+        modification_actions = actions_by_type["modification"]
+        new_signal_actions = actions_by_type["new_signal"]
 
         # Step 1: Apply modifications FIRST (protects the losing position)
         modification_sl = None
+        modified = False
         for action in modification_actions:
             new_sl = action.get("new_stop_loss")
             new_tp = action.get("new_take_profit")
 
             if original_pos and original_pos.status != PositionStatus.CLOSED:
-                print(f"  Applying modification: SL={new_sl}, TP={new_tp}")
-                result = self.executor.modify_position(
-                    original_pos.mt5_ticket, sl=new_sl, tp=new_tp
+                logger.info("  Applying modification: SL=%s, TP=%s", new_sl, new_tp)
+                result = await self._run_mt5(
+                    self.executor.modify_position, original_pos.mt5_ticket, sl=new_sl, tp=new_tp
                 )
                 if result["success"]:
                     if new_sl:
                         original_pos.stop_loss = new_sl
                         modification_sl = new_sl  # Save for pending order inheritance
-                    self.state.save()
-                    print(f"  Modified position {original_pos.mt5_ticket}")
+                    modified = True
+                    logger.info("  Modified position %s", original_pos.mt5_ticket)
                 else:
-                    print(f"  Modification failed: {result['error']}")
+                    logger.info("  Modification failed: %s", result["error"])
             else:
                 # No original position, just save the SL for pending order
                 modification_sl = new_sl
-                print(f"  No position to modify, will use SL {new_sl} for pending order")
+                logger.info("  No position to modify, will use SL %s for pending order", new_sl)
+
+        # Persist all modifications once, before any pending order is placed
+        if modified:
+            self._save_state()
+
+        # Step 2: Place new pending orders SECOND.
+        # Determine symbol once (from signal or original position); it is the
+        # same for every action in the compound message
+        symbol = signal.symbol
+        if not symbol and original_pos:
+            symbol = original_pos.symbol
+        symbol_allowed = False
+        broker_symbol = ""
+        if symbol and self._config.symbols.is_allowed(symbol):
+            symbol_allowed = True
+            broker_symbol = self._config.symbols.get_broker_symbol(symbol)
 
-        # Step 2: Place new pending orders SECOND
+        # Resolve each action's order type and SL source first
+        pending_orders: list[tuple[dict, OrderType, float | None]] = []
         for action in new_signal_actions:
             order_type_str = action.get("order_type")
             if not order_type_str:
-                print("  Skipping action with no order_type")
+                logger.info("  Skipping action with no order_type")
                 continue
 
-            try:
-                order_type = OrderType(order_type_str)
-            except ValueError:
-                print(f"  Invalid order_type: {order_type_str}")
+            order_type = ORDER_TYPE_BY_VALUE.get(order_type_str)
+            if order_type is None:
+                logger.info("  Invalid order_type: %s", order_type_str)
                 continue
 
-            # Determine symbol (from action, signal, or original position)
-            symbol = signal.symbol
-            if not symbol and original_pos:
-                symbol = original_pos.symbol
-
             if not symbol:
-                print("  Cannot determine symbol for pending order")
+                logger.info("  Cannot determine symbol for pending order")
                 continue
 
             # Validate symbol
-            if not self._config.symbols.is_allowed(symbol):
-                print(f"  Symbol {symbol} not in allowed list, skipping")
+            if not symbol_allowed:
+                logger.info("  Symbol %s not in allowed list, skipping", symbol)
                 continue
 
-            broker_symbol = self._config.symbols.get_broker_symbol(symbol)
-
             # Determine SL: action's SL > modification SL > calculate default
-            pending_sl = action.get("stop_loss") or modification_sl
-            if pending_sl is None:
-                # Calculate default SL for pending order
-                entry_price = action.get("entry_price")
-                if entry_price:
-                    pending_sl = self.executor.calculate_default_sl(
-                        broker_symbol,
-                        order_type,
-                        entry_price,
-                        self._config.trading.default_lot_size,
-                        self._config.trading.max_risk_percent,
-                    )
-                    print(f"  Calculated default SL for pending order: {pending_sl}")
+            pending_orders.append((action, order_type, action.get("stop_loss") or modification_sl))
 
+        # Calculate the missing default SLs with a single risk calculation
+        needs_default = [
+            i for i, (action, _, pending_sl) in enumerate(pending_orders)
+            if pending_sl is None and action.get("entry_price")
+        ]
+        if needs_default:
+            default_sls = await self._run_mt5(
+                self.executor.calculate_default_sl_batch,
+                broker_symbol,
+                [pending_orders[i][1] for i in needs_default],
+                [pending_orders[i][0]["entry_price"] for i in needs_default],
+                self._config.trading.default_lot_size,
+                self._config.trading.max_risk_percent,
+            )
+            for i, default_sl in zip(needs_default, default_sls, strict=True):
+                action, order_type, _ = pending_orders[i]
+                pending_orders[i] = (action, order_type, default_sl)
+                logger.info("  Calculated default SL for pending order: %s", default_sl)
+
+        for action, order_type, pending_sl in pending_orders:
             # Build pending order signal
             pending_signal = TradeSignal(
                 symbol=symbol,
@@ -1751,11 +2184,13 @@ class TelegramMT5Bot:
                 stop_loss=pending_sl,
                 take_profits=action.get("take_profits", []),
                 message_type=MessageType.NEW_SIGNAL_COMPLETE,
-                is_complete=pending_sl is not None and len(action.get("take_profits", [])) > 0,
+                is_complete=pending_sl is not None and bool(action.get("take_profits")),
             )
 
-            print(f"  Placing pending order: {order_type.value} @ {pending_signal.entry_price}")
-            print(f"    SL: {pending_sl}, TPs: {pending_signal.take_profits}")
+            logger.info(
+                "  Placing pending order: %s @ %s", order_type.value, pending_signal.entry_price
+            )
+            logger.info("    SL: %s, TPs: %s", pending_sl, pending_signal.take_profits)
 
             # Execute the pending order
             await self._handle_new_signal(msg_id, pending_signal, is_complete=pending_signal.is_complete)
@@ -1770,10 +2205,8 @@ class TelegramMT5Bot:
             return
 
         async def timeout_handler() -> None:
-            await asyncio.sleep(timeout_seconds)
             dual = self.state.get_dual_position_by_msg_id(msg_id)
             if dual is None:
-                self._pending_timeouts.pop(msg_id, None)
                 return
 
             # Check if any position is still pending
@@ -1783,32 +2216,92 @@ class TelegramMT5Bot:
             ]
 
             if not pending_positions:
-                self._pending_timeouts.pop(msg_id, None)
                 return
 
-            print(f"\nTimeout expired for incomplete signal {msg_id}")
-            print(f"Closing {len(pending_positions)} pending position(s)...")
+            logger.info("\nTimeout expired for incomplete signal %s", msg_id)
+            logger.info("Closing %s pending position(s)...", len(pending_positions))
 
-            for pos in pending_positions:
-                result = self.executor.close_position(pos.mt5_ticket)
+            results = await self._run_mt5(
+                self.executor.close_positions_batch, [pos.mt5_ticket for pos in pending_positions]
+            )
+            for pos, result in zip(pending_positions, results, strict=True):
                 if result["success"]:
                     pos.status = PositionStatus.CLOSED
-                    print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Closed due to timeout")
+                    logger.info(
+                        "  %s %s: Closed due to timeout", pos.role.value.upper(), pos.mt5_ticket
+                    )
                 else:
-                    print(f"  {pos.role.value.upper()} {pos.mt5_ticket}: Failed to close: {result['error']}")
+                    logger.info(
+                        "  %s %s: Failed to close: %s",
+                        pos.role.value.upper(),
+                        pos.mt5_ticket,
+                        result["error"],
+                    )
 
-            self.state.save()
-            self._pending_timeouts.pop(msg_id, None)
+            self._save_state()
 
-        task = asyncio.create_task(timeout_handler())
-        self._pending_timeouts[msg_id] = task
+        # Replaces (and cancels) any existing timeout for this message
+        self._schedule_timeout(self._pending_timeouts, msg_id, timeout_seconds, timeout_handler)
+
+    def _schedule_timeout[K](
+        self,
+        registry: dict[K, asyncio.TimerHandle | asyncio.Task],
+        key: K,
+        delay: float,
+        handler: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Run a timeout handler after a delay, registered under the given key.
+
+        While waiting, the entry is a bare loop timer rather than a task parked
+        in asyncio.sleep(). The handler's task is only created once the timer
+        fires, and it then takes over the registry entry.
+        """
+
+        def fire() -> None:
+            if registry.get(key) is handle:
+                self._track_task(registry, key, asyncio.create_task(handler()))
+
+        handle = asyncio.get_running_loop().call_later(delay, fire)
+        existing = registry.get(key)
+        if existing is not None:
+            existing.cancel()
+        registry[key] = handle
+
+    @staticmethod
+    def _track_task[K](
+        registry: dict[K, asyncio.TimerHandle | asyncio.Task], key: K, task: asyncio.Task
+    ) -> None:
+        """Register a timeout task and evict it from the registry once it finishes.
+
+        Any timer or task already registered under the key is cancelled, so the
+        registry holds at most one live entry per key. The eviction only removes
+        the entry if it still refers to this task, so a replacement is left alone.
+        """
+        existing = registry.get(key)
+        if existing is not None:
+            existing.cancel()
+        registry[key] = task
+
+        def evict(done: asyncio.Task) -> None:
+            if registry.get(key) is done:
+                del registry[key]
+
+        task.add_done_callback(evict)
+
+    async def _cancel_timeouts(self) -> None:
+        """Cancel all timeouts and wait for running handlers to finish unwinding."""
+        entries = [*self._pending_timeouts.values(), *self._tp_verification_timeouts.values()]
+        for entry in entries:
+            entry.cancel()
+        tasks = [entry for entry in entries if isinstance(entry, asyncio.Task)]
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     def _cancel_timeout(self, msg_id: int) -> None:
         """Cancel pending timeout for a message."""
         task = self._pending_timeouts.pop(msg_id, None)
         if task:
             task.cancel()
-            print(f"Cancelled timeout for msg {msg_id}")
+            logger.info("Cancelled timeout for msg %s", msg_id)
 
     async def _start_tp_verification_timeout(self, msg_id: int, ticket: int) -> None:
         """Start 5-minute verification timeout after TP hit notification.
@@ -1822,79 +2315,89 @@ class TelegramMT5Bot:
         timeout_key = (msg_id, ticket)
 
         async def verification_handler() -> None:
-            await asyncio.sleep(timeout_seconds)
             # Find the position by ticket (handles dual positions correctly)
             result = self.state.get_position_by_ticket(ticket)
             if result is None:
-                print(f"\nTP verification: Position {ticket} not found")
-                self._tp_verification_timeouts.pop(timeout_key, None)
+                logger.info("\nTP verification: Position %s not found", ticket)
                 return
 
             pos, role = result
             if pos.status == PositionStatus.CLOSED:
-                print(f"\nTP verification: {role.value.upper()} {ticket} already closed")
-                self._tp_verification_timeouts.pop(timeout_key, None)
+                logger.info("\nTP verification: %s %s already closed", role.value.upper(), ticket)
                 return
 
             # Check MT5 again
-            mt5_pos = self.executor.get_position(ticket)
+            mt5_pos = await self._run_mt5(self.executor.get_position, ticket)
             if mt5_pos is None:
                 # Position closed on MT5
-                print(f"\nTP verification: {role.value.upper()} {ticket} confirmed closed on MT5")
+                logger.info(
+                    "\nTP verification: %s %s confirmed closed on MT5", role.value.upper(), ticket
+                )
                 pos.status = PositionStatus.CLOSED
-                self.state.save()
+                self._save_state()
             else:
                 # Position still open - check if safe to force close
                 original_tp = pos.take_profits[0] if pos.take_profits else None
-                is_safe, current_price = self.executor.would_close_profitably(ticket, original_tp)
+                is_safe, current_price = await self._run_mt5(
+                    self.executor.would_close_profitably, ticket, original_tp
+                )
 
                 if is_safe:
                     # Position is profitable or at TP - safe to force close
-                    print(f"\nTP verification: {role.value.upper()} {ticket} still open after 5 min, force closing...")
-                    close_result = self.executor.close_position(ticket)
+                    logger.info(
+                        "\nTP verification: %s %s still open after 5 min, force closing...",
+                        role.value.upper(),
+                        ticket,
+                    )
+                    close_result = await self._run_mt5(self.executor.close_position, ticket)
                     if close_result["success"]:
                         pos.status = PositionStatus.CLOSED
-                        self.state.save()
-                        print(f"  Force closed at {close_result['closed_at']}")
+                        self._save_state()
+                        logger.info("  Force closed at %s", close_result["closed_at"])
                     else:
-                        print(f"  Failed to force close: {close_result['error']}")
+                        logger.info("  Failed to force close: %s", close_result["error"])
                 else:
                     # Position is at a loss - NOT safe to force close
-                    print(f"\nTP verification: {role.value.upper()} {ticket} at LOSS (price={current_price})")
-                    print("  NOT safe to force close - keeping position open with existing SL/TP")
-                    print("  Position will close automatically when SL or TP is hit")
-
-            self._tp_verification_timeouts.pop(timeout_key, None)
-
-        # Cancel any existing verification timeout for this ticket
-        existing_task = self._tp_verification_timeouts.pop(timeout_key, None)
-        if existing_task:
-            existing_task.cancel()
+                    logger.info(
+                        "\nTP verification: %s %s at LOSS (price=%s)",
+                        role.value.upper(),
+                        ticket,
+                        current_price,
+                    )
+                    logger.info("  NOT safe to force close - keeping position open with existing SL/TP")
+                    logger.info("  Position will close automatically when SL or TP is hit")
 
-        task = asyncio.create_task(verification_handler())
-        self._tp_verification_timeouts[timeout_key] = task
-        print(f"  Started 5-minute verification timeout for position {ticket}")
+        # Replaces (and cancels) any existing verification timeout for this ticket
+        self._schedule_timeout(
+            self._tp_verification_timeouts, timeout_key, timeout_seconds, verification_handler
+        )
+        logger.info("  Started 5-minute verification timeout for position %s", ticket)
 
     def _log_message_received(self, msg_id: int, reply_to: int | None, text: str) -> None:
         """Log received message details."""
-        print(f"\n{'=' * 50}")
-        print(f"Message ID: {msg_id}")
         if reply_to:
-            print(f"Reply to: {reply_to}")
-        print(f"Text: {text[:100]}...")
+            logger.info(
+                "\n%s\nMessage ID: %d\nReply to: %d\nText: %.100s...",
+                _SEPARATOR, msg_id, reply_to, text,
+            )
+        else:
+            logger.info("\n%s\nMessage ID: %d\nText: %.100s...", _SEPARATOR, msg_id, text)
 
     def _log_signal_parsed(self, signal: TradeSignal) -> None:
         """Log parsed signal details."""
-        print(f"\nClassified as: {signal.message_type.value}")
-        print(f"  Symbol: {signal.symbol}")
-        print(f"  Confidence: {signal.confidence:.0%}")
+        logger.info(
+            "\nClassified as: %s\n  Symbol: %s\n  Confidence: %.0f%%",
+            signal.message_type.value,
+            signal.symbol,
+            signal.confidence * 100,
+        )
 
     def _log_trade_executed(self, result: dict) -> None:
         """Log executed trade details."""
-        print("\nTrade executed successfully!")
-        print(f"  Ticket: {result['ticket']}")
-        print(f"  Volume: {result['volume']}")
-        print(f"  Price: {result['price']}")
+        logger.info("\nTrade executed successfully!")
+        logger.info("  Ticket: %s", result["ticket"])
+        logger.info("  Volume: %s", result["volume"])
+        logger.info("  Price: %s", result["price"])
 
     def _record_trade(self, signal: TradeSignal, result: dict) -> None:
         """Record trade in history log."""
@@ -1907,9 +2410,7 @@ class TelegramMT5Bot:
     def stop(self) -> None:
         """Stop the bot and cleanup resources."""
         self._shutdown_requested = True
-
-        # Stop keep-alive task
-        self._stop_keep_alive()
+        self._shutdown_event.set()
 
         # Cancel all pending timeouts
         for task in self._pending_timeouts.values():
@@ -1925,20 +2426,53 @@ class TelegramMT5Bot:
         if self._telegram.is_connected():
             self._telegram.disconnect()
 
+        # Stop the debounced flusher, let any write it already started finish
+        # (cancelling the task doesn't stop the worker thread), then write the
+        # final state synchronously
+        if self._state_flusher_task is not None:
+            self._state_flusher_task.cancel()
+            self._state_flusher_task = None
+        self._state_pool.shutdown(wait=True)
         self.state.save()
+        self._mt5_pool.shutdown(wait=True)
         self.executor.disconnect()
-        print("Bot stopped.")
+        logger.info("Bot stopped.")
+
+
+def configure_logging() -> QueueListener:
+    """Route log records through a queue to stdout on a background thread.
+
+    Console writes (notably on Windows) are slow and flush per line; the queue
+    keeps them off the event loop. Messages are written bare so they read the
+    same as the rest of the bot's console output.
+
+    Returns:
+        The started listener; call stop() on shutdown to flush remaining records.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 async def main() -> None:
     """Main entry point."""
+    listener = configure_logging()
     bot = TelegramMT5Bot()
     try:
         await bot.start()
     except KeyboardInterrupt:
-        print("\nShutting down...")
+        logger.info("\nShutting down...")
     finally:
         bot.stop()
+        listener.stop()
 
 
 if __name__ == "__main__":
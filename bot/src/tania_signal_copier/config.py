@@ -7,17 +7,26 @@ with sensible defaults.
 
 import os
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file, unless the deployment has
+# already injected them and says so with TANIA_ENV_LOADED
+if not os.getenv("TANIA_ENV_LOADED"):
+    load_dotenv(override=False)
+    os.environ["TANIA_ENV_LOADED"] = "1"
 
 # Platform detection
 IS_WINDOWS = sys.platform == "win32"
 IS_MACOS = sys.platform == "darwin"
 
+# Entries kept by each SymbolConfig lookup memo. Symbols come from LLM output,
+# so the memos are bounded rather than growing with every new spelling.
+_SYMBOL_CACHE_SIZE = 256
+
 
 def _env_optional_float(name: str) -> float | None:
     raw = os.getenv(name, "")
@@ -29,8 +38,13 @@ def _env_optional_float(name: str) -> float | None:
         return None
 
 
+@lru_cache(maxsize=128)
 def _parse_channel(value: str) -> str | int:
-    """Parse a single channel value - return int if numeric, otherwise string."""
+    """Parse a single channel value - return int if numeric, otherwise string.
+
+    Cached, since the result is immutable and the same values are parsed again
+    whenever the channel list is re-read.
+    """
     value = value.strip()
     if not value:
         return ""
@@ -42,28 +56,32 @@ def _parse_channel(value: str) -> str | int:
 
 
 def _parse_channels(value: str) -> list[str | int]:
-    """Parse comma-separated channel values into a list."""
+    """Parse comma-separated channel values into a list, dropping duplicates."""
     if not value or not value.strip():
         return []
-    # Split by comma and parse each channel
-    channels = []
+    # Split by comma and parse each channel; a dict keeps first-seen order
+    # while skipping repeats, so each channel is resolved and watched once
+    channels: dict[str | int, None] = {}
     for ch in value.split(","):
         parsed = _parse_channel(ch)
         if parsed:  # Skip empty strings
-            channels.append(parsed)
-    return channels
+            channels[parsed] = None
+    return list(channels)
+
 
+# Parsed once at import, like the other env-derived defaults below; the tuple
+# is immutable so every TelegramConfig can share it
+_DEFAULT_CHANNELS: tuple[str | int, ...] = tuple(_parse_channels(os.getenv("TELEGRAM_CHANNEL", "")))
 
-@dataclass
+
+@dataclass(slots=True)
 class TelegramConfig:
     """Telegram API configuration."""
 
     api_id: int = int(os.getenv("TELEGRAM_API_ID", "0"))
     api_hash: str = os.getenv("TELEGRAM_API_HASH", "")
     # Support multiple channels (comma-separated)
-    channels: list[str | int] = field(
-        default_factory=lambda: _parse_channels(os.getenv("TELEGRAM_CHANNEL", ""))
-    )
+    channels: tuple[str | int, ...] = field(default_factory=lambda: _DEFAULT_CHANNELS)
     session_name: str = os.getenv("TELEGRAM_SESSION_NAME", "signal_bot_session")
 
     @property
@@ -72,7 +90,7 @@ class TelegramConfig:
         return self.channels[0] if self.channels else ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MT5Config:
     """MetaTrader 5 connection configuration."""
 
@@ -86,7 +104,7 @@ class MT5Config:
     path: str | None = os.getenv("MT5_PATH")  # Path to MT5 terminal (auto-detected if not set)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingConfig:
     """Trading parameters configuration."""
 
@@ -103,17 +121,22 @@ class TradingConfig:
     edit_window_seconds: int = int(os.getenv("EDIT_WINDOW_SECONDS", "1800"))
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM provider configuration."""
 
     provider: str = os.getenv("LLM_PROVIDER", "groq")  # "groq" or "cerebras"
     groq_model: str = os.getenv("GROQ_MODEL", "openai/gpt-oss-20b")
+    # "low" cuts time to first token for the short structured extraction
+    groq_reasoning_effort: str = os.getenv("GROQ_REASONING_EFFORT", "medium")
     cerebras_model: str = os.getenv("CEREBRAS_MODEL", "gpt-oss-120b")
-    max_tokens: int = int(os.getenv("LLM_MAX_TOKENS", "8192"))
+    # Covers the reasoning tokens plus the small JSON reply
+    max_tokens: int = int(os.getenv("LLM_MAX_TOKENS", "2048"))
+    # Provider requests allowed in flight at once; size to the account's rate limit
+    max_concurrency: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolConfig:
     """Symbol filtering and mapping configuration."""
 
@@ -121,38 +144,73 @@ class SymbolConfig:
     symbol_map: dict[str, str] = field(default_factory=lambda: {"XAUUSD": "XAUUSDb"})
     broker_suffix: str = "b"
 
+    # Lookup tables derived from the fields above, built once in __post_init__
+    _suffix_upper: str = field(init=False, repr=False, compare=False)
+    _suffix_len: int = field(init=False, repr=False, compare=False)
+    _allowed_base_symbols: frozenset[str] = field(init=False, repr=False, compare=False)
+    _broker_symbols: Callable[[str], str] = field(init=False, repr=False, compare=False)
+    _allowed_cache: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute symbol lookups, which run on every incoming signal."""
+        # Symbols are upper-cased before any suffix check, so compare against
+        # the upper-cased suffix instead of lower-casing both sides per call
+        self._suffix_upper = self.broker_suffix.upper()
+        self._suffix_len = len(self._suffix_upper)
+        self._allowed_cache = lru_cache(maxsize=_SYMBOL_CACHE_SIZE)(self._check_allowed)
+        self._allowed_base_symbols = frozenset(
+            self._normalize_base_symbol(item) for item in self.allowed_symbols
+        )
+        self._broker_symbols = lru_cache(maxsize=_SYMBOL_CACHE_SIZE)(self._resolve_broker_symbol)
+        # Seed with every name the config knows about, so lookups for configured
+        # symbols start out as cache hits
+        for item in (*self.allowed_symbols, *self.symbol_map):
+            self._broker_symbols(item)
+
     def _normalize_base_symbol(self, symbol: str) -> str:
         """Normalize symbol to its base form (without broker suffix)."""
         normalized = symbol.strip().upper()
-        suffix = self.broker_suffix.lower()
-        if normalized and normalized.lower().endswith(suffix):
-            return normalized[:-len(self.broker_suffix)]
+        if self._suffix_len and normalized.endswith(self._suffix_upper):
+            return normalized[: -self._suffix_len]
         return normalized
 
+    def _resolve_broker_symbol(self, symbol: str) -> str:
+        """Map a symbol to its broker-specific name (uncached).
+
+        The result is interned: it is resolved once and then passed to every
+        MT5 symbol call, so all of those calls share the one string object.
+        """
+        normalized_input = symbol.strip().upper()
+        mapped_symbol = self.symbol_map.get(normalized_input)
+        if mapped_symbol:
+            return sys.intern(mapped_symbol)
+
+        if normalized_input.endswith(self._suffix_upper):
+            return sys.intern(normalized_input)
+
+        return sys.intern(f"{normalized_input}{self.broker_suffix}")
+
+    def _check_allowed(self, symbol: str) -> bool:
+        """Check a symbol against the allowed list (uncached)."""
+        return self._normalize_base_symbol(symbol) in self._allowed_base_symbols
+
     def is_allowed(self, symbol: str) -> bool:
         """Check if a symbol is in the allowed list."""
         if not symbol:
             return False
-        allowed_base_symbols = {self._normalize_base_symbol(item) for item in self.allowed_symbols}
-        return self._normalize_base_symbol(symbol) in allowed_base_symbols
+
+        # Signals keep naming the same few symbols, so remember recent verdicts
+        return self._allowed_cache(symbol)
 
     def get_broker_symbol(self, symbol: str) -> str:
         """Get the broker-specific symbol name."""
         if not symbol:
             return symbol
 
-        normalized_input = symbol.strip().upper()
-        mapped_symbol = self.symbol_map.get(normalized_input)
-        if mapped_symbol:
-            return mapped_symbol
-
-        if normalized_input.lower().endswith(self.broker_suffix.lower()):
-            return normalized_input
-
-        return f"{normalized_input}{self.broker_suffix}"
+        return self._broker_symbols(symbol)
 
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """Main bot configuration combining all settings."""
 
@@ -8,17 +8,40 @@ Includes automatic reconnection to handle connection drops gracefully.
 """
 
 import contextlib
+import logging
 import time
 from collections.abc import Callable
 from datetime import UTC, datetime
 from functools import wraps
+from types import MappingProxyType
 from typing import Any, TypeVar
 
-from tania_signal_copier.models import OrderType, TradeConfig, TradeSignal
+from tania_signal_copier.models import (
+    BUY_ORDER_TYPES,
+    PENDING_ORDER_TYPES,
+    ModifyRequest,
+    OrderType,
+    TradeConfig,
+    TradeSignal,
+)
 from tania_signal_copier.mt5_adapter import MT5Adapter, create_mt5_adapter
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
+# OrderType -> MT5 order type code, built once from the adapter constants
+_MT5_ORDER_TYPES = MappingProxyType(
+    {
+        OrderType.BUY: MT5Adapter.ORDER_TYPE_BUY,
+        OrderType.SELL: MT5Adapter.ORDER_TYPE_SELL,
+        OrderType.BUY_LIMIT: MT5Adapter.ORDER_TYPE_BUY_LIMIT,
+        OrderType.SELL_LIMIT: MT5Adapter.ORDER_TYPE_SELL_LIMIT,
+        OrderType.BUY_STOP: MT5Adapter.ORDER_TYPE_BUY_STOP,
+        OrderType.SELL_STOP: MT5Adapter.ORDER_TYPE_SELL_STOP,
+    }
+)
+
 
 def with_reconnect[T](method: Callable[..., T]) -> Callable[..., T]:
     """Decorator that ensures connection before executing a method.
@@ -33,7 +56,7 @@ def with_reconnect[T](method: Callable[..., T]) -> Callable[..., T]:
             try:
                 return method(self, *args, **kwargs)
             except Exception as e:
-                print(f"Operation failed: {e}, attempting reconnect...")
+                logger.warning("Operation failed: %s, attempting reconnect...", e)
                 self.connected = False
 
         # Reconnect and retry
@@ -48,6 +71,9 @@ def with_reconnect[T](method: Callable[..., T]) -> Callable[..., T]:
             return 0.0  # type: ignore
         elif method_name in ("get_position", "get_symbol_info"):
             return None  # type: ignore
+        elif method_name == "get_positions_batch":
+            # Nothing was checked, so no ticket is confirmed open or closed
+            return {}  # type: ignore
         elif method_name == "is_position_profitable":
             return False  # type: ignore
         elif method_name == "get_current_price":
@@ -103,18 +129,21 @@ class MT5Executor:
         Returns:
             True if connection successful, False otherwise
         """
-        try:
-            self._mt5 = create_mt5_adapter()
-        except RuntimeError as e:
-            print(f"MT5 adapter creation failed: {e}")
-            return False
+        # The adapter is created once and re-initialized on reconnect; every
+        # adapter reconnects from scratch in initialize() after a shutdown()
+        if self._mt5 is None:
+            try:
+                self._mt5 = create_mt5_adapter()
+            except RuntimeError as e:
+                logger.warning("MT5 adapter creation failed: %s", e)
+                return False
 
         if not self._mt5.initialize():
-            print(f"MT5 initialize failed: {self._mt5.last_error()}")
+            logger.warning("MT5 initialize failed: %s", self._mt5.last_error())
             return False
 
         if not self._mt5.login(self._login, password=self._password, server=self._server):
-            print(f"MT5 login failed: {self._mt5.last_error()}")
+            logger.warning("MT5 login failed: %s", self._mt5.last_error())
             self._mt5.shutdown()
             return False
 
@@ -122,9 +151,11 @@ class MT5Executor:
         self._last_ping_time = time.time()
         account_info = self._mt5.account_info()
         if account_info:
-            print(f"Connected to MT5: {account_info.name}, Balance: {account_info.balance}")
+            logger.info(
+                "Connected to MT5: %s, Balance: %s", account_info.name, account_info.balance
+            )
         else:
-            print("Connected to MT5 (account info not available)")
+            logger.info("Connected to MT5 (account info not available)")
         return True
 
     def disconnect(self) -> None:
@@ -173,27 +204,28 @@ class MT5Executor:
         Returns:
             True if reconnection successful, False otherwise
         """
-        print("Attempting to reconnect to MT5...")
+        logger.info("Attempting to reconnect to MT5...")
 
-        # Clean up existing connection
+        # Clean up existing connection (connect() reuses the adapter)
         if self._mt5:
             with contextlib.suppress(Exception):
                 self._mt5.shutdown()
-            self._mt5 = None
         self.connected = False
 
         for attempt in range(1, self.max_reconnect_attempts + 1):
-            print(f"Reconnection attempt {attempt}/{self.max_reconnect_attempts}...")
+            logger.info("Reconnection attempt %s/%s...", attempt, self.max_reconnect_attempts)
 
             if self.connect():
-                print("Reconnection successful!")
+                logger.info("Reconnection successful!")
                 return True
 
             if attempt < self.max_reconnect_attempts:
-                print(f"Reconnection failed, waiting {self.reconnect_delay}s before retry...")
+                logger.warning(
+                    "Reconnection failed, waiting %ss before retry...", self.reconnect_delay
+                )
                 time.sleep(self.reconnect_delay)
 
-        print("All reconnection attempts failed!")
+        logger.warning("All reconnection attempts failed!")
         return False
 
     def health_check(self) -> dict:
@@ -288,19 +320,48 @@ class MT5Executor:
 
         positions = self._mt5.positions_get(ticket=ticket)
         if positions and len(positions) > 0:
-            pos = positions[0]
-            return {
-                "ticket": pos.ticket,
-                "symbol": pos.symbol,
-                "type": pos.type,
-                "volume": pos.volume,
-                "price_open": pos.price_open,
-                "sl": pos.sl,
-                "tp": pos.tp,
-                "profit": pos.profit,
-            }
+            return self._position_to_dict(positions[0])
         return None
 
+    @with_reconnect
+    def get_positions_batch(self, tickets: list[int]) -> dict[int, dict | None]:
+        """Get details for several positions with a single terminal query.
+
+        Auto-reconnects if connection is lost.
+
+        Args:
+            tickets: The MT5 position tickets to look up
+
+        Returns:
+            Dict mapping each ticket to its position dict, or None if not open.
+            Tickets that could not be checked (no connection) are left out, so
+            a None value always means MT5 confirmed the position is gone.
+        """
+        if not self._mt5:
+            return {}
+
+        wanted = set(tickets)
+        found = {
+            pos.ticket: self._position_to_dict(pos)
+            for pos in self._mt5.positions_get()
+            if pos.ticket in wanted
+        }
+        return {ticket: found.get(ticket) for ticket in tickets}
+
+    @staticmethod
+    def _position_to_dict(pos: Any) -> dict:
+        """Convert an MT5 position record to the dict shape used by the bot."""
+        return {
+            "ticket": pos.ticket,
+            "symbol": pos.symbol,
+            "type": pos.type,
+            "volume": pos.volume,
+            "price_open": pos.price_open,
+            "sl": pos.sl,
+            "tp": pos.tp,
+            "profit": pos.profit,
+        }
+
     @with_reconnect
     def is_position_profitable(self, ticket: int) -> bool:
         """Check if position is in profit.
@@ -402,7 +463,9 @@ class MT5Executor:
         sym_data = self.get_symbol_info(symbol_to_find)
         if not sym_data and broker_symbol and broker_symbol != signal.symbol:
             # Broker symbol not found, try original signal symbol
-            print(f"    [INFO] Broker symbol {broker_symbol} not found, trying {signal.symbol}")
+            logger.info(
+                "    [INFO] Broker symbol %s not found, trying %s", broker_symbol, signal.symbol
+            )
             sym_data = self.get_symbol_info(signal.symbol)
         if not sym_data:
             return {"success": False, "error": f"Symbol {symbol_to_find} not found"}
@@ -424,7 +487,7 @@ class MT5Executor:
             return {"success": False, "error": "Could not get current price"}
 
         # Determine execution price for validation
-        is_buy = signal.order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
+        is_buy = signal.order_type in BUY_ORDER_TYPES
         exec_price = tick.ask if is_buy else tick.bid
 
         # Find a valid TP (trying each one, with 1:1 RR fallback)
@@ -434,7 +497,7 @@ class MT5Executor:
                 is_buy, exec_price, signal.take_profits, signal.stop_loss
             )
             if tp_warning:
-                print(f"    [WARNING] {tp_warning}")
+                logger.warning("    [WARNING] %s", tp_warning)
 
         # Validate SL/TP before building order
         validated_sl, validated_tp, warnings = self.validate_sl_tp(
@@ -443,7 +506,7 @@ class MT5Executor:
 
         # Log any validation warnings
         for w in warnings:
-            print(f"    [WARNING] {w}")
+            logger.warning("    [WARNING] %s", w)
 
         # Update signal with validated values for order building
         # Note: We need to modify the signal temporarily for _build_order_request
@@ -458,25 +521,25 @@ class MT5Executor:
         # Restore original values (in case signal is used elsewhere)
         signal.stop_loss = original_sl
         signal.take_profits = original_tps
-        print(f"    [DEBUG] Execute request: {request}")
+        logger.info("    [DEBUG] Execute request: %s", request)
 
         # Verify connection before sending
         if not self._mt5.ping():
-            print("    [DEBUG] Connection lost before execute, attempting reconnect...")
+            logger.info("    [DEBUG] Connection lost before execute, attempting reconnect...")
             if not self._reconnect():
                 return {"success": False, "error": "Connection lost and reconnect failed"}
 
         # Check order first to get detailed validation
         check_result = self._mt5.order_check(request)
-        print(f"    [DEBUG] order_check result: {check_result}")
+        logger.info("    [DEBUG] order_check result: %s", check_result)
 
         # Send the order
         result = self._mt5.order_send(request)
-        print(f"    [DEBUG] order_send result: {result}")
+        logger.info("    [DEBUG] order_send result: %s", result)
 
         if result is None:
             last_error = self._mt5.last_error()
-            print(f"    [DEBUG] Last error: {last_error}")
+            logger.info("    [DEBUG] Last error: %s", last_error)
             return {
                 "success": False,
                 "error": f"Order send failed (None), last_error: {last_error}",
@@ -485,7 +548,11 @@ class MT5Executor:
 
         if result.retcode != self._mt5.TRADE_RETCODE_DONE:
             error_msg = result.comment if result.comment else f"Retcode {result.retcode}"
-            print(f"    [DEBUG] Order failed - retcode: {result.retcode}, comment: {result.comment}")
+            logger.warning(
+                "    [DEBUG] Order failed - retcode: %s, comment: %s",
+                result.retcode,
+                result.comment,
+            )
             return {
                 "success": False,
                 "error": f"Order failed: {error_msg}",
@@ -506,10 +573,10 @@ class MT5Executor:
                 tp_mismatch = expected_tp and abs(actual_tp - expected_tp) > 0.01
 
                 if sl_mismatch or tp_mismatch:
-                    print("    [WARNING] SL/TP mismatch after execution!")
-                    print(f"    [WARNING] Expected SL={expected_sl}, TP={expected_tp}")
-                    print(f"    [WARNING] Actual SL={actual_sl}, TP={actual_tp}")
-                    print("    [WARNING] Attempting to fix via modify_position...")
+                    logger.warning("    [WARNING] SL/TP mismatch after execution!")
+                    logger.warning("    [WARNING] Expected SL=%s, TP=%s", expected_sl, expected_tp)
+                    logger.warning("    [WARNING] Actual SL=%s, TP=%s", actual_sl, actual_tp)
+                    logger.warning("    [WARNING] Attempting to fix via modify_position...")
 
                     # Try to set the correct SL/TP
                     fix_result = self.modify_position(
@@ -518,9 +585,9 @@ class MT5Executor:
                         tp=expected_tp if tp_mismatch else None,
                     )
                     if fix_result["success"]:
-                        print("    [WARNING] SL/TP corrected successfully")
+                        logger.warning("    [WARNING] SL/TP corrected successfully")
                     else:
-                        print(f"    [ERROR] Failed to correct SL/TP: {fix_result['error']}")
+                        logger.error("    [ERROR] Failed to correct SL/TP: %s", fix_result["error"])
 
         return {
             "success": True,
@@ -584,9 +651,18 @@ class MT5Executor:
             results[config.role.value] = result
 
             if result["success"]:
-                print(f"  {config.role.value.upper()} trade opened: ticket {result['ticket']}, TP={config.tp}")
+                logger.info(
+                    "  %s trade opened: ticket %s, TP=%s",
+                    config.role.value.upper(),
+                    result["ticket"],
+                    config.tp,
+                )
             else:
-                print(f"  {config.role.value.upper()} trade failed: {result.get('error', 'Unknown error')}")
+                logger.warning(
+                    "  %s trade failed: %s",
+                    config.role.value.upper(),
+                    result.get("error", "Unknown error"),
+                )
 
         return results
 
@@ -603,7 +679,7 @@ class MT5Executor:
         Returns:
             Result dict with success status
         """
-        print(f"  Moving SL to breakeven ({entry_price}) for ticket {ticket}")
+        logger.info("  Moving SL to breakeven (%s) for ticket %s", entry_price, ticket)
         return self.modify_position(ticket, sl=entry_price)
 
     def _build_order_request(
@@ -619,7 +695,7 @@ class MT5Executor:
         """
         assert self._mt5 is not None  # Caller ensures this
 
-        is_buy = signal.order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
+        is_buy = signal.order_type in BUY_ORDER_TYPES
 
         # Determine filling mode from symbol info
         sym_info = self._mt5.symbol_info(symbol)
@@ -634,7 +710,7 @@ class MT5Executor:
             "action": int(self._mt5.TRADE_ACTION_DEAL),
             "symbol": str(symbol),
             "volume": float(lots),
-            "type": int(self._mt5.ORDER_TYPE_BUY if signal.order_type == OrderType.BUY else self._mt5.ORDER_TYPE_SELL),
+            "type": _MT5_ORDER_TYPES[signal.order_type],
             "price": float(tick.ask if is_buy else tick.bid),
             "deviation": 20,
             "magic": 123456,
@@ -654,26 +730,13 @@ class MT5Executor:
             request["tp"] = round(float(tp1), digits)
 
         # Handle pending orders
-        if signal.order_type in [
-            OrderType.BUY_LIMIT,
-            OrderType.SELL_LIMIT,
-            OrderType.BUY_STOP,
-            OrderType.SELL_STOP,
-        ]:
+        if signal.order_type in PENDING_ORDER_TYPES:
             request["action"] = int(self._mt5.TRADE_ACTION_PENDING)
 
             # Ensure entry price is properly rounded to symbol digits
             entry_price = float(signal.entry_price) if signal.entry_price else float(tick.ask if is_buy else tick.bid)
             request["price"] = float(round(entry_price, digits))
 
-            type_map = {
-                OrderType.BUY_LIMIT: self._mt5.ORDER_TYPE_BUY_LIMIT,
-                OrderType.SELL_LIMIT: self._mt5.ORDER_TYPE_SELL_LIMIT,
-                OrderType.BUY_STOP: self._mt5.ORDER_TYPE_BUY_STOP,
-                OrderType.SELL_STOP: self._mt5.ORDER_TYPE_SELL_STOP,
-            }
-            request["type"] = int(type_map[signal.order_type])
-
             # Remove deviation for pending orders (not applicable)
             request.pop("deviation", None)
 
@@ -730,27 +793,31 @@ class MT5Executor:
             "magic": 123456,
         }
 
-        print(f"    [DEBUG] Modify request: {request}")
-        print(f"    [DEBUG] Position info: {pos}")
+        logger.info("    [DEBUG] Modify request: %s", request)
+        logger.info("    [DEBUG] Position info: %s", pos)
 
         # Verify connection before sending
         if not self._mt5.ping():
-            print("    [DEBUG] Connection lost, attempting reconnect...")
+            logger.info("    [DEBUG] Connection lost, attempting reconnect...")
             if not self._reconnect():
                 return {"success": False, "error": "Connection lost and reconnect failed"}
 
         result = self._mt5.order_send(request)
-        print(f"    [DEBUG] order_send result: {result}")
+        logger.info("    [DEBUG] order_send result: %s", result)
 
         if result is None:
             # Try to get more info about what went wrong
             last_error = self._mt5.last_error()
-            print(f"    [DEBUG] Last error: {last_error}")
+            logger.info("    [DEBUG] Last error: %s", last_error)
             return {"success": False, "error": f"order_send returned None, last_error: {last_error}"}
 
         if result.retcode != self._mt5.TRADE_RETCODE_DONE:
             error_msg = result.comment if result.comment else f"Retcode {result.retcode}"
-            print(f"    [DEBUG] Modify failed - retcode: {result.retcode}, comment: {result.comment}")
+            logger.warning(
+                "    [DEBUG] Modify failed - retcode: %s, comment: %s",
+                result.retcode,
+                result.comment,
+            )
             return {
                 "success": False,
                 "error": error_msg,
@@ -823,6 +890,50 @@ class MT5Executor:
 
         return {"success": True, "ticket": ticket, "closed_at": price}
 
+    def modify_positions_batch(self, requests: list[ModifyRequest]) -> list[dict]:
+        """Modify SL/TP of several positions in one executor call.
+
+        MT5 has no multi-order send, so the requests go out back to back; callers
+        offloading to a worker thread pay one hand-off for the whole batch. Each
+        request keeps modify_position's reconnect handling, so a failure midway
+        never re-sends the modifications that already went through, and a
+        request that raises gets a failure result instead of discarding the
+        results of the others.
+
+        Args:
+            requests: The modifications to apply
+
+        Returns:
+            One result dict per request, in request order
+        """
+        results = []
+        for req in requests:
+            try:
+                results.append(self.modify_position(req.ticket, sl=req.sl, tp=req.tp))
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+        return results
+
+    def close_positions_batch(self, tickets: list[int]) -> list[dict]:
+        """Close several positions in one executor call.
+
+        A close that raises gets a failure result, so the closes that already
+        went through are still reported.
+
+        Args:
+            tickets: The MT5 position tickets to close
+
+        Returns:
+            One result dict per ticket, in ticket order
+        """
+        results = []
+        for ticket in tickets:
+            try:
+                results.append(self.close_position(ticket))
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+        return results
+
     @with_reconnect
     def partial_close(self, ticket: int, percentage: int) -> dict:
         """Close a percentage of an open position.
@@ -954,6 +1065,33 @@ class MT5Executor:
         Returns:
             Calculated stop loss price
         """
+        return self.calculate_default_sl_batch(
+            symbol, [order_type], [entry_price], lot_size, max_risk_percent
+        )[0]
+
+    def calculate_default_sl_batch(
+        self,
+        symbol: str,
+        order_types: list[OrderType],
+        entry_prices: list[float],
+        lot_size: float,
+        max_risk_percent: float = 0.10,
+    ) -> list[float]:
+        """Calculate default SLs for several entries on the same symbol.
+
+        The balance and symbol info are fetched once; every entry shares the
+        same risk-based SL distance.
+
+        Args:
+            symbol: The trading symbol
+            order_types: Buy or Sell direction of each entry
+            entry_prices: The entry prices, parallel to order_types
+            lot_size: The position lot size
+            max_risk_percent: Maximum risk as fraction of balance (default 10%)
+
+        Returns:
+            Calculated stop loss price for each entry, in input order
+        """
         balance = self.get_account_balance()
         max_risk = balance * max_risk_percent
 
@@ -961,22 +1099,22 @@ class MT5Executor:
         sym_data = self.get_symbol_info(symbol)
         if not sym_data:
             # Fallback values
-            fallback = 5.0 if "XAU" in symbol.upper() else 0.0050
-            is_buy = order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
-            return entry_price - fallback if is_buy else entry_price + fallback
-
-        symbol_info = sym_data["info"]
-        point = symbol_info.point
-        tick_value = symbol_info.trade_tick_value
-
-        # Calculate SL distance
-        if lot_size * tick_value > 0:
-            sl_distance = (max_risk * point) / (lot_size * tick_value)
+            sl_distance = 5.0 if "XAU" in symbol.upper() else 0.0050
         else:
-            sl_distance = 500 * point  # Fallback
+            symbol_info = sym_data["info"]
+            point = symbol_info.point
+            tick_value = symbol_info.trade_tick_value
 
-        is_buy = order_type in [OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP]
-        return entry_price - sl_distance if is_buy else entry_price + sl_distance
+            # Calculate SL distance
+            if lot_size * tick_value > 0:
+                sl_distance = (max_risk * point) / (lot_size * tick_value)
+            else:
+                sl_distance = 500 * point  # Fallback
+
+        return [
+            entry_price - sl_distance if order_type in BUY_ORDER_TYPES else entry_price + sl_distance
+            for order_type, entry_price in zip(order_types, entry_prices, strict=True)
+        ]
 
     def validate_sl_tp(
         self,
@@ -1,11 +1,14 @@
-"""Base protocol for LLM providers."""
+"""Base class for LLM providers."""
 
-from typing import Protocol
+from abc import ABC, abstractmethod
 
 
-class LLMProvider(Protocol):
-    """Protocol defining the interface for LLM providers."""
+class LLMProvider(ABC):
+    """Abstract base class defining the interface for LLM providers."""
 
+    __slots__ = ()
+
+    @abstractmethod
     async def query(self, system_prompt: str, user_message: str) -> str:
         """Query the LLM and return the response text.
 
@@ -16,4 +19,3 @@ class LLMProvider(Protocol):
         Returns:
             The raw response text from the LLM
         """
-        ...
@@ -1,5 +1,6 @@
 """Cerebras LLM provider implementation."""
 
+import functools
 from typing import Any
 
 from cerebras.cloud.sdk import AsyncCerebras
@@ -7,22 +8,39 @@ from cerebras.cloud.sdk import AsyncCerebras
 from tania_signal_copier.llm.base import LLMProvider
 
 
+@functools.cache
+def _shared_client() -> AsyncCerebras:
+    """Return the process-wide AsyncCerebras client, so its connection pool is reused."""
+    return AsyncCerebras()
+
+
 class CerebrasProvider(LLMProvider):
     """LLM provider using Cerebras's API.
 
     Reads CEREBRAS_API_KEY from environment automatically.
     """
 
-    def __init__(self, model: str = "gpt-oss-120b", max_tokens: int = 8192) -> None:
+    __slots__ = ("_request_kwargs", "client", "max_tokens", "model")
+
+    def __init__(self, model: str = "gpt-oss-120b", max_tokens: int = 2048) -> None:
         """Initialize Cerebras provider.
 
         Args:
             model: The model to use (default: gpt-oss-120b)
-            max_tokens: Maximum completion tokens (default: 8192)
+            max_tokens: Maximum completion tokens (default: 2048)
         """
-        self.client = AsyncCerebras()
+        self.client = _shared_client()
         self.model = model
         self.max_tokens = max_tokens
+        # Everything but the messages is the same on every query, so build it once
+        self._request_kwargs: dict[str, Any] = {
+            "model": model,
+            "temperature": 0.2,
+            "max_completion_tokens": max_tokens,
+            "top_p": 1,
+            # Both prompts ask for a single JSON object; JSON mode enforces it
+            "response_format": {"type": "json_object"},
+        }
 
     async def query(self, system_prompt: str, user_message: str) -> str:
         """Query Cerebras AI and get the response text.
@@ -34,24 +52,14 @@ class CerebrasProvider(LLMProvider):
         Returns:
             The raw response text from Cerebras
         """
-        # Use type: ignore because Cerebras SDK type stubs don't properly
-        # annotate the async iterator returned when stream=True
-        stream: Any = await self.client.chat.completions.create(
-            model=self.model,
+        # Not streamed: the parser needs the whole JSON object before it can use it.
+        # Typed Any because the Cerebras SDK stubs return a union with the stream type
+        completion: Any = await self.client.chat.completions.create(
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message},
             ],
-            temperature=0.2,
-            max_completion_tokens=self.max_tokens,
-            top_p=1,
-            stream=True,
+            **self._request_kwargs,
         )
 
-        result_text = ""
-        async for chunk in stream:
-            content = chunk.choices[0].delta.content
-            if content:
-                result_text += content
-
-        return result_text.strip()
+        return (completion.choices[0].message.content or "").strip()
@@ -5,8 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from tania_signal_copier.llm.base import LLMProvider
-from tania_signal_copier.llm.cerebras_provider import CerebrasProvider
-from tania_signal_copier.llm.groq_provider import GroqProvider
 
 if TYPE_CHECKING:
     from tania_signal_copier.config import LLMConfig
@@ -24,12 +22,18 @@ def create_llm_provider(llm_config: LLMConfig) -> LLMProvider:
     Raises:
         ValueError: If provider is not recognized
     """
+    # Provider modules are imported on demand so only the configured SDK is loaded
     if llm_config.provider == "groq":
+        from tania_signal_copier.llm.groq_provider import GroqProvider
+
         return GroqProvider(
             model=llm_config.groq_model,
             max_tokens=llm_config.max_tokens,
+            reasoning_effort=llm_config.groq_reasoning_effort,
         )
     elif llm_config.provider == "cerebras":
+        from tania_signal_copier.llm.cerebras_provider import CerebrasProvider
+
         return CerebrasProvider(
             model=llm_config.cerebras_model,
             max_tokens=llm_config.max_tokens,
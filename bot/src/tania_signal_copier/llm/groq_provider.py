@@ -1,26 +1,53 @@
 """Groq LLM provider implementation."""
 
+import functools
+from typing import Any
+
 from groq import AsyncGroq
 
 from tania_signal_copier.llm.base import LLMProvider
 
 
+@functools.cache
+def _shared_client() -> AsyncGroq:
+    """Return the process-wide AsyncGroq client, so its connection pool is reused."""
+    return AsyncGroq()
+
+
 class GroqProvider(LLMProvider):
     """LLM provider using Groq's API.
 
     Reads GROQ_API_KEY from environment automatically.
     """
 
-    def __init__(self, model: str = "openai/gpt-oss-20b", max_tokens: int = 8192) -> None:
+    __slots__ = ("_request_kwargs", "client", "max_tokens", "model")
+
+    def __init__(
+        self,
+        model: str = "openai/gpt-oss-20b",
+        max_tokens: int = 2048,
+        reasoning_effort: str = "medium",
+    ) -> None:
         """Initialize Groq provider.
 
         Args:
             model: The model to use (default: openai/gpt-oss-20b)
-            max_tokens: Maximum completion tokens (default: 8192)
+            max_tokens: Maximum completion tokens (default: 2048)
+            reasoning_effort: Reasoning effort for reasoning models (default: medium)
         """
-        self.client = AsyncGroq()
+        self.client = _shared_client()
         self.model = model
         self.max_tokens = max_tokens
+        # Everything but the messages is the same on every query, so build it once
+        self._request_kwargs: dict[str, Any] = {
+            "model": model,
+            "temperature": 1,
+            "max_completion_tokens": max_tokens,
+            "top_p": 1,
+            "reasoning_effort": reasoning_effort,
+            # Both prompts ask for a single JSON object; JSON mode enforces it
+            "response_format": {"type": "json_object"},
+        }
 
     async def query(self, system_prompt: str, user_message: str) -> str:
         """Query Groq AI and get the response text.
@@ -32,23 +59,13 @@ class GroqProvider(LLMProvider):
         Returns:
             The raw response text from Groq
         """
+        # Not streamed: the parser needs the whole JSON object before it can use it
         completion = await self.client.chat.completions.create(
-            model=self.model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message},
             ],
-            temperature=1,
-            max_completion_tokens=self.max_tokens,
-            top_p=1,
-            reasoning_effort="medium",
-            stream=True,
+            **self._request_kwargs,
         )
 
-        result_text = ""
-        async for chunk in completion:
-            content = chunk.choices[0].delta.content
-            if content:
-                result_text += content
-
-        return result_text.strip()
+        return (completion.choices[0].message.content or "").strip()
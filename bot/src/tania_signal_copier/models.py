@@ -7,6 +7,7 @@ This module contains all data classes and enums used throughout the application.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 
 class OrderType(Enum):
@@ -20,6 +21,16 @@ class OrderType(Enum):
     SELL_STOP = "sell_stop"
 
 
+# Order types that open long positions, for direction checks
+BUY_ORDER_TYPES: frozenset[OrderType] = frozenset(
+    (OrderType.BUY, OrderType.BUY_LIMIT, OrderType.BUY_STOP)
+)
+# Limit/stop orders, which rest on the book and need an entry price
+PENDING_ORDER_TYPES: frozenset[OrderType] = frozenset(
+    (OrderType.BUY_LIMIT, OrderType.SELL_LIMIT, OrderType.BUY_STOP, OrderType.SELL_STOP)
+)
+
+
 class MessageType(Enum):
     """Classification of incoming Telegram messages."""
 
@@ -50,6 +61,13 @@ class TradeRole(Enum):
     SINGLE = "single"  # Legacy single trade (re-entry)
 
 
+# Value -> member maps for state loading; a dict lookup skips Enum.__call__.
+# The parser and bot also use the order type map on raw LLM output.
+ORDER_TYPE_BY_VALUE: dict[str, OrderType] = {m.value: m for m in OrderType}
+_POSITION_STATUS_BY_VALUE: dict[str, PositionStatus] = {m.value: m for m in PositionStatus}
+_TRADE_ROLE_BY_VALUE: dict[str, TradeRole] = {m.value: m for m in TradeRole}
+
+
 class TradeActionType(Enum):
     """Actions that a strategy can request."""
 
@@ -76,7 +94,7 @@ class ActionType(Enum):
     RE_ENTRY = "re_entry"  # Close losing position and re-enter
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAction:
     """A single action parsed from a signal message.
 
@@ -108,7 +126,7 @@ class ParsedAction:
     re_entry_price_max: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """Parsed trade signal from Telegram message.
 
@@ -148,7 +166,7 @@ class TradeSignal:
     actions: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeConfig:
     """Configuration for a trade to be opened by the strategy."""
 
@@ -159,7 +177,7 @@ class TradeConfig:
     lot_multiplier: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeAction:
     """An action requested by the strategy for a specific trade role."""
 
@@ -168,7 +186,33 @@ class TradeAction:
     value: float | None = None  # e.g., new SL price for MODIFY_SL
 
 
-@dataclass
+@dataclass(slots=True)
+class ModifyRequest:
+    """SL/TP change for one position, sent as part of a batch modification."""
+
+    ticket: int
+    sl: float | None = None
+    tp: float | None = None
+
+
+@lru_cache(maxsize=256)
+def _format_opened_at(value: datetime) -> str:
+    """Format an opened_at timestamp for the state file.
+
+    Every save re-serializes every tracked position, but a position's opened_at
+    never changes, so each distinct timestamp is only formatted once. The bot
+    stamps positions with naive local times, which keeps equal keys identical.
+    """
+    return value.isoformat()
+
+
+@lru_cache(maxsize=256)
+def _parse_opened_at(value: str) -> datetime:
+    """Parse an opened_at timestamp from the state file (cached; datetimes are immutable)."""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class TrackedPosition:
     """Tracks an open position linked to Telegram signals.
 
@@ -187,13 +231,24 @@ class TrackedPosition:
     opened_at: datetime
     is_complete: bool
     status: PositionStatus
-    tps_hit: list[int] = field(default_factory=list)  # TP numbers already hit
+    tps_hit_mask: int = 0  # Bit n set once TP n has been hit
     role: TradeRole = TradeRole.SINGLE  # Default for backward compat
 
     # Original signal data for edit detection
     original_message_text: str = ""
     original_stop_loss: float | None = None
-    original_take_profits: list[float] = field(default_factory=list)
+    # Immutable record of the signal's TPs; json encodes the tuple as a list
+    original_take_profits: tuple[float, ...] = ()
+
+    @property
+    def tps_hit(self) -> list[int]:
+        """TP numbers already hit, in ascending order."""
+        mask = self.tps_hit_mask
+        return [n for n in range(mask.bit_length()) if mask >> n & 1]
+
+    def mark_tp_hit(self, tp_number: int) -> None:
+        """Record that TP number tp_number has been hit."""
+        self.tps_hit_mask |= 1 << tp_number
 
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
@@ -206,9 +261,11 @@ class TrackedPosition:
             "stop_loss": self.stop_loss,
             "take_profits": self.take_profits,
             "lot_size": self.lot_size,
-            "opened_at": self.opened_at.isoformat(),
+            "opened_at": _format_opened_at(self.opened_at),
             "is_complete": self.is_complete,
             "status": self.status.value,
+            "tps_hit_mask": self.tps_hit_mask,
+            # Still written for builds that only read the v3 list form
             "tps_hit": self.tps_hit,
             "role": self.role.value,
             # Original signal data for edit detection
@@ -221,38 +278,41 @@ class TrackedPosition:
     def from_dict(cls, data: dict) -> "TrackedPosition":
         """Deserialize from dictionary."""
         # Handle role with backward compatibility
-        role_str = data.get("role", "single")
-        try:
-            role = TradeRole(role_str)
-        except ValueError:
-            role = TradeRole.SINGLE
+        role = _TRADE_ROLE_BY_VALUE.get(data.get("role", "single"), TradeRole.SINGLE)
 
         # Get current values for fallback (backward compat for v2 state)
         stop_loss = data.get("stop_loss")
         take_profits = data.get("take_profits", [])
 
+        # Older state files store the hit TPs as a list of numbers
+        tps_hit_mask = data.get("tps_hit_mask")
+        if tps_hit_mask is None:
+            tps_hit_mask = 0
+            for tp_number in data.get("tps_hit", ()):
+                tps_hit_mask |= 1 << tp_number
+
         return cls(
             telegram_msg_id=data["telegram_msg_id"],
             mt5_ticket=data["mt5_ticket"],
             symbol=data["symbol"],
-            order_type=OrderType(data["order_type"]),
+            order_type=ORDER_TYPE_BY_VALUE[data["order_type"]],
             entry_price=data["entry_price"],
             stop_loss=stop_loss,
             take_profits=take_profits,
             lot_size=data["lot_size"],
-            opened_at=datetime.fromisoformat(data["opened_at"]),
+            opened_at=_parse_opened_at(data["opened_at"]),
             is_complete=data["is_complete"],
-            status=PositionStatus(data["status"]),
-            tps_hit=data.get("tps_hit", []),
+            status=_POSITION_STATUS_BY_VALUE[data["status"]],
+            tps_hit_mask=tps_hit_mask,
             role=role,
             # Original signal data - fallback to current values for v2 state
             original_message_text=data.get("original_message_text", ""),
             original_stop_loss=data.get("original_stop_loss", stop_loss),
-            original_take_profits=data.get("original_take_profits", take_profits.copy()),
+            original_take_profits=tuple(data.get("original_take_profits", take_profits)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DualPosition:
     """Container for dual-trade positions linked to a single signal.
 
@@ -262,24 +322,69 @@ class DualPosition:
     telegram_msg_id: int
     scalp: TrackedPosition | None = None
     runner: TrackedPosition | None = None
+    # Cached min(opened_at) across positions, maintained by set_position()
+    earliest_opened_at: datetime | None = field(default=None, init=False, repr=False, compare=False)
+    # Latched is_closed result (CLOSED is terminal), cleared by set_position()
+    _all_closed: bool = field(default=False, init=False, repr=False, compare=False)
+    # Cached all_positions tuple, rebuilt by set_position()
+    _positions: tuple[TrackedPosition, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compute cached metadata for positions passed to the constructor."""
+        self._positions = tuple(p for p in (self.scalp, self.runner) if p is not None)
+        opened = [p.opened_at for p in self._positions]
+        self.earliest_opened_at = min(opened) if opened else None
+
+    def set_position(self, position: TrackedPosition, role: TradeRole) -> None:
+        """Assign a position to the slot for its role.
+
+        Args:
+            position: The position to store
+            role: RUNNER goes to the runner slot; SCALP and SINGLE to the scalp slot
+        """
+        if role == TradeRole.RUNNER:
+            self.runner = position
+        else:
+            self.scalp = position
+        self._positions = tuple(p for p in (self.scalp, self.runner) if p is not None)
+
+        if self.earliest_opened_at is None or position.opened_at < self.earliest_opened_at:
+            self.earliest_opened_at = position.opened_at
+        self._all_closed = False
 
     @property
-    def all_positions(self) -> list[TrackedPosition]:
-        """Return all non-None positions."""
-        return [p for p in [self.scalp, self.runner] if p is not None]
+    def all_positions(self) -> tuple[TrackedPosition, ...]:
+        """Return all non-None positions.
+
+        The tuple is cached; scalp and runner must be reassigned through
+        set_position() so it stays current.
+        """
+        return self._positions
 
     @property
-    def all_tickets(self) -> list[int]:
+    def all_tickets(self) -> tuple[int, ...]:
         """Return all MT5 tickets."""
-        return [p.mt5_ticket for p in self.all_positions]
+        return tuple(p.mt5_ticket for p in self._positions)
 
     @property
     def is_closed(self) -> bool:
-        """Check if all positions are closed."""
-        positions = self.all_positions
-        if not positions:
+        """Check if all positions are closed.
+
+        A True result with positions present is latched: closed positions never
+        reopen, so only set_position() can make the dual open again.
+        """
+        if self._all_closed:
+            return True
+        scalp, runner = self.scalp, self.runner
+        if scalp is None and runner is None:
             return True
-        return all(p.status == PositionStatus.CLOSED for p in positions)
+        # Two fixed slots: test them directly, by identity (members are singletons)
+        self._all_closed = (scalp is None or scalp.status is PositionStatus.CLOSED) and (
+            runner is None or runner.status is PositionStatus.CLOSED
+        )
+        return self._all_closed
 
     def get_by_role(self, role: TradeRole) -> TrackedPosition | None:
         """Get position by role."""
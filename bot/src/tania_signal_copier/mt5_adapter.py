@@ -25,9 +25,12 @@ Linux Setup:
 
 from __future__ import annotations
 
+import importlib
+import logging
 import os
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 # Platform detection
@@ -35,10 +38,29 @@ IS_WINDOWS = sys.platform == "win32"
 IS_MACOS = sys.platform == "darwin"
 IS_LINUX = sys.platform == "linux"
 
+logger = logging.getLogger(__name__)
+
+
+def _optional_import(name: str) -> Any:
+    """Import a module by name, returning None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Each platform's MT5 binding, imported once at module load (None when it is not
+# installed or belongs to another platform, matching the pyproject markers)
+_MT5_NATIVE: Any = _optional_import("MetaTrader5") if IS_WINDOWS else None
+_SILICON_MT5: Any = _optional_import("siliconmetatrader5") if IS_MACOS else None
+_RPYC: Any = _optional_import("rpyc") if not (IS_WINDOWS or IS_MACOS) else None
+
 
 class MT5AdapterBase(ABC):
     """Abstract base class for MT5 adapters."""
 
+    __slots__ = ()
+
     # MT5 constants (shared across all implementations)
     TRADE_ACTION_DEAL = 1
     TRADE_ACTION_PENDING = 5
@@ -127,12 +149,14 @@ class MT5AdapterBase(ABC):
         """Get total number of open positions."""
         ...
 
+    # Collection getters return a Sequence: the native binding hands back tuples,
+    # which are returned as-is, while the remote adapters return local lists
     @abstractmethod
     def positions_get(
         self,
         symbol: str | None = None,
         ticket: int | None = None,
-    ) -> list[Any]:
+    ) -> Sequence[Any]:
         """Get open positions."""
         ...
 
@@ -141,7 +165,7 @@ class MT5AdapterBase(ABC):
         self,
         symbol: str | None = None,
         ticket: int | None = None,
-    ) -> list[Any]:
+    ) -> Sequence[Any]:
         """Get pending orders."""
         ...
 
@@ -151,7 +175,7 @@ class MT5AdapterBase(ABC):
         date_from: Any = None,
         date_to: Any = None,
         position: int | None = None,
-    ) -> list[Any]:
+    ) -> Sequence[Any]:
         """Get history deals."""
         ...
 
@@ -161,7 +185,7 @@ class MT5AdapterBase(ABC):
         ...
 
     @abstractmethod
-    def symbols_get(self, group: str | None = None) -> list[Any]:
+    def symbols_get(self, group: str | None = None) -> Sequence[Any]:
         """Get all available symbols."""
         ...
 
@@ -169,6 +193,8 @@ class MT5AdapterBase(ABC):
 class WindowsMT5Adapter(MT5AdapterBase):
     """MetaTrader 5 adapter for Windows using native MetaTrader5 package."""
 
+    __slots__ = ("_initialized", "_mt5", "path", "portable", "timeout")
+
     def __init__(
         self,
         path: str | None = None,
@@ -186,21 +212,23 @@ class WindowsMT5Adapter(MT5AdapterBase):
         self.timeout = timeout
         self.portable = portable
         self._initialized = False
+        self._mt5: Any = _MT5_NATIVE
 
     def initialize(self) -> bool:
         """Initialize connection to MT5 terminal."""
+        if self._mt5 is None:
+            logger.warning("MT5 initialization failed: MetaTrader5 package is not installed")
+            return False
         try:
-            import MetaTrader5 as mt5
-
             kwargs: dict[str, Any] = {"timeout": self.timeout, "portable": self.portable}
             if self.path:
                 kwargs["path"] = self.path
 
-            result = mt5.initialize(**kwargs)
+            result = self._mt5.initialize(**kwargs)
             self._initialized = result
             return result
         except Exception as e:
-            print(f"MT5 initialization failed: {e}")
+            logger.warning("MT5 initialization failed: %s", e)
             return False
 
     def login(self, login: int, password: str, server: str) -> bool:
@@ -209,19 +237,15 @@ class WindowsMT5Adapter(MT5AdapterBase):
         On Windows, this actually performs authentication with the MT5 terminal.
         """
         try:
-            import MetaTrader5 as mt5
-
-            return mt5.login(login, password=password, server=server)
+            return self._mt5.login(login, password=password, server=server)
         except Exception as e:
-            print(f"MT5 login failed: {e}")
+            logger.warning("MT5 login failed: %s", e)
             return False
 
     def shutdown(self) -> None:
         """Shutdown MT5 connection."""
         try:
-            import MetaTrader5 as mt5
-
-            mt5.shutdown()
+            self._mt5.shutdown()
             self._initialized = False
         except Exception:
             pass
@@ -229,65 +253,33 @@ class WindowsMT5Adapter(MT5AdapterBase):
     def last_error(self) -> tuple[int, str]:
         """Get last error from MT5."""
         try:
-            import MetaTrader5 as mt5
-
-            return mt5.last_error()
+            return self._mt5.last_error()
         except Exception:
             return (-1, "Failed to get error")
 
     def account_info(self) -> Any:
         """Get account information."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.account_info()
-        except Exception:
-            return None
+        return self._mt5.account_info()
 
     def symbol_info(self, symbol: str) -> Any:
         """Get symbol information."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.symbol_info(symbol)
-        except Exception:
-            return None
+        return self._mt5.symbol_info(symbol)
 
     def symbol_info_tick(self, symbol: str) -> Any:
         """Get current tick for symbol."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.symbol_info_tick(symbol)
-        except Exception:
-            return None
+        return self._mt5.symbol_info_tick(symbol)
 
     def symbol_select(self, symbol: str, enable: bool) -> bool:
         """Enable/disable symbol in Market Watch."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.symbol_select(symbol, enable)
-        except Exception:
-            return False
+        return self._mt5.symbol_select(symbol, enable)
 
     def order_check(self, request: dict) -> Any:
         """Check if order can be executed before sending."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.order_check(request)
-        except Exception:
-            return None
+        return self._mt5.order_check(request)
 
     def order_send(self, request: dict) -> Any:
         """Send trading order."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.order_send(request)
-        except Exception:
-            return None
+        return self._mt5.order_send(request)
 
     def copy_rates_from_pos(
         self,
@@ -297,116 +289,81 @@ class WindowsMT5Adapter(MT5AdapterBase):
         count: int,
     ) -> Any:
         """Get historical rates."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.copy_rates_from_pos(symbol, timeframe, start_pos, count)
-        except Exception:
-            return None
+        return self._mt5.copy_rates_from_pos(symbol, timeframe, start_pos, count)
 
     def ping(self) -> bool:
         """Check if connection is alive by getting terminal info."""
         try:
-            import MetaTrader5 as mt5
-
-            info = mt5.terminal_info()
+            info = self._mt5.terminal_info()
             return info is not None
         except Exception:
             return False
 
     def positions_total(self) -> int:
         """Get total number of open positions."""
-        try:
-            import MetaTrader5 as mt5
-
-            return mt5.positions_total()
-        except Exception:
-            return 0
+        return self._mt5.positions_total()
 
     def positions_get(
         self,
         symbol: str | None = None,
         ticket: int | None = None,
-    ) -> list[Any]:
+    ) -> Sequence[Any]:
         """Get open positions."""
-        try:
-            import MetaTrader5 as mt5
-
-            if ticket is not None:
-                result = mt5.positions_get(ticket=ticket)
-            elif symbol is not None:
-                result = mt5.positions_get(symbol=symbol)
-            else:
-                result = mt5.positions_get()
-            return list(result) if result else []
-        except Exception:
-            return []
+        if ticket is not None:
+            result = self._mt5.positions_get(ticket=ticket)
+        elif symbol is not None:
+            result = self._mt5.positions_get(symbol=symbol)
+        else:
+            result = self._mt5.positions_get()
+        return result or ()
 
     def orders_get(
         self,
         symbol: str | None = None,
         ticket: int | None = None,
-    ) -> list[Any]:
+    ) -> Sequence[Any]:
         """Get pending orders."""
-        try:
-            import MetaTrader5 as mt5
-
-            if ticket is not None:
-                result = mt5.orders_get(ticket=ticket)
-            elif symbol is not None:
-                result = mt5.orders_get(symbol=symbol)
-            else:
-                result = mt5.orders_get()
-            return list(result) if result else []
-        except Exception:
-            return []
+        if ticket is not None:
+            result = self._mt5.orders_get(ticket=ticket)
+        elif symbol is not None:
+            result = self._mt5.orders_get(symbol=symbol)
+        else:
+            result = self._mt5.orders_get()
+        return result or ()
 
     def history_deals_get(
         self,
         date_from: Any = None,
         date_to: Any = None,
         position: int | None = None,
-    ) -> list[Any]:
+    ) -> Sequence[Any]:
         """Get history deals."""
-        try:
-            import MetaTrader5 as mt5
-
-            if position is not None:
-                result = mt5.history_deals_get(position=position)
-            elif date_from is not None and date_to is not None:
-                result = mt5.history_deals_get(date_from, date_to)
-            else:
-                result = mt5.history_deals_get()
-            return list(result) if result else []
-        except Exception:
-            return []
+        if position is not None:
+            result = self._mt5.history_deals_get(position=position)
+        elif date_from is not None and date_to is not None:
+            result = self._mt5.history_deals_get(date_from, date_to)
+        else:
+            result = self._mt5.history_deals_get()
+        return result or ()
 
     def symbols_total(self) -> int:
         """Get total number of available symbols."""
-        try:
-            import MetaTrader5 as mt5
+        return self._mt5.symbols_total()
 
-            return mt5.symbols_total()
-        except Exception:
-            return 0
-
-    def symbols_get(self, group: str | None = None) -> list[Any]:
+    def symbols_get(self, group: str | None = None) -> Sequence[Any]:
         """Get all available symbols."""
-        try:
-            import MetaTrader5 as mt5
-
-            if group is not None:
-                result = mt5.symbols_get(group=group)
-            else:
-                result = mt5.symbols_get()
-            return list(result) if result else []
-        except Exception:
-            return []
+        if group is not None:
+            result = self._mt5.symbols_get(group=group)
+        else:
+            result = self._mt5.symbols_get()
+        return result or ()
 
 
 class MacOSMT5Adapter(MT5AdapterBase):
     """MetaTrader 5 adapter for macOS using siliconmetatrader5 + Docker."""
 
+    __slots__ = ("_client", "host", "keepalive", "port")
+
     def __init__(
         self,
         host: str | None = None,
@@ -420,17 +377,18 @@ class MacOSMT5Adapter(MT5AdapterBase):
 
     def initialize(self) -> bool:
         """Initialize connection to MT5 Docker container."""
+        if _SILICON_MT5 is None:
+            logger.warning("MT5 initialization failed: siliconmetatrader5 package is not installed")
+            return False
         try:
-            from siliconmetatrader5 import MetaTrader5 as SiliconMT5  # type: ignore[import-untyped]
-
-            self._client = SiliconMT5(
+            self._client = _SILICON_MT5.MetaTrader5(
                 host=self.host,
                 port=self.port,
                 keepalive=self.keepalive,
             )
             return self._client.initialize()
         except Exception as e:
-            print(f"MT5 initialization failed: {e}")
+            logger.warning("MT5 initialization failed: %s", e)
             return False
 
     def login(self, login: int, password: str, server: str) -> bool:
@@ -583,6 +541,8 @@ class LinuxMT5Adapter(MT5AdapterBase):
     inside the Docker container, replacing the broken mt5linux package.
     """
 
+    __slots__ = ("_conn", "host", "port")
+
     def __init__(
         self,
         host: str | None = None,
@@ -600,16 +560,17 @@ class LinuxMT5Adapter(MT5AdapterBase):
 
     def initialize(self) -> bool:
         """Initialize connection to MT5 via RPyC classic server in Docker."""
+        if _RPYC is None:
+            logger.warning("MT5 initialization failed: rpyc package is not installed")
+            return False
         try:
-            import rpyc  # type: ignore[import-untyped]
-
-            self._conn = rpyc.classic.connect(self.host, self.port)
+            self._conn = _RPYC.classic.connect(self.host, self.port)
             self._conn._config["sync_request_timeout"] = 300
             self._conn.execute("import MetaTrader5 as mt5")
             self._conn.execute("import datetime")
             return self._eval("mt5.initialize()")
         except Exception as e:
-            print(f"MT5 initialization failed: {e}")
+            logger.warning("MT5 initialization failed: %s", e)
             return False
 
     def login(self, login: int, password: str, server: str) -> bool:
@@ -621,7 +582,7 @@ class LinuxMT5Adapter(MT5AdapterBase):
             account = self._eval("mt5.account_info()")
             return account is not None
         except Exception as e:
-            print(f"MT5 connection verification failed: {e}")
+            logger.warning("MT5 connection verification failed: %s", e)
             return False
 
     def shutdown(self) -> None:
@@ -682,10 +643,8 @@ class LinuxMT5Adapter(MT5AdapterBase):
         """Get historical rates."""
         if not self._conn:
             return None
-        import rpyc.utils.classic  # type: ignore[import-untyped]
-
         code = f'mt5.copy_rates_from_pos("{symbol}",{timeframe},{start_pos},{count})'
-        return rpyc.utils.classic.obtain(self._eval(code))
+        return _RPYC.utils.classic.obtain(self._eval(code))
 
     def ping(self) -> bool:
         """Check if connection is alive."""
@@ -7,22 +7,83 @@ trading signals from Telegram messages into structured TradeSignal objects.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import logging
 import re
+import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from tania_signal_copier.config import config as global_config
 from tania_signal_copier.llm import create_llm_provider
-from tania_signal_copier.models import ActionType, MessageType, OrderType, ParsedAction, TradeSignal
+from tania_signal_copier.models import (
+    ORDER_TYPE_BY_VALUE,
+    PENDING_ORDER_TYPES,
+    ActionType,
+    MessageType,
+    OrderType,
+    ParsedAction,
+    TradeSignal,
+)
 
 if TYPE_CHECKING:
     from tania_signal_copier.config import LLMConfig
     from tania_signal_copier.llm import LLMProvider
 
+logger = logging.getLogger(__name__)
+
 # Path to custom system prompts file (written by the dashboard API)
 _CUSTOM_PROMPTS_PATH = Path(__file__).parent.parent.parent / ".system_prompts.json"
 
+# Telegram markdown markers: bold (**), italic (__), strikethrough (~~), code (`).
+# Single _ and * are left alone, since they can be part of real content.
+_MARKDOWN_RE = re.compile(r"\*\*|__|~~|`")
+
+# Value -> member lookup for LLM-supplied labels, so unknown labels fall back
+# to a default without raising and catching ValueError
+_ACTION_TYPE_BY_VALUE: dict[str, ActionType] = {m.value: m for m in ActionType}
+
+# Cheap pre-filter run before the LLM. Every actionable message the parser
+# handles mentions a price/number, a direction, SL/TP, or a management keyword.
+# Err on the side of matching: a false positive costs one LLM call, a false
+# negative silently drops a close or breakeven instruction.
+_SIGNAL_HINT_RE = re.compile(
+    r"\d|buy|sell|\bsl\b|\btp|clos(?:e|ing)|exit|entry|re-?ent|breakeven|break even"
+    r"|\bbe\b|stop|cancel|half|partial|profit|secure|target|hit|book|limit|order"
+    r"|gold|xau|gbp|eur|usd|jpy|pips?\b|✅",
+    re.IGNORECASE,
+)
+
+# Canonical one-shot signal, e.g. "XAUUSD BUY @ 4340 SL 4330 TP1 4350 TP2 4360".
+# Only whole-message matches are fast-parsed; anything else goes to the LLM.
+_PRICE = r"\d+(?:\.\d+)?"
+_FAST_SIGNAL_RE = re.compile(
+    rf"""
+    (?:(?P<symbol>GOLD|[A-Z]{{6}})\s+)?
+    (?P<side>BUY|SELL)(?:\s+(?P<kind>LIMIT|STOP))?
+    (?:\s+(?P<symbol_after>GOLD|[A-Z]{{6}}))?
+    \s*@\s*(?P<entry>{_PRICE})
+    \s+SL\s*:?\s*(?P<sl>{_PRICE})
+    (?P<tps>(?:\s+TP\d?\s*:?\s*{_PRICE})+)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_FAST_TP_RE = re.compile(rf"TP\d?\s*:?\s*({_PRICE})", re.IGNORECASE)
+
+# Number of LLM responses remembered for repeated (forwarded/re-sent) messages
+_RESPONSE_CACHE_SIZE = 2048
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a markdown code fence (```json ... ```) wrapped around an LLM reply."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text[3:].removeprefix("json")
+    return text.removesuffix("```")
+
 
 class SignalParser:
     """Uses LLM providers to parse trading signals from various formats.
@@ -151,10 +212,40 @@ Return ONLY valid JSON, no explanation outside the JSON."""
 
         # Load custom prompts from file (falls back to class-level defaults)
         custom = self._load_custom_prompts()
-        self._system_prompt = custom.get("system_prompt") or self.SYSTEM_PROMPT
+        self._system_prompt = self._render_static_prompt(
+            custom.get("system_prompt") or self.SYSTEM_PROMPT
+        )
         self._correction_system_prompt = (
             custom.get("correction_system_prompt") or self.CORRECTION_SYSTEM_PROMPT
         )
+        # The fast path hard-codes the default prompt's rules, so a prompt
+        # customised from the dashboard sends every signal to the LLM instead
+        self._fast_parse_enabled = not custom.get("system_prompt")
+
+        # LRU of raw LLM responses keyed by a digest of the cleaned message.
+        # The response text is cached rather than the TradeSignal, so every hit
+        # still builds a fresh signal carrying its own message as the comment.
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
+        # Queries still awaiting the LLM, so concurrent copies of one message
+        # (e.g. the same signal posted to several channels) share one request
+        self._inflight: dict[bytes, asyncio.Task[str]] = {}
+        # Telethon handles each update in its own task, so a burst of messages
+        # would otherwise hit the provider all at once and trip its rate limits
+        self._query_slots = asyncio.Semaphore(llm_config.max_concurrency)
+
+    @staticmethod
+    def _render_static_prompt(template: str) -> str:
+        """Render a field-less prompt template once, at load time.
+
+        Prompts are written as str.format templates ({{ }} for literal braces).
+        The signal prompt has no fields, so it is rendered here instead of the
+        escaped braces being sent to the LLM on every query. A custom prompt
+        that isn't a valid template is used verbatim.
+        """
+        try:
+            return template.format()
+        except (IndexError, KeyError, ValueError):
+            return template
 
     def _strip_markdown(self, text: str) -> str:
         """Strip Telegram markdown formatting from text.
@@ -168,15 +259,7 @@ Return ONLY valid JSON, no explanation outside the JSON."""
         Returns:
             Cleaned text with markdown markers removed
         """
-        # Remove bold markers **text**
-        cleaned = re.sub(r"\*\*", "", text)
-        # Remove italic markers __text__
-        cleaned = re.sub(r"__", "", cleaned)
-        # Remove strikethrough ~~text~~
-        cleaned = re.sub(r"~~", "", cleaned)
-        # Remove inline code `text`
-        cleaned = re.sub(r"`", "", cleaned)
-        return cleaned
+        return _MARKDOWN_RE.sub("", text)
 
     @staticmethod
     def _load_custom_prompts() -> dict[str, str | None]:
@@ -198,7 +281,7 @@ Return ONLY valid JSON, no explanation outside the JSON."""
                 result["correction_system_prompt"] = data["correction_system_prompt"]
             return result
         except (json.JSONDecodeError, OSError) as e:
-            print(f"Warning: Could not load custom prompts from {_CUSTOM_PROMPTS_PATH}: {e}")
+            logger.warning("Could not load custom prompts from %s: %s", _CUSTOM_PROMPTS_PATH, e)
             return {}
 
     async def parse_signal(self, message: str) -> TradeSignal | None:
@@ -211,14 +294,53 @@ Return ONLY valid JSON, no explanation outside the JSON."""
             TradeSignal if successfully parsed, None for non-trading messages
         """
         cleaned_message = self._strip_markdown(message)
+        # Skip the LLM call for chatter that can't contain a trading action
+        if not _SIGNAL_HINT_RE.search(cleaned_message):
+            return None
+
+        if self._fast_parse_enabled:
+            fast_data = self._try_fast_parse(cleaned_message)
+            if fast_data is not None:
+                return self._build_signal(fast_data, message)
+
+        key = hashlib.blake2b(cleaned_message.encode(), digest_size=16).digest()
 
         try:
-            response_text = await self._query_llm(self._system_prompt, cleaned_message)
-            return self._parse_response(response_text, message)
+            response_text = self._response_cache.get(key)
+            if response_text is not None:
+                self._response_cache.move_to_end(key)
+                return self._parse_response(response_text, message)
+
+            response_text = await self._query_signal(key, cleaned_message)
+            signal = self._parse_response(response_text, message)
+            # Cached only once it parsed, so an empty or truncated reply is
+            # retried the next time the message comes in
+            self._response_cache[key] = response_text
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            return signal
         except Exception as e:
-            print(f"Error parsing signal: {e}")
+            logger.error("Error parsing signal: %s", e)
             return None
 
+    async def _query_signal(self, key: bytes, cleaned_message: str) -> str:
+        """Query the LLM for a signal message, joining an identical in-flight query.
+
+        Args:
+            key: Digest of the cleaned message
+            cleaned_message: The message with markdown stripped
+
+        Returns:
+            The raw response text from the LLM
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._query_llm(self._system_prompt, cleaned_message))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the query for the others
+        return await asyncio.shield(task)
+
     async def _query_llm(self, system_prompt: str, user_message: str) -> str:
         """Query the LLM provider and get the response text.
 
@@ -229,31 +351,83 @@ Return ONLY valid JSON, no explanation outside the JSON."""
         Returns:
             The raw response text from the LLM
         """
-        return await self._provider.query(system_prompt, user_message)
+        async with self._query_slots:
+            return await self._provider.query(system_prompt, user_message)
+
+    @staticmethod
+    def _try_fast_parse(cleaned_message: str) -> dict | None:
+        """Parse a canonical one-shot signal without the LLM.
+
+        Args:
+            cleaned_message: The message with markdown stripped
+
+        Returns:
+            The same dict shape the LLM returns, or None if the message is not
+            exactly in the canonical format
+        """
+        match = _FAST_SIGNAL_RE.fullmatch(cleaned_message.strip())
+        if match is None:
+            return None
+
+        symbol = match["symbol"] or match["symbol_after"]
+        if symbol is None:
+            return None
+        if symbol.upper() == "GOLD":
+            symbol = "XAUUSD"
+        elif not symbol.isupper():
+            # A lower-case six-letter word is prose, not a ticker
+            return None
+
+        order_type = match["side"].lower()
+        if match["kind"]:
+            order_type = f"{order_type}_{match['kind'].lower()}"
+
+        return {
+            "symbol": symbol,
+            "actions": [
+                {
+                    "action_type": ActionType.NEW_SIGNAL.value,
+                    "order_type": order_type,
+                    "entry_price": float(match["entry"]),
+                    "stop_loss": float(match["sl"]),
+                    "take_profits": [float(tp) for tp in _FAST_TP_RE.findall(match["tps"])],
+                }
+            ],
+            "confidence": 0.95,
+        }
 
     def _parse_response(self, response_text: str, original_message: str) -> TradeSignal | None:
         """Parse Groq's JSON response into a TradeSignal.
 
+        Args:
+            response_text: The raw response from Groq
+            original_message: The original Telegram message for context
+
+        Returns:
+            TradeSignal if valid, None otherwise
+        """
+        # Clean up potential markdown code blocks
+        cleaned = _strip_code_fence(response_text)
+
+        return self._build_signal(json.loads(cleaned), original_message)
+
+    def _build_signal(self, data: dict, original_message: str) -> TradeSignal | None:
+        """Build a TradeSignal from a parsed response dict.
+
         The new format always returns an actions array. This method:
         1. Parses the actions array
         2. Derives message_type from the primary action (for backward compat)
         3. Populates top-level fields from the primary action
 
         Args:
-            response_text: The raw response from Groq
+            data: The decoded response (from the LLM or the fast path)
             original_message: The original Telegram message for context
 
         Returns:
             TradeSignal if valid, None otherwise
         """
-        # Clean up potential markdown code blocks
-        cleaned = re.sub(r"^```json\s*", "", response_text)
-        cleaned = re.sub(r"\s*```$", "", cleaned)
-
-        data = json.loads(cleaned)
-
         # Get actions array (always present in new format)
-        actions = data.get("actions", [])
+        actions = data.get("actions")
 
         # Handle empty actions (not a trading message)
         if not actions:
@@ -266,11 +440,14 @@ Return ONLY valid JSON, no explanation outside the JSON."""
         primary_action = parsed_actions[0]
         msg_type = self._action_to_message_type(primary_action, len(parsed_actions) > 1)
 
+        # Index the first action of each type in one pass; the top-level fields
+        # below are all taken from the first action of their type
+        first_by_type: dict[ActionType, ParsedAction] = {}
+        for a in parsed_actions:
+            first_by_type.setdefault(a.action_type, a)
+
         # Extract top-level fields from primary new_signal action (if exists)
-        new_signal_action = next(
-            (a for a in parsed_actions if a.action_type == ActionType.NEW_SIGNAL),
-            None
-        )
+        new_signal_action = first_by_type.get(ActionType.NEW_SIGNAL)
 
         # Determine order type and signal completeness
         if new_signal_action:
@@ -289,50 +466,40 @@ Return ONLY valid JSON, no explanation outside the JSON."""
             is_complete = True  # Non-new-signal actions don't need completeness check
 
         # Extract modification fields from any modification action
-        mod_action = next(
-            (a for a in parsed_actions if a.action_type == ActionType.MODIFICATION),
-            None
-        )
+        mod_action = first_by_type.get(ActionType.MODIFICATION)
         new_stop_loss = mod_action.new_stop_loss if mod_action else None
         new_take_profit = mod_action.new_take_profit if mod_action else None
 
         # Extract partial close percentage (default to 50% if not specified)
-        partial_action = next(
-            (a for a in parsed_actions if a.action_type == ActionType.PARTIAL_CLOSE),
-            None
-        )
+        partial_action = first_by_type.get(ActionType.PARTIAL_CLOSE)
         close_percentage = (partial_action.close_percentage or 50) if partial_action else None
 
         # Extract TP hit info
-        tp_action = next(
-            (a for a in parsed_actions if a.action_type == ActionType.TP_HIT),
-            None
-        )
+        tp_action = first_by_type.get(ActionType.TP_HIT)
         tp_hit_number = tp_action.tp_hit_number if tp_action else None
 
         # Check for move_sl_to_entry action
-        move_sl_to_entry = any(
-            a.action_type == ActionType.MOVE_SL_TO_ENTRY for a in parsed_actions
-        )
+        move_sl_to_entry = ActionType.MOVE_SL_TO_ENTRY in first_by_type
 
         # Check for full close action
-        close_position = any(
-            a.action_type == ActionType.FULL_CLOSE for a in parsed_actions
-        )
+        close_position = ActionType.FULL_CLOSE in first_by_type
 
         # Extract re-entry fields
-        re_entry_action = next(
-            (a for a in parsed_actions if a.action_type == ActionType.RE_ENTRY),
-            None
-        )
+        re_entry_action = first_by_type.get(ActionType.RE_ENTRY)
         re_entry_price = re_entry_action.re_entry_price if re_entry_action else None
         re_entry_price_max = re_entry_action.re_entry_price_max if re_entry_action else None
         # For re-entry, use its stop_loss
         if re_entry_action and re_entry_action.stop_loss:
             stop_loss = re_entry_action.stop_loss
 
+        # Parsed symbols repeat across messages; interning makes every later
+        # lookup keyed on them (allow-list, broker map) match by identity
+        symbol = data.get("symbol", "")
+        if isinstance(symbol, str):
+            symbol = sys.intern(symbol)
+
         return TradeSignal(
-            symbol=data.get("symbol", ""),
+            symbol=symbol,
             order_type=order_type,
             entry_price=entry_price,
             stop_loss=stop_loss,
@@ -355,20 +522,12 @@ Return ONLY valid JSON, no explanation outside the JSON."""
 
     def _dict_to_parsed_action(self, action_dict: dict) -> ParsedAction:
         """Convert a raw action dict to a ParsedAction object."""
-        action_type_str = action_dict.get("action_type", "")
-        try:
-            action_type = ActionType(action_type_str)
-        except ValueError:
-            # Default to modification for unknown types
-            action_type = ActionType.MODIFICATION
-
-        order_type = None
-        order_type_str = action_dict.get("order_type")
-        if order_type_str:
-            try:
-                order_type = OrderType(order_type_str)
-            except ValueError:
-                pass
+        # Default to modification for unknown types
+        action_type = _ACTION_TYPE_BY_VALUE.get(
+            action_dict.get("action_type", ""), ActionType.MODIFICATION
+        )
+        # Unknown or missing order types become None
+        order_type = ORDER_TYPE_BY_VALUE.get(action_dict.get("order_type"))
 
         return ParsedAction(
             action_type=action_type,
@@ -422,7 +581,7 @@ Return ONLY valid JSON, no explanation outside the JSON."""
         has_tp = len(action.take_profits) > 0
         has_entry = action.entry_price is not None
 
-        if action.order_type and action.order_type.value in ["buy_limit", "sell_limit", "buy_stop", "sell_stop"]:
+        if action.order_type in PENDING_ORDER_TYPES:
             return has_sl and has_tp and has_entry
         else:
             # Market orders only need SL and TP
@@ -448,11 +607,11 @@ Return ONLY valid JSON, no explanation outside the JSON."""
             return True
 
         has_sl = data.get("stop_loss") is not None
-        has_tp = len(data.get("take_profits", [])) > 0
+        has_tp = bool(data.get("take_profits"))
         has_entry = data.get("entry_price") is not None
 
-        order_type = data.get("order_type", "")
-        is_pending_order = order_type in ["buy_limit", "sell_limit", "buy_stop", "sell_stop"]
+        order_type = ORDER_TYPE_BY_VALUE.get(data.get("order_type", ""))
+        is_pending_order = order_type in PENDING_ORDER_TYPES
 
         if is_pending_order:
             return has_sl and has_tp and has_entry
@@ -495,7 +654,7 @@ Return ONLY valid JSON, no explanation outside the JSON."""
             response_text = await self._query_llm(system_prompt, correction_text)
             return self._parse_correction_response(response_text)
         except Exception as e:
-            print(f"Error parsing correction: {e}")
+            logger.error("Error parsing correction: %s", e)
             return None
 
     def _parse_correction_response(self, response_text: str) -> dict | None:
@@ -508,8 +667,7 @@ Return ONLY valid JSON, no explanation outside the JSON."""
             Dict with corrected values, or None if invalid
         """
         # Clean up potential markdown code blocks
-        cleaned = re.sub(r"^```json\s*", "", response_text)
-        cleaned = re.sub(r"\s*```$", "", cleaned)
+        cleaned = _strip_code_fence(response_text)
 
         try:
             data = json.loads(cleaned)
@@ -521,5 +679,5 @@ Return ONLY valid JSON, no explanation outside the JSON."""
                 "interpretation": data.get("interpretation", ""),
             }
         except json.JSONDecodeError as e:
-            print(f"Error parsing correction JSON: {e}")
+            logger.error("Error parsing correction JSON: %s", e)
             return None
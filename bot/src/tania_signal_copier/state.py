@@ -9,6 +9,8 @@ Version 3 adds original signal data for edit detection.
 """
 
 import json
+import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +21,8 @@ from tania_signal_copier.models import (
     TradeRole,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class BotState:
     """Persistent state manager for the bot.
@@ -50,6 +54,8 @@ class BotState:
         self.positions: dict[int, DualPosition] = {}
         self.ticket_to_msg_id: dict[int, int] = {}
         self.last_signal_msg_id: int | None = None
+        # Content of the last write (minus timestamp), used to skip no-op rewrites
+        self._last_written: str | None = None
 
     def add_position(self, position: TrackedPosition, role: TradeRole) -> None:
         """Add a tracked position to state with specified role.
@@ -65,14 +71,8 @@ class BotState:
         if msg_id not in self.positions:
             self.positions[msg_id] = DualPosition(telegram_msg_id=msg_id)
 
-        dual = self.positions[msg_id]
-
-        # Assign to appropriate slot
-        if role == TradeRole.RUNNER:
-            dual.runner = position
-        else:
-            # SCALP or SINGLE both go to scalp slot
-            dual.scalp = position
+        # Assign to appropriate slot (SCALP or SINGLE both go to scalp slot)
+        self.positions[msg_id].set_position(position, role)
 
         # Update reverse lookup
         self.ticket_to_msg_id[position.mt5_ticket] = msg_id
@@ -161,20 +161,19 @@ class BotState:
         Returns:
             DualPosition if found, None otherwise
         """
-        pending_duals = []
+        # Single pass keeping the most recent match; ties keep the earlier dual
+        best: DualPosition | None = None
+        best_opened_at: datetime | None = None
 
         for dual in self.positions.values():
             # Check if any position in the dual matches
             for pos in dual.all_positions:
                 if pos.symbol == symbol and pos.status == PositionStatus.PENDING_COMPLETION:
-                    pending_duals.append((dual, pos.opened_at))
+                    if best_opened_at is None or pos.opened_at > best_opened_at:
+                        best, best_opened_at = dual, pos.opened_at
                     break
 
-        if not pending_duals:
-            return None
-
-        # Return the most recent pending dual position
-        return max(pending_duals, key=lambda x: x[1])[0]
+        return best
 
     def remove_position(self, msg_id: int) -> None:
         """Remove a dual position from tracking.
@@ -211,47 +210,72 @@ class BotState:
         if len(self.positions) <= self.MAX_RECORDS:
             return
 
-        # Get the earliest opened_at from each DualPosition
-        def get_earliest_opened(dual: DualPosition) -> datetime:
-            positions = dual.all_positions
-            if not positions:
-                return datetime.min
-            return min(p.opened_at for p in positions)
-
         sorted_duals = sorted(
             self.positions.items(),
-            key=lambda x: get_earliest_opened(x[1]),
+            key=lambda x: x[1].earliest_opened_at or datetime.min,
             reverse=True,
-        )[: self.MAX_RECORDS]
+        )
 
-        self.positions = dict(sorted_duals)
-
-        # Rebuild ticket lookup
-        self.ticket_to_msg_id = {}
-        for msg_id, dual in self.positions.items():
+        # Drop only the evicted duals' tickets instead of rebuilding the lookup,
+        # leaving any ticket that has since been re-tracked under another message
+        for msg_id, dual in sorted_duals[self.MAX_RECORDS :]:
             for pos in dual.all_positions:
-                self.ticket_to_msg_id[pos.mt5_ticket] = msg_id
+                if self.ticket_to_msg_id.get(pos.mt5_ticket) == msg_id:
+                    del self.ticket_to_msg_id[pos.mt5_ticket]
+
+        self.positions = dict(sorted_duals[: self.MAX_RECORDS])
 
     def save(self) -> None:
         """Save state to JSON file (version 2 format) with automatic cleanup."""
+        self.write(self.snapshot())
+
+    def snapshot(self) -> dict:
+        """Build the serializable state dict, pruning old records first.
+
+        Split from write() so the caller can take the snapshot on the event loop
+        thread and hand the file I/O off to a worker thread.
+
+        Returns:
+            The state data in the current file format (integer keys are
+            encoded as strings when written)
+        """
         self._cleanup_old_records()
 
-        data = {
+        return {
             "version": self.CURRENT_VERSION,
             "last_updated": datetime.now().isoformat(),
             "last_signal_msg_id": self.last_signal_msg_id,
-            "positions": {
-                str(msg_id): dual.to_dict() for msg_id, dual in self.positions.items()
-            },
-            "ticket_to_msg_id": {
-                str(ticket): msg_id
-                for ticket, msg_id in self.ticket_to_msg_id.items()
-            },
+            # Int keys are left for json.dumps, which writes them as strings
+            # itself; the lookup table is a plain C-level dict copy
+            "positions": {msg_id: dual.to_dict() for msg_id, dual in self.positions.items()},
+            "ticket_to_msg_id": dict(self.ticket_to_msg_id),
         }
 
+    def write(self, data: dict) -> None:
+        """Write a state snapshot to the JSON file.
+
+        Skips the rewrite when nothing but the timestamp changed since the last
+        write and the file is still on disk. The file is replaced atomically.
+
+        Args:
+            data: State data as returned by snapshot()
+        """
+        # Compare everything but the timestamp, which changes on every snapshot
+        body = {key: value for key, value in data.items() if key != "last_updated"}
+        content = json.dumps(body)
+        if content == self._last_written and self.state_file.exists():
+            return
+
+        # Write a sibling temp file and swap it in, so a crash mid-write never
+        # truncates the previous state and readers never see a partial file
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.state_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        tmp_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+        # One-shot dumps() runs on the C encoder; dump() with indent= falls back
+        # to the pure-Python encoder and was the bulk of the save cost
+        with tmp_file.open("w", encoding="utf-8") as f:
+            f.write(json.dumps(data))
+        os.replace(tmp_file, self.state_file)
+        self._last_written = content
 
     def load(self) -> None:
         """Load state from JSON file.
@@ -264,8 +288,9 @@ class BotState:
             return
 
         try:
-            with self.state_file.open(encoding="utf-8") as f:
-                data = json.load(f)
+            # Read the whole file as bytes and decode in one C-level pass;
+            # json.load(f) would go through a text-mode file wrapper first
+            data = json.loads(self.state_file.read_bytes())
 
             version = data.get("version", 1)
             self.last_signal_msg_id = data.get("last_signal_msg_id")
@@ -277,7 +302,7 @@ class BotState:
                 self._load_v2(data)
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"Warning: Error loading state file: {e}")
+            logger.warning("Warning: Error loading state file: %s", e)
             # Start with empty state on error
             self.positions = {}
             self.ticket_to_msg_id = {}
@@ -289,7 +314,7 @@ class BotState:
         V1 stored single TrackedPosition per msg_id.
         V2 stores DualPosition containing scalp/runner positions.
         """
-        print("Migrating state file from v1 to v2...")
+        logger.info("Migrating state file from v1 to v2...")
 
         for msg_id_str, pos_data in data.get("positions", {}).items():
             msg_id = int(msg_id_str)
@@ -301,7 +326,7 @@ class BotState:
             self.positions[msg_id] = dual
             self.ticket_to_msg_id[position.mt5_ticket] = msg_id
 
-        print(f"Migrated {len(self.positions)} positions to v2 format.")
+        logger.info("Migrated %s positions to v2 format.", len(self.positions))
 
     def _load_v2(self, data: dict) -> None:
         """Load version 2 state format."""
@@ -1,8 +1,12 @@
 """Tests for the signal bot."""
 
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from tania_signal_copier.bot import OrderType, TradeSignal
+from tania_signal_copier.parser import _SIGNAL_HINT_RE, SignalParser, _strip_code_fence
 
 
 class TestTradeSignal:
@@ -51,3 +55,175 @@ class TestSignalParser:
         """Test that invalid messages return None."""
         # Parser would return None for non-signal messages
         pass
+
+    @pytest.mark.asyncio
+    async def test_repeated_message_reuses_llm_response(self) -> None:
+        """A re-sent message is parsed from the cached response, not a new query."""
+        parser = SignalParser()
+        parser._query_llm = AsyncMock(
+            return_value='{"symbol": "XAUUSD", "actions": [{"action_type": "new_signal", '
+            '"order_type": "buy", "stop_loss": 2800.0, "take_profits": [2850.0]}], '
+            '"confidence": 0.9}'
+        )
+
+        first = await parser.parse_signal("**XAUUSD BUY** SL 2800 TP 2850")
+        second = await parser.parse_signal("XAUUSD BUY SL 2800 TP 2850")
+
+        parser._query_llm.assert_awaited_once()
+        assert first is not None and second is not None
+        assert first is not second
+        assert second.symbol == "XAUUSD"
+        assert second.comment == "XAUUSD BUY SL 2800 TP 2850"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_query(self) -> None:
+        """Copies of a message arriving together wait on a single LLM query."""
+        parser = SignalParser()
+        parser._query_llm = AsyncMock(
+            return_value='{"symbol": "XAUUSD", "actions": [{"action_type": "new_signal", '
+            '"order_type": "buy", "stop_loss": 2800.0, "take_profits": [2850.0]}], '
+            '"confidence": 0.9}'
+        )
+
+        results = await asyncio.gather(
+            parser.parse_signal("XAUUSD BUY NOW"),
+            parser.parse_signal("**XAUUSD BUY NOW**"),
+        )
+
+        parser._query_llm.assert_awaited_once()
+        assert results[0] is not None and results[1] is not None
+        assert results[0] is not results[1]
+        assert not parser._inflight
+
+    @pytest.mark.asyncio
+    async def test_chatter_skips_llm(self) -> None:
+        """Messages with no trading hints never reach the LLM."""
+        parser = SignalParser()
+        parser._query_llm = AsyncMock()
+
+        assert await parser.parse_signal("Good morning everyone! 🙌") is None
+        parser._query_llm.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_canonical_signal_skips_llm(self) -> None:
+        """A signal in the canonical one-line format is parsed without the LLM."""
+        parser = SignalParser()
+        parser._query_llm = AsyncMock()
+
+        signal = await parser.parse_signal("XAUUSD BUY @ 4340 SL 4330 TP1 4350 TP2 4360")
+
+        parser._query_llm.assert_not_awaited()
+        assert signal is not None
+        assert signal.symbol == "XAUUSD"
+        assert signal.order_type == OrderType.BUY
+        assert signal.entry_price == 4340.0
+        assert signal.stop_loss == 4330.0
+        assert signal.take_profits == [4350.0, 4360.0]
+        assert signal.is_complete is True
+
+    @pytest.mark.asyncio
+    async def test_custom_prompt_disables_fast_path(self) -> None:
+        """A dashboard-customised prompt sees canonical signals too."""
+        with patch.object(
+            SignalParser, "_load_custom_prompts", return_value={"system_prompt": "Custom rules"}
+        ):
+            parser = SignalParser()
+        parser._query_llm = AsyncMock(
+            return_value='{"symbol": "XAUUSD", "actions": [{"action_type": "new_signal", '
+            '"order_type": "buy", "entry_price": 4340.0, "stop_loss": 4330.0, '
+            '"take_profits": [4350.0, 4360.0]}], "confidence": 0.9}'
+        )
+
+        signal = await parser.parse_signal("XAUUSD BUY @ 4340 SL 4330 TP1 4350 TP2 4360")
+
+        assert signal is not None
+
+        parser._query_llm.assert_awaited_once_with(
+            "Custom rules", "XAUUSD BUY @ 4340 SL 4330 TP1 4350 TP2 4360"
+        )
+
+    def test_fast_parse_rejects_extra_instructions(self) -> None:
+        """Messages with anything beyond the canonical format are left to the LLM."""
+        assert SignalParser._try_fast_parse("BUY GOLD @ 4340 SL 4330 TP 4350 close half") is None
+        assert SignalParser._try_fast_parse("please BUY @ 4340 SL 4330 TP 4350") is None
+
+    def test_strip_markdown_keeps_single_markers(self) -> None:
+        """Paired markdown markers are removed; lone '*' and '_' are kept."""
+        parser = SignalParser()
+
+        assert parser._strip_markdown("**BUY** __GOLD__ ~~4340~~ `SL`") == "BUY GOLD 4340 SL"
+        assert parser._strip_markdown("TP *4350* MY_ACCOUNT") == "TP *4350* MY_ACCOUNT"
+
+    def test_strip_code_fence(self) -> None:
+        """LLM replies are unwrapped from json/bare code fences, or left as is."""
+        assert _strip_code_fence('```json\n{"a": 1}\n```').strip() == '{"a": 1}'
+        assert _strip_code_fence('```\n{"a": 1}```  \n').strip() == '{"a": 1}'
+        assert _strip_code_fence('  {"a": 1}  ') == '{"a": 1}'
+
+    def test_compound_actions_fill_top_level_fields(self) -> None:
+        """Each top-level field comes from the first action of its type."""
+        parser = SignalParser()
+        data = {
+            "symbol": "XAUUSD",
+            "actions": [
+                {"action_type": "partial_close", "close_percentage": 70},
+                {"action_type": "move_sl_to_entry"},
+                {"action_type": "modification", "new_stop_loss": 4330.0},
+                {"action_type": "modification", "new_stop_loss": 4320.0},
+            ],
+            "confidence": 0.9,
+        }
+
+        signal = parser._build_signal(data, "CLOSE 70%, SL TO ENTRY, SL 4330")
+
+        assert signal is not None
+        assert signal.close_percentage == 70
+        assert signal.move_sl_to_entry is True
+        assert signal.close_position is False
+        assert signal.new_stop_loss == 4330.0
+        assert signal.tp_hit_number is None
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Closing all trades now",
+            "Move stop to BE",
+            "Cancel the pending order",
+            "Re-enter now",
+            "Re-entry here",
+            "SL to entry",
+            "Secure at breakeven",
+            "Close half",
+            "Close partial",
+            "Exit trade",
+            "Can close now",
+            "Should close",
+            "Fully close now",
+            "Book some profits",
+            "First target reached",
+            "TP1 hit",
+            "TP2 ✅",
+        ],
+    )
+    def test_signal_hint_prefilter_keeps_trading_instructions(self, message: str) -> None:
+        """Management instructions from the prompt examples pass the pre-filter."""
+        assert _SIGNAL_HINT_RE.search(message)
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached(self) -> None:
+        """A truncated LLM reply is retried on the next copy of the message."""
+        parser = SignalParser()
+        parser._query_llm = AsyncMock(
+            side_effect=[
+                '{"symbol": "XAUUSD", "actions": [',
+                '{"symbol": "XAUUSD", "actions": [{"action_type": "full_close"}], '
+                '"confidence": 0.9}',
+            ]
+        )
+
+        assert await parser.parse_signal("Close gold now") is None
+        signal = await parser.parse_signal("Close gold now")
+
+        assert parser._query_llm.await_count == 2
+        assert signal is not None
+        assert signal.close_position is True
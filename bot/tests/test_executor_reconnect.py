@@ -0,0 +1,114 @@
+"""Unit tests for MT5Executor behaviour when MT5 calls fail."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tania_signal_copier.bot import TelegramMT5Bot
+from tania_signal_copier.executor import MT5Executor
+from tania_signal_copier.models import (
+    DualPosition,
+    ModifyRequest,
+    OrderType,
+    PositionStatus,
+    TrackedPosition,
+    TradeRole,
+    TradeSignal,
+)
+
+
+def _build_disconnected_executor() -> MT5Executor:
+    """Create an executor whose terminal query fails and cannot reconnect."""
+    executor = MT5Executor(login=123, password="test", server="test")
+    executor._mt5 = MagicMock()
+    executor._mt5.positions_get.side_effect = ConnectionError("terminal gone")
+    executor._ensure_connected = MagicMock(return_value=True)
+    executor._reconnect = MagicMock(return_value=False)
+    return executor
+
+
+def test_positions_batch_confirms_nothing_when_reconnect_fails() -> None:
+    """A failed reconnect returns an empty snapshot, not every ticket as closed."""
+    executor = _build_disconnected_executor()
+
+    snapshot = executor.get_positions_batch([111, 222])
+
+    assert snapshot == {}
+    assert snapshot.get(111) is None
+    executor._reconnect.assert_called_once()
+
+
+def _position(role: TradeRole, ticket: int) -> TrackedPosition:
+    return TrackedPosition(
+        telegram_msg_id=100,
+        mt5_ticket=ticket,
+        symbol="XAUUSD",
+        order_type=OrderType.BUY,
+        entry_price=4340.0,
+        stop_loss=4330.0,
+        take_profits=[4350.0, 4360.0],
+        lot_size=0.01,
+        opened_at=datetime(2026, 1, 2, 3, 4, 5),
+        is_complete=True,
+        status=PositionStatus.OPEN,
+        role=role,
+    )
+
+
+@pytest.mark.asyncio
+async def test_re_entry_during_outage_still_sends_closes() -> None:
+    """Legs an unconfirmed snapshot can't see are closed for real, not marked closed."""
+    dual = DualPosition(telegram_msg_id=100)
+    dual.set_position(_position(TradeRole.SCALP, 111), TradeRole.SCALP)
+    dual.set_position(_position(TradeRole.RUNNER, 222), TradeRole.RUNNER)
+    with patch.object(TelegramMT5Bot, "__init__", lambda x: None):
+        bot = TelegramMT5Bot.__new__(TelegramMT5Bot)
+    bot._mt5_pool = None  # MT5 calls run on the loop's default executor
+    bot._state_flusher_task = None
+    bot.state = MagicMock()
+    bot.state.get_dual_position_by_msg_id.return_value = dual
+    bot.executor = MagicMock()
+    bot.executor.get_positions_batch.return_value = {}
+    bot.executor.close_positions_batch.return_value = [
+        {"success": False, "error": "Connection lost and reconnect failed"}
+    ] * 2
+    signal = TradeSignal(
+        symbol="XAUUSD", order_type=OrderType.BUY, entry_price=None, stop_loss=None, take_profits=[]
+    )
+
+    await bot._handle_re_entry(101, 100, signal)
+
+    bot.executor.close_positions_batch.assert_called_once_with([111, 222])
+    assert [pos.status for pos in dual.all_positions] == [PositionStatus.OPEN] * 2
+
+
+def test_close_batch_keeps_results_when_one_close_raises() -> None:
+    """A close that raises after reconnecting doesn't drop the other results."""
+    executor = MT5Executor(login=123, password="test", server="test")
+    executor.close_position = MagicMock(
+        side_effect=[{"success": True}, ConnectionError("terminal gone"), {"success": True}]
+    )
+
+    results = executor.close_positions_batch([111, 222, 333])
+
+    assert results == [
+        {"success": True},
+        {"success": False, "error": "terminal gone"},
+        {"success": True},
+    ]
+
+
+def test_modify_batch_keeps_results_when_one_modify_raises() -> None:
+    """A modification that raises after reconnecting doesn't drop the other results."""
+    executor = MT5Executor(login=123, password="test", server="test")
+    executor.modify_position = MagicMock(
+        side_effect=[ConnectionError("terminal gone"), {"success": True}]
+    )
+
+    results = executor.modify_positions_batch(
+        [ModifyRequest(ticket=111, sl=4330.0), ModifyRequest(ticket=222, tp=4360.0)]
+    )
+
+    assert results == [{"success": False, "error": "terminal gone"}, {"success": True}]
+    executor.modify_position.assert_called_with(222, sl=None, tp=4360.0)
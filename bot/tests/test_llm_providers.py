@@ -0,0 +1,72 @@
+"""Tests for the LLM providers against a mocked HTTP transport."""
+
+import json
+
+import httpx
+import pytest
+from cerebras.cloud.sdk import AsyncCerebras
+from groq import AsyncGroq
+
+from tania_signal_copier.llm.cerebras_provider import CerebrasProvider
+from tania_signal_copier.llm.groq_provider import GroqProvider
+
+_REPLY = '{"symbol": "XAUUSD", "actions": [], "confidence": 1.0}'
+
+
+def _mock_transport(requests: list[dict]) -> httpx.MockTransport:
+    """Transport that records each request body and answers with a chat completion."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test-model",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": f"  {_REPLY}\n"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_groq_provider_requests_json_without_streaming(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Groq queries ask for a JSON object and read the single completion."""
+    monkeypatch.setenv("GROQ_API_KEY", "test")
+    requests: list[dict] = []
+    provider = GroqProvider(model="test-model")
+    provider.client = AsyncGroq(
+        api_key="test", http_client=httpx.AsyncClient(transport=_mock_transport(requests))
+    )
+
+    assert await provider.query("system", "XAUUSD BUY") == _REPLY
+    assert requests[0]["response_format"] == {"type": "json_object"}
+    assert not requests[0].get("stream")
+
+
+@pytest.mark.asyncio
+async def test_cerebras_provider_requests_json_without_streaming(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cerebras queries ask for a JSON object and read the single completion."""
+    monkeypatch.setenv("CEREBRAS_API_KEY", "test")
+    requests: list[dict] = []
+    provider = CerebrasProvider(model="test-model")
+    provider.client = AsyncCerebras(
+        api_key="test", http_client=httpx.AsyncClient(transport=_mock_transport(requests))
+    )
+
+    assert await provider.query("system", "XAUUSD BUY") == _REPLY
+    assert requests[0]["response_format"] == {"type": "json_object"}
+    assert not requests[0].get("stream")
@@ -0,0 +1,188 @@
+"""Tests for state persistence: atomic writes and the debounced flusher."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tania_signal_copier.bot import TelegramMT5Bot
+from tania_signal_copier.models import OrderType, PositionStatus, TrackedPosition, TradeRole
+from tania_signal_copier.state import BotState
+
+
+def _position(msg_id: int = 100, ticket: int = 5001) -> TrackedPosition:
+    return TrackedPosition(
+        telegram_msg_id=msg_id,
+        mt5_ticket=ticket,
+        symbol="XAUUSD",
+        order_type=OrderType.BUY,
+        entry_price=4340.0,
+        stop_loss=4330.0,
+        take_profits=[4350.0, 4360.0],
+        lot_size=0.01,
+        opened_at=datetime(2026, 1, 2, 3, 4, 5),
+        is_complete=True,
+        status=PositionStatus.OPEN,
+    )
+
+
+def _bot_with_flusher(state: MagicMock) -> TelegramMT5Bot:
+    """Create a bot with only the attributes the flusher and stop() use."""
+    with patch.object(TelegramMT5Bot, "__init__", lambda x: None):
+        bot = TelegramMT5Bot.__new__(TelegramMT5Bot)
+    bot.state = state
+    bot._state_dirty = asyncio.Event()
+    bot._state_flusher_task = None
+    bot._state_pool = ThreadPoolExecutor(max_workers=1)
+    bot._shutdown_event = asyncio.Event()
+    bot._pending_timeouts = {}
+    bot._tp_verification_timeouts = {}
+    bot._telegram = MagicMock()
+    bot._telegram.is_connected.return_value = False
+    bot._mt5_pool = ThreadPoolExecutor(max_workers=1)
+    bot.executor = MagicMock()
+    return bot
+
+
+class TestAtomicWrite:
+    """BotState.write replaces the state file atomically."""
+
+    def test_save_round_trips_without_leaving_temp_file(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "bot_state.json"
+        state = BotState(state_file)
+        state.add_position(_position(), TradeRole.SINGLE)
+
+        state.save()
+
+        assert not (tmp_path / "bot_state.json.tmp").exists()
+        loaded = BotState(state_file)
+        loaded.load()
+        pos = loaded.get_position_by_msg_id(100)
+        assert pos is not None
+        assert pos.mt5_ticket == 5001
+        assert pos.take_profits == [4350.0, 4360.0]
+        assert loaded.ticket_to_msg_id == {5001: 100}
+
+    def test_failed_replace_keeps_previous_file(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "bot_state.json"
+        state = BotState(state_file)
+        state.add_position(_position(), TradeRole.SINGLE)
+        state.save()
+        before = state_file.read_text(encoding="utf-8")
+
+        state.add_position(_position(msg_id=101, ticket=5002), TradeRole.SINGLE)
+        with (
+            patch("tania_signal_copier.state.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            state.save()
+
+        assert state_file.read_text(encoding="utf-8") == before
+        assert "5002" not in json.loads(before)["ticket_to_msg_id"]
+
+    def test_written_file_is_valid_json_with_timestamp(self, tmp_path: Path) -> None:
+        state_file = tmp_path / "bot_state.json"
+        state = BotState(state_file)
+
+        state.write({"last_updated": "2026-01-02T03:04:05"})
+        assert json.loads(state_file.read_text(encoding="utf-8")) == {
+            "last_updated": "2026-01-02T03:04:05"
+        }
+
+        state.save()
+        data = json.loads(state_file.read_text(encoding="utf-8"))
+        assert data["version"] == BotState.CURRENT_VERSION
+        assert "last_updated" in data
+
+    def test_tp_hits_stay_readable_as_v3_list(self, tmp_path: Path) -> None:
+        """TP hits are stored as the v3 list next to the mask, and both load back."""
+        state_file = tmp_path / "bot_state.json"
+        state = BotState(state_file)
+        pos = _position()
+        pos.mark_tp_hit(1)
+        pos.mark_tp_hit(2)
+        state.add_position(pos, TradeRole.SINGLE)
+        state.save()
+
+        data = json.loads(state_file.read_text(encoding="utf-8"))
+        stored = data["positions"]["100"]["scalp"]
+        assert data["version"] == BotState.CURRENT_VERSION
+        assert stored["tps_hit"] == [1, 2]
+
+        # A file written by an older build has only the list
+        del stored["tps_hit_mask"]
+        state_file.write_text(json.dumps(data), encoding="utf-8")
+        loaded = BotState(state_file)
+        loaded.load()
+        reloaded = loaded.get_position_by_msg_id(100)
+        assert reloaded is not None
+        assert reloaded.tps_hit == [1, 2]
+
+
+class TestCleanup:
+    """Evicting old records keeps the ticket index consistent."""
+
+    def test_evicting_a_message_keeps_a_reused_ticket_mapping(self, tmp_path: Path) -> None:
+        state = BotState(tmp_path / "bot_state.json")
+        for msg_id in range(1, BotState.MAX_RECORDS + 1):
+            pos = _position(msg_id=msg_id, ticket=5000 + msg_id)
+            pos.opened_at = datetime(2026, 1, msg_id)
+            state.add_position(pos, TradeRole.SINGLE)
+        # The oldest message's ticket is tracked again under a newer message
+        reused = _position(msg_id=99, ticket=5001)
+        reused.opened_at = datetime(2026, 2, 1)
+        state.add_position(reused, TradeRole.SINGLE)
+
+        state._cleanup_old_records()
+
+        assert 1 not in state.positions
+        assert state.ticket_to_msg_id[5001] == 99
+        assert state.get_position_by_ticket(5001) == (reused, TradeRole.SINGLE)
+
+
+class TestDebouncedFlusher:
+    """The flusher coalesces bursts and stop() never races an in-flight write."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_saves_is_written_once(self) -> None:
+        state = MagicMock()
+        state.snapshot.return_value = {"version": 3}
+        bot = _bot_with_flusher(state)
+        bot._state_flusher_task = asyncio.create_task(bot._state_flusher())
+
+        for _ in range(5):
+            bot._save_state()
+        await asyncio.sleep(bot._STATE_FLUSH_DELAY * 3)
+
+        state.write.assert_called_once_with({"version": 3})
+        bot._state_flusher_task.cancel()
+        bot._state_pool.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_write_before_final_save(self) -> None:
+        events: list[str] = []
+        write_started = threading.Event()
+
+        def slow_write(_data: dict) -> None:
+            write_started.set()
+            time.sleep(0.2)
+            events.append("write")
+
+        state = MagicMock()
+        state.snapshot.return_value = {"version": 3}
+        state.write.side_effect = slow_write
+        state.save.side_effect = lambda: events.append("save")
+        bot = _bot_with_flusher(state)
+        bot._state_flusher_task = asyncio.create_task(bot._state_flusher())
+
+        bot._save_state()
+        await asyncio.to_thread(write_started.wait, 1)
+        bot.stop()
+
+        assert events == ["write", "save"]
@@ -420,6 +420,8 @@ class TestEditRaceCondition:
             bot._pending_edits = {12345: "XAUUSD SELL\nSL: 2900\nTP: 2800"}  # Pending edit
             bot._pending_timeouts = {}
             bot.trade_log = []
+            bot._state_flusher_task = None
+            bot._mt5_pool = None  # MT5 calls run on the loop's default executor
 
             # Mock state
             mock_dual = MagicMock(spec=DualPosition)